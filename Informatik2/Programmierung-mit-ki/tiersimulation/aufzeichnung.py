@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+"""
+Aufzeichnung und Wiedergabe von Simulationsläufen (tiersimulationV3.py).
+
+Aufzeichnung hängt sich als Beobachter an eine Welt und schreibt nach jedem Tick einen
+kompakten Datensatz in ein Protokoll, an das nur angehängt wird (im Speicher oder in eine Datei):
+
+    - Änderungen ("Delta"): Tiere mit neuer Position/Energie, erlegte (verschwundene) Tiere,
+      neue Tiere, gefressene Pflanzen und nachgewachsene Pflanzen,
+    - eine Prüfsumme des Zufallsgenerators nach dem Tick (erkennt, ob eine Neuberechnung
+      denselben Weg nimmt),
+    - alle "keyframe_alle" Ticks zusätzlich ein vollständiger Schnappschuss (Welt.als_bytes).
+
+Neue Tiere stehen im Protokoll mit der Nummer ihrer Art. Die Tabelle Nummer -> Artname steht im
+Dateikopf, damit das Protokoll auch dann lesbar bleibt, wenn sich ARTEN später ändert.
+
+Wiedergabe liest so ein Protokoll und baut den Stand zu einem beliebigen Tick T auf:
+Schnappschuss vor T laden und die Änderungen bis T anwenden – ohne das Verhalten der Tiere
+erneut zu berechnen. Vorwärts geht das schrittweise an derselben Welt (die Anzeige bekommt
+die Änderungen über ihr Journal mit), rückwärts über den nächstliegenden Schnappschuss.
+
+Eine so aufgebaute Welt ist nur zum Ansehen gedacht: Ihr Zufallsgenerator steht noch auf dem
+Schnappschuss. Zum Weiterrechnen liefert welt_bei(T, neu_rechnen=True) eine echte Welt, bei
+der die Ticks ab dem Schnappschuss wirklich ausgeführt und gegen die Prüfsummen geprüft werden.
+
+Beispiel:
+    aufz = Aufzeichnung(welt, keyframe_alle=100)
+    for _ in range(1000):
+        welt.tick()
+    aufz.beenden()
+    wg = Wiedergabe(aufz.daten())      # oder Wiedergabe(aufz): liest im Puffer, ohne ihn zu kopieren
+    alt = wg.welt_bei(437)
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from array import array
+
+from tiersimulationV3 import ARTEN, Welt, _Leser, _roh
+
+_MAGIE = b"TSLG"
+_VERSION = 2
+# 2: Artentabelle im Dateikopf (Version 1 hatte keine und setzte die Reihenfolge von ARTEN voraus).
+_DATEIKOPF = struct.Struct("<4sH")
+_ARTEN_LAENGE = struct.Struct("<H")
+# Ab Version 2 folgt auf den Dateikopf die Artentabelle: Länge in Bytes, dann die Namen ("\0"-getrennt).
+_SATZ = struct.Struct("<cQQ")
+# Jeder Datensatz: Art (b"K" = Schnappschuss, b"D" = Änderungen), Tick, Länge der Nutzdaten.
+_DELTA = struct.Struct("<IQQQQQ")
+# Änderungen: Prüfsumme Zufall, #geänderte Tiere, #erlegte, #neue, #Pflanzen neu, #Pflanzen weg.
+
+
+def rng_pruefsumme(welt: Welt) -> int:
+    # CRC32 über den Zustand des Zufallsgenerators (625 Zahlen): billig und prozessunabhängig.
+    return zlib.crc32(array("I", welt.rng.getstate()[1]).tobytes())
+
+
+def _kopf_lesen(daten: memoryview) -> tuple[tuple[str, ...], int]:
+    # Dateikopf prüfen; liefert die Artentabelle und die Position des ersten Datensatzes.
+    magie, version = _DATEIKOPF.unpack_from(daten, 0)
+    if magie != _MAGIE or version not in (1, _VERSION):
+        raise ValueError("Kein (kompatibles) Tiersimulations-Protokoll.")
+    pos = _DATEIKOPF.size
+    if version == 1:
+        return tuple(ARTEN), pos
+        # Alte Protokolle: Artnummern beziehen sich auf die Reihenfolge von ARTEN.
+    (laenge,) = _ARTEN_LAENGE.unpack_from(daten, pos)
+    pos += _ARTEN_LAENGE.size
+    arten = tuple(bytes(daten[pos:pos + laenge]).decode("utf-8").split("\0"))
+    unbekannt = [name for name in arten if name not in ARTEN]
+    if unbekannt:
+        raise ValueError(f"Protokoll enthält unbekannte Arten: {', '.join(unbekannt)}")
+    return arten, pos + laenge
+
+
+def _saetze_lesen(daten: memoryview, pos: int) -> list[tuple[bytes, int, int, int]]:
+    # Index eines Protokolls ab "pos": (Art, Tick, Position der Nutzdaten, Länge) pro Datensatz.
+    saetze = []
+    while pos + _SATZ.size <= len(daten):
+        art, tick, laenge = _SATZ.unpack_from(daten, pos)
+        pos += _SATZ.size
+        if pos + laenge > len(daten):
+            break
+            # Unvollständiger letzter Datensatz (z. B. Absturz beim Schreiben): ignorieren.
+        saetze.append((art, tick, pos, laenge))
+        pos += laenge
+    return saetze
+
+
+class Aufzeichnung:
+    """
+    Protokolliert jeden Tick einer Welt. ziel=None: im Speicher (daten()), sonst Dateipfad.
+    Der Startzustand wird sofort als Schnappschuss geschrieben.
+    """
+
+    def __init__(self, welt: Welt, keyframe_alle: int = 100, ziel: str | None = None):
+        self.welt = welt
+        self.keyframe_alle = max(1, keyframe_alle)
+        self._puffer = bytearray()
+        self._datei = open(ziel, "wb") if ziel else None
+        self.arten = tuple(ARTEN)
+        self._art_nr = {name: nr for nr, name in enumerate(self.arten)}
+        # Artentabelle des Protokolls (steht im Dateikopf) und Name -> Nummer zum Schreiben.
+        tabelle = "\0".join(self.arten).encode("utf-8")
+        kopf = _DATEIKOPF.pack(_MAGIE, _VERSION) + _ARTEN_LAENGE.pack(len(tabelle)) + tabelle
+        self._schreiben(kopf)
+
+        self.index: list[tuple[bytes, int, int, int]] = []
+        # (Art, Tick, Position der Nutzdaten, Länge) pro Datensatz – für schnelles Springen.
+        self._kopf_laenge = self._laenge = len(kopf)
+
+        self._letzter: dict[int, tuple[float, float, int]] = {t.id: (t.x, t.y, t.energie) for t in welt.tiere}
+        # Stand jedes Tiers nach dem vorigen Tick, zum Vergleichen.
+        self._journal = welt.journal_anmelden(tiere=False)
+        # Für die Pflanzen reicht das Journal der Welt. Tiere werden direkt verglichen (weil sich
+        # die Energie auch ohne Bewegung ändert), also braucht das Journal sie nicht mitzuschreiben.
+
+        self._satz_schreiben(b"K", welt.tick_nr, welt.als_bytes())
+        welt.beobachter_anmelden(self._nach_tick)
+
+    # -------- Schreiben --------
+
+    def _schreiben(self, daten: bytes) -> None:
+        if self._datei is not None:
+            self._datei.write(daten)
+        else:
+            self._puffer += daten
+
+    def _satz_schreiben(self, art: bytes, tick: int, nutzdaten: bytes) -> None:
+        self._schreiben(_SATZ.pack(art, tick, len(nutzdaten)))
+        self._laenge += _SATZ.size
+        self.index.append((art, tick, self._laenge, len(nutzdaten)))
+        self._schreiben(nutzdaten)
+        self._laenge += len(nutzdaten)
+
+    def _nach_tick(self, welt: Welt) -> None:
+        # Beobachter: Änderungen seit dem letzten Tick als einen Datensatz ablegen.
+        letzter = self._letzter
+        aktuell = {}
+        geaendert = []
+        neu = []
+        for t in welt.tiere:
+            zustand = (t.x, t.y, t.energie)
+            aktuell[t.id] = zustand
+            vorher = letzter.get(t.id)
+            if vorher is None:
+                neu.append(t)
+            elif vorher != zustand:
+                geaendert.append(t)
+        weg = [i for i in letzter if i not in aktuell]
+        self._letzter = aktuell
+
+        j = self._journal
+        teile = [_DELTA.pack(rng_pruefsumme(welt), len(geaendert), len(weg), len(neu),
+                             len(j.pflanzen_neu), len(j.pflanzen_weg))]
+        for tiere in (geaendert, neu):
+            teile.append(_roh(array("q", [t.id for t in tiere])))
+            teile.append(_roh(array("d", [t.x for t in tiere])))
+            teile.append(_roh(array("d", [t.y for t in tiere])))
+            teile.append(_roh(array("h", [t.energie for t in tiere])))
+        teile.append(_roh(array("q", weg)))
+        teile.append(_roh(array("B", [self._art_nr[type(t).__name__] for t in neu])))
+        namen = "\0".join(t.name for t in neu).encode("utf-8")
+        teile.append(struct.pack("<Q", len(namen)) + namen)
+        for zellen in (j.pflanzen_neu, j.pflanzen_weg):
+            teile.append(_roh(array("I", [k for zelle in zellen for k in zelle])))
+        j.leeren()
+        self._satz_schreiben(b"D", welt.tick_nr, b"".join(teile))
+
+        if welt.tick_nr % self.keyframe_alle == 0:
+            self._satz_schreiben(b"K", welt.tick_nr, welt.als_bytes())
+
+    # -------- Verwaltung --------
+
+    def daten(self) -> bytes:
+        # Bisheriges Protokoll als Kopie (nur bei Aufzeichnung im Speicher), z. B. zum Speichern.
+        return bytes(self._puffer)
+
+    @property
+    def laenge(self) -> int:
+        # Bisherige Länge des Protokolls in Bytes (wächst mit jedem Datensatz, kleiner nach kuerzen).
+        return self._laenge
+
+    def lesen(self, pos: int, laenge: int) -> bytes:
+        # Nur diesen Ausschnitt kopieren (nur bei Aufzeichnung im Speicher). Die Ansicht auf den
+        # Puffer wird sofort wieder freigegeben: Solange sie besteht, kann er nicht wachsen.
+        if self._datei is not None:
+            raise ValueError("Lesen geht nur bei Aufzeichnung im Speicher.")
+        with memoryview(self._puffer) as ansicht:
+            return bytes(ansicht[pos:pos + laenge])
+
+    def kuerzen(self, tick: int) -> None:
+        """
+        Alles nach "tick" verwerfen (nur im Speicher), z. B. wenn nach dem Zurückspulen
+        von dort aus weitergerechnet wird. Die Welt muss dann auf genau diesem Tick stehen.
+        """
+        if self._datei is not None:
+            raise ValueError("Kürzen geht nur bei Aufzeichnung im Speicher.")
+        behalten = [s for s in self.index if s[1] <= tick]
+        self.index = behalten
+        self._laenge = behalten[-1][2] + behalten[-1][3] if behalten else self._kopf_laenge
+        del self._puffer[self._laenge:]
+
+    def welt_wechseln(self, welt: Welt) -> None:
+        # Weiter aufzeichnen, aber an einer anderen Welt (auf dem gleichen Tick wie das Protokollende).
+        self.welt.beobachter_abmelden(self._nach_tick)
+        self.welt.journal_abmelden(self._journal)
+        self.welt = welt
+        self._letzter = {t.id: (t.x, t.y, t.energie) for t in welt.tiere}
+        self._journal = welt.journal_anmelden(tiere=False)
+        welt.beobachter_anmelden(self._nach_tick)
+
+    def beenden(self) -> None:
+        self.welt.beobachter_abmelden(self._nach_tick)
+        self.welt.journal_abmelden(self._journal)
+        if self._datei is not None:
+            self._datei.close()
+            self._datei = None
+
+
+class Wiedergabe:
+    """
+    Liest ein Protokoll (bytes, Dateipfad oder eine laufende Aufzeichnung im Speicher) und stellt
+    beliebige Ticks wieder her. Bei einer Aufzeichnung wird deren Index übernommen und jeder
+    Datensatz erst beim Gebrauch einzeln aus ihrem Puffer kopiert.
+    """
+
+    def __init__(self, quelle: bytes | str | Aufzeichnung):
+        if isinstance(quelle, Aufzeichnung):
+            self._teil = quelle.lesen
+            self.arten = quelle.arten
+            saetze = list(quelle.index)
+        else:
+            if isinstance(quelle, str):
+                with open(quelle, "rb") as datei:
+                    quelle = datei.read()
+            daten = memoryview(quelle)
+            self.arten, start = _kopf_lesen(daten)
+            # Artnummer -> Artname, wie beim Aufzeichnen (nicht die aktuelle Reihenfolge von ARTEN).
+            self._teil = lambda pos, laenge: daten[pos:pos + laenge]
+            saetze = _saetze_lesen(daten, start)
+
+        self.keyframes: list[tuple[int, int, int]] = []
+        self.deltas: dict[int, tuple[int, int]] = {}
+        # Tick -> (Position, Länge) der Nutzdaten.
+        for art, tick, pos, laenge in saetze:
+            if art == b"K":
+                self.keyframes.append((tick, pos, laenge))
+            else:
+                self.deltas[tick] = (pos, laenge)
+        if not self.keyframes:
+            raise ValueError("Protokoll enthält keinen Schnappschuss.")
+
+    @property
+    def erster_tick(self) -> int:
+        return self.keyframes[0][0]
+
+    @property
+    def letzter_tick(self) -> int:
+        return max(self.keyframes[-1][0], max(self.deltas, default=0))
+
+    def _keyframe_vor(self, tick: int) -> tuple[int, int, int]:
+        # Letzter Schnappschuss mit Tick <= tick.
+        bester = self.keyframes[0]
+        for k in self.keyframes:
+            if k[0] > tick:
+                break
+            bester = k
+        return bester
+
+    def _pruefsumme(self, tick: int) -> int:
+        pos, _ = self.deltas[tick]
+        return _DELTA.unpack_from(self._teil(pos, _DELTA.size))[0]
+
+    def welt_bei(self, tick: int, neu_rechnen: bool = False) -> Welt:
+        """
+        Welt im Stand nach "tick". Standard: Schnappschuss + Änderungen (schnell, nur zum Ansehen).
+        neu_rechnen=True: ab dem Schnappschuss wirklich ticken und mit den Prüfsummen vergleichen.
+        """
+        if not self.erster_tick <= tick <= self.letzter_tick:
+            raise ValueError(f"Tick {tick} liegt nicht in der Aufzeichnung "
+                             f"({self.erster_tick}..{self.letzter_tick}).")
+        k_tick, pos, laenge = self._keyframe_vor(tick)
+        welt = Welt.aus_bytes(self._teil(pos, laenge))
+        if neu_rechnen:
+            while welt.tick_nr < tick:
+                welt.tick()
+                if rng_pruefsumme(welt) != self._pruefsumme(welt.tick_nr):
+                    raise RuntimeError(f"Neuberechnung weicht bei Tick {welt.tick_nr} von der Aufzeichnung ab.")
+            return welt
+        self.vorspulen(welt, tick)
+        return welt
+
+    def vorspulen(self, welt: Welt, tick: int) -> None:
+        # Änderungen welt.tick_nr+1 .. tick auf eine (Wiedergabe-)Welt anwenden.
+        while welt.tick_nr < tick:
+            self._anwenden(welt, welt.tick_nr + 1)
+
+    def springen(self, welt: Welt, tick: int) -> Welt:
+        """
+        Zu "tick" wechseln. Vorwärts (ohne Schnappschuss dazwischen) wird die übergebene Welt
+        weitergeführt, sonst wird ab dem nächstliegenden Schnappschuss neu aufgebaut.
+        Liefert die Welt, die jetzt "tick" zeigt (dieselbe oder eine neue).
+        """
+        k_tick = self._keyframe_vor(tick)[0]
+        if welt.tick_nr <= tick and welt.tick_nr >= k_tick:
+            self.vorspulen(welt, tick)
+            return welt
+        return self.welt_bei(tick)
+
+    def _anwenden(self, welt: Welt, tick: int) -> None:
+        pos, laenge = self.deltas[tick]
+        leser = _Leser(self._teil(pos, laenge))
+        _, n_geaendert, n_weg, n_neu, n_pfl_neu, n_pfl_weg = leser.struct(_DELTA)
+
+        spalten = []
+        for n in (n_geaendert, n_neu):
+            spalten.append((leser.array("q", n), leser.array("d", n), leser.array("d", n),
+                            leser.array("h", n)))
+        weg = leser.array("q", n_weg)
+        art = leser.array("B", n_neu)
+        (n_namen,) = leser.struct(struct.Struct("<Q"))
+        namen = leser.bytes(n_namen).decode("utf-8").split("\0") if n_neu else []
+        pflanzen_neu = leser.array("I", 2 * n_pfl_neu)
+        pflanzen_weg = leser.array("I", 2 * n_pfl_weg)
+
+        for i in weg:
+            welt.tier_entfernen(welt.tiere.nach_id(i))
+        ids, xs, ys, energie = spalten[0]
+        for i in range(n_geaendert):
+            t = welt.tiere.nach_id(ids[i])
+            t.x, t.y, t.energie = xs[i], ys[i], energie[i]
+            welt.tier_bewegt(t)
+        ids, xs, ys, energie = spalten[1]
+        for i in range(n_neu):
+            t = ARTEN[self.arten[art[i]]](namen[i])
+            t.x, t.y, t.energie, t.id = xs[i], ys[i], energie[i], ids[i]
+            welt._naechste_id = max(welt._naechste_id, t.id + 1)
+            welt._tier_aufnehmen(t)
+        for k in range(0, len(pflanzen_weg), 2):
+            welt.pflanze_entfernen((pflanzen_weg[k], pflanzen_weg[k + 1]))
+        for k in range(0, len(pflanzen_neu), 2):
+            welt.pflanze_setzen((pflanzen_neu[k], pflanzen_neu[k + 1]))
+        welt.tick_nr = tick
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+Headless-Lauf der Tiersimulation (ohne Tkinter, ohne Ereignistexte).
+
+Führt Welt.tick() so schnell wie möglich aus und gibt am Ende eine Zusammenfassung aus.
+Gedacht für Parameterstudien auf Servern.
+
+Aufruf (im Ordner tiersimulation):
+    python -m batchlauf --ticks 1000 --arten Loewe=2,Nilpferd=20 --samen 7
+    python -m batchlauf --breite 200 --hoehe 100 --pflanzen 2000 --json
+    python -m batchlauf --ticks 100000 --checkpoint-alle 5000 --checkpoint lauf.welt
+    python -m batchlauf --laden lauf.welt --ticks 1000      # gespeicherten Stand fortsetzen
+    python -m batchlauf --ticks 500 --profil profil.csv     # Zeit pro Tick-Phase messen
+    python -m batchlauf --ticks 1000000 --messreihe lauf/   # Zeitreihe als .npy-Blöcke
+    python -m batchlauf --pflanzen 5000 --flussfeld         # Pflanzensuche per Flussfeld
+    python -m batchlauf --ticks 100000 --zeitplan           # nur aktive Tiere besuchen
+    python -m batchlauf --zufallsstrom                      # Zufall pro (Tick, Tier) statt der Reihe nach
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+
+from tickprofiler import TickProfiler
+from tiersimulationV3 import ARTEN, GRID_H, GRID_W, Welt, Zeitplan
+
+STANDARD_ARTEN = "Loewe=2,Tiger=2,Wolf=2,Hund=2,Katze=3,Nilpferd=4"
+# Entspricht ungefähr der Startbesetzung aus App._setup_world.
+
+
+def arten_lesen(text: str) -> dict[str, int]:
+    # "Loewe=2,Nilpferd=10" -> {"Loewe": 2, "Nilpferd": 10}
+    mischung: dict[str, int] = {}
+    for teil in text.split(","):
+        if not teil.strip():
+            continue
+        name, _, anzahl = teil.partition("=")
+        name = name.strip()
+        if name not in ARTEN:
+            raise ValueError(f"Unbekannte Art {name!r}. Erlaubt: {', '.join(ARTEN)}")
+        mischung[name] = mischung.get(name, 0) + int(anzahl or 1)
+    return mischung
+
+
+def welt_erzeugen(breite: int, hoehe: int, pflanzen: int, arten: dict[str, int],
+                  samen: int | None, nachwuchs_chance: float = 0.06) -> Welt:
+    welt = Welt(breite, hoehe, samen=samen)
+    welt.nachwuchs_chance = nachwuchs_chance
+    welt.add_pflanzen_random(pflanzen)
+    for name, anzahl in arten.items():
+        klasse = ARTEN[name]
+        for i in range(anzahl):
+            welt.add_tier(klasse(f"{name}{i + 1}"))
+    return welt
+
+
+def arten_zaehlen(welt: Welt) -> dict[str, int]:
+    pro_art: dict[str, int] = {}
+    for t in welt.tiere:
+        name = type(t).__name__
+        pro_art[name] = pro_art.get(name, 0) + 1
+    return pro_art
+
+
+def zusammenfassung(welt: Welt) -> dict:
+    # Kennzahlen des aktuellen Weltzustands.
+    pro_art = arten_zaehlen(welt)
+    energien = [t.energie for t in welt.tiere]
+    return {
+        "tiere": len(welt.tiere),
+        "pro_art": pro_art,
+        "erschoepft": sum(1 for e in energien if e <= 0),
+        "energie_mittel": statistics.fmean(energien) if energien else 0.0,
+        "energie_min": min(energien, default=0),
+        "pflanzen": len(welt.pflanzen),
+    }
+
+
+def simulieren(breite: int = GRID_W, hoehe: int = GRID_H, pflanzen: int = 100,
+               arten: dict[str, int] | None = None, samen: int | None = 7,
+               ticks: int = 1000, nachwuchs_chance: float = 0.06,
+               verlauf_alle: int = 0, welt: Welt | None = None,
+               checkpoint_alle: int = 0, checkpoint: str | None = None,
+               profiler: TickProfiler | None = None, messreihe: str | None = None,
+               flussfeld: bool = False, zeitplan: bool = False,
+               zufallsstrom: bool = False) -> dict:
+    """
+    Eine Simulation ohne Darstellung durchlaufen lassen; liefert die Zusammenfassung als dict.
+    Mit verlauf_alle=k wird zusätzlich alle k Ticks die Anzahl Tiere pro Art notiert
+    (Eintrag "verlauf": Liste von (tick, {art: anzahl})).
+    Wird eine fertige "welt" übergeben (z. B. per Welt.load), läuft diese weiter.
+    Mit checkpoint_alle=n wird alle n Ticks der Zustand nach "checkpoint" gespeichert.
+    Ein übergebener "profiler" misst jeden Tick (siehe tickprofiler.py).
+    Mit messreihe=ORDNER werden pro Tick Kennzahlen in diesen Ordner geschrieben (messreihe.py).
+    Mit flussfeld=True schlagen Pflanzenfresser die nächste Pflanze im Flussfeld nach (flussfeld.py).
+    Mit zeitplan=True überspringt jeder Tick Schläfer und erschöpfte Tiere (siehe Zeitplan).
+    Mit zufallsstrom=True kommen Wanderwinkel und Nachwachsen aus einem Zufallsstrom (zufallsstrom.py);
+    eine fortgesetzte Welt behält ihren gespeicherten Strom, sonst wird er aus "samen" geschlüsselt.
+    """
+    fortgesetzt = welt is not None
+    strom_samen = samen
+    if fortgesetzt:
+        samen = None
+        # Fortgesetzte Welt: Der Zufallszustand kommt aus der Datei, nicht aus einem Samen.
+    else:
+        welt = welt_erzeugen(breite, hoehe, pflanzen, arten or arten_lesen(STANDARD_ARTEN), samen,
+                             nachwuchs_chance)
+    welt.profiler = profiler
+    if flussfeld:
+        from flussfeld import Flussfeld
+        welt.flussfeld = Flussfeld(welt)
+    if zeitplan:
+        welt.zeitplan = Zeitplan(welt)
+    if zufallsstrom and welt.zufallsstrom is None:
+        from zufallsstrom import Zufallsstrom
+        if fortgesetzt and strom_samen is None:
+            raise ValueError("Die gespeicherte Welt hat keinen Zufallsstrom; "
+                             "für einen reproduzierbaren Schlüssel bitte einen Samen angeben.")
+        welt.zufallsstrom = Zufallsstrom(strom_samen)
+        # Fortgesetzte Welt ohne gespeicherten Strom (Datei vor Version 3): Schlüssel aus "samen".
+        # Ein gespeicherter Strom (ab Version 3) kommt schon mit welt.load und bleibt unverändert.
+    reihe = None
+    if messreihe:
+        from messreihe import Messreihe
+        # Erst hier importiert: batchlauf selbst kommt ohne NumPy aus.
+        reihe = Messreihe(welt, messreihe)
+    verlauf = [(welt.tick_nr, arten_zaehlen(welt))] if verlauf_alle else []
+    start = time.perf_counter()
+    for tick in range(1, ticks + 1):
+        welt.tick()
+        if verlauf_alle and (tick % verlauf_alle == 0 or tick == ticks):
+            verlauf.append((welt.tick_nr, arten_zaehlen(welt)))
+        if checkpoint_alle and tick % checkpoint_alle == 0:
+            welt.save(checkpoint)
+    dauer = time.perf_counter() - start
+    welt.profiler = None
+    if reihe is not None:
+        reihe.beenden()
+
+    ergebnis = {
+        "breite": welt.breite, "hoehe": welt.hoehe, "samen": samen, "ticks": ticks,
+        "tick_nr": welt.tick_nr,
+        "nachwuchs_chance": welt.nachwuchs_chance,
+        "dauer_s": dauer, "ticks_pro_s": ticks / dauer if dauer > 0 else float("inf"),
+    }
+    ergebnis.update(zusammenfassung(welt))
+    if verlauf_alle:
+        ergebnis["verlauf"] = verlauf
+    if reihe is not None:
+        ergebnis["messreihe"] = {"ordner": messreihe, "zeilen": len(reihe)}
+    return ergebnis
+
+
+def ausgeben(ergebnis: dict) -> None:
+    print(f"Welt {ergebnis['breite']}x{ergebnis['hoehe']}, Samen {ergebnis['samen']}, "
+          f"{ergebnis['ticks']} Ticks in {ergebnis['dauer_s']:.2f} s "
+          f"({ergebnis['ticks_pro_s']:.0f} Ticks/s)")
+    print(f"Tiere: {ergebnis['tiere']} (davon erschöpft: {ergebnis['erschoepft']})")
+    for name, anzahl in sorted(ergebnis["pro_art"].items()):
+        print(f"  {name:<10} {anzahl:>6}")
+    print(f"Energie: Mittel {ergebnis['energie_mittel']:.1f}, Minimum {ergebnis['energie_min']}")
+    print(f"Pflanzen: {ergebnis['pflanzen']}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Tiersimulation ohne GUI ausführen.")
+    parser.add_argument("--breite", type=int, default=GRID_W)
+    parser.add_argument("--hoehe", type=int, default=GRID_H)
+    parser.add_argument("--pflanzen", type=int, default=100, help="Anzahl Startpflanzen")
+    parser.add_argument("--arten", default=STANDARD_ARTEN,
+                        help="Artenmischung, z. B. Loewe=2,Nilpferd=10")
+    parser.add_argument("--samen", type=int, default=7, help="Zufalls-Seed")
+    parser.add_argument("--ticks", type=int, default=1000)
+    parser.add_argument("--nachwuchs", type=float, default=0.06,
+                        help="Chance pro Tick, dass eine Pflanze nachwächst")
+    parser.add_argument("--json", action="store_true", help="Ergebnis als JSON ausgeben")
+    parser.add_argument("--laden", metavar="DATEI", help="gespeicherte Welt fortsetzen")
+    parser.add_argument("--checkpoint", metavar="DATEI", help="Datei für regelmäßige Zwischenstände")
+    parser.add_argument("--checkpoint-alle", type=int, default=0, metavar="N",
+                        help="alle N Ticks einen Zwischenstand speichern")
+    parser.add_argument("--profil", metavar="DATEI",
+                        help="Zeit pro Tick-Phase messen und als CSV (.json: JSON) speichern")
+    parser.add_argument("--messreihe", metavar="ORDNER",
+                        help="Kennzahlen jedes Ticks als .npy-Spalten in ORDNER schreiben")
+    parser.add_argument("--flussfeld", action="store_true",
+                        help="nächste Pflanze aus einem vorberechneten Feld nachschlagen (NumPy)")
+    parser.add_argument("--zeitplan", action="store_true",
+                        help="Schläfer und erschöpfte Tiere nicht jeden Tick besuchen")
+    parser.add_argument("--zufallsstrom", action="store_true",
+                        help="Zufall für Wandern/Nachwachsen aus (Samen, Tick, Tier-id) berechnen")
+    args = parser.parse_args(argv)
+    if args.checkpoint_alle and not args.checkpoint:
+        parser.error("--checkpoint-alle braucht --checkpoint DATEI")
+
+    try:
+        arten = arten_lesen(args.arten)
+    except ValueError as fehler:
+        parser.error(str(fehler))
+
+    welt = Welt.load(args.laden) if args.laden else None
+    profiler = TickProfiler() if args.profil else None
+    try:
+        ergebnis = simulieren(args.breite, args.hoehe, args.pflanzen, arten, args.samen, args.ticks,
+                              args.nachwuchs, welt=welt, checkpoint_alle=args.checkpoint_alle,
+                              checkpoint=args.checkpoint, profiler=profiler,
+                              messreihe=args.messreihe, flussfeld=args.flussfeld,
+                              zeitplan=args.zeitplan, zufallsstrom=args.zufallsstrom)
+    except ValueError as fehler:
+        parser.error(str(fehler))
+    if profiler is not None:
+        profiler.speichern(args.profil)
+        ergebnis["profil"] = profiler.summen()
+    if args.json:
+        print(json.dumps(ergebnis, ensure_ascii=False, indent=2))
+    else:
+        ausgeben(ergebnis)
+
+
+if __name__ == "__main__":
+    main()
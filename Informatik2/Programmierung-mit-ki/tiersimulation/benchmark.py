@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark für die Tiersimulation (tiersimulationV3.py).
+
+Misst, wie viele Ticks pro Sekunde Welt.tick() bei 100, 1.000 und 10.000 Tieren schafft –
+einmal mit den räumlichen Indizes (Standard) und einmal mit der alten linearen Suche.
+Außerdem wird geprüft, dass der Tierindex exakt dieselbe Beute findet wie die lineare Suche,
+und gemessen, wie viele Bytes ein Tier-Objekt belegt (schlanke Tiere mit __slots__ gegenüber
+der früheren Form mit __dict__ und Art-Konstanten in jedem Objekt).
+
+Aufruf:
+    python benchmark.py                 # 100, 1000, 10000 Tiere (linear nur bis 1000)
+    python benchmark.py --mit-linear    # lineare Suche auch bei 10000 Tieren (sehr langsam!)
+    python benchmark.py --speicher-tiere 100000    # Speicher pro Tier bei 100.000 statt 1 Mio. Tieren
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+import time
+import tracemalloc
+
+import tiersimulationV3 as sim
+
+
+class LineareWelt(sim.Welt):
+    # Welt mit den ursprünglichen O(n)-Suchen – nur als Vergleichsmaßstab.
+    def naechste_pflanze(self, x, y, max_dist):
+        return self._naechste_pflanze_linear(x, y, max_dist)
+
+    def naechster_pflanzenfresser(self, jaeger, max_dist):
+        return self._naechster_pflanzenfresser_linear(jaeger, max_dist)
+
+
+class AltesTier:
+    # Nachbau der früheren Tier-Form – nur als Vergleichsmaßstab für den Speicherbedarf.
+    # Eigenständig (nicht von sim.Tier abgeleitet, sonst kämen dessen Slots dazu): ohne __slots__,
+    # also mit __dict__, und mit denselben Attributen in derselben Reihenfolge wie Tier.__init__
+    # vor der Umstellung, einschließlich der Art-Konstanten in jedem Objekt.
+    def __init__(self, name, nahrung, *, x=0.0, y=0.0, schrittweite=1.0, sichtweite=6.0, emoji="?"):
+        self.name = name
+        self.nahrung = nahrung
+        self.energie = 100
+        self.x = x
+        self.y = y
+        self.schrittweite = schrittweite
+        self.sichtweite = sichtweite
+        self.emoji = emoji
+        self.id = -1
+        self._index_block = None
+        self._reihenfolge = 0
+
+
+class AlterLoewe(AltesTier):
+    def __init__(self, name, **kw):
+        super().__init__(name, sim.Nahrung.FLEISCHFRESSER, schrittweite=1.2, sichtweite=8.0, emoji="🦁", **kw)
+
+
+class AltesNilpferd(AltesTier):
+    def __init__(self, name, **kw):
+        super().__init__(name, sim.Nahrung.PFLANZENFRESSER, schrittweite=0.9, sichtweite=6.0, emoji="🦛", **kw)
+
+
+def baue_welt(anzahl_tiere: int, welt_klasse=sim.Welt, samen: int = 7) -> sim.Welt:
+    # Weltgröße mit der Tierzahl skalieren: ca. 10 Zellen pro Tier, Pflanzen auf jeder 10. Zelle.
+    seite = max(20, int(math.sqrt(anzahl_tiere * 10)))
+    welt = welt_klasse(seite, seite, samen=samen)
+    welt.add_pflanzen_random(seite * seite // 10)
+    for i in range(anzahl_tiere):
+        # Verhältnis 1 Fleischfresser : 3 Pflanzenfresser
+        if i % 4 == 0:
+            welt.add_tier(sim.Loewe(f"Loewe{i}"))
+        else:
+            welt.add_tier(sim.Nilpferd(f"Nilpferd{i}"))
+    return welt
+
+
+def ticks_pro_sekunde(welt: sim.Welt, sekunden: float = 2.0, max_ticks: int = 200) -> float:
+    # Ticks ausführen, bis "sekunden" vergangen sind (mindestens einer), und die Rate liefern.
+    ticks = 0
+    start = time.perf_counter()
+    while True:
+        welt.tick()
+        ticks += 1
+        dauer = time.perf_counter() - start
+        if dauer >= sekunden or ticks >= max_ticks:
+            return ticks / dauer
+
+
+def bytes_pro_tier(anzahl: int, loewe=sim.Loewe, nilpferd=sim.Nilpferd) -> float:
+    # Speicher für "anzahl" Tiere (1 : 3 wie in baue_welt) inklusive Namen und Positionen,
+    # gemessen mit tracemalloc, geteilt durch die Anzahl.
+    tracemalloc.start()
+    vorher = tracemalloc.get_traced_memory()[0]
+    tiere = []
+    for i in range(anzahl):
+        t = loewe(f"Loewe{i}") if i % 4 == 0 else nilpferd(f"Nilpferd{i}")
+        t.x, t.y = i * 0.5, i * 0.25
+        # Positionen wie in einer echten Welt (eigene float-Objekte pro Tier).
+        tiere.append(t)
+    belegt = tracemalloc.get_traced_memory()[0] - vorher
+    tracemalloc.stop()
+    return (belegt - sys.getsizeof(tiere)) / anzahl
+    # Die Liste selbst gehört nicht zu den Tieren.
+
+
+def pruefe_gleichheit(anzahl_tiere: int = 1000, ticks: int = 20) -> None:
+    # Für jeden Fleischfresser: Index-Suche und lineare Suche müssen dasselbe Ergebnis liefern.
+    welt = baue_welt(anzahl_tiere)
+    for _ in range(ticks):
+        for t in welt.tiere:
+            if t.nahrung == sim.Nahrung.FLEISCHFRESSER:
+                a = welt.naechster_pflanzenfresser(t, t.sichtweite)
+                b = welt._naechster_pflanzenfresser_linear(t, t.sichtweite)
+                if a != b:
+                    raise AssertionError(f"Abweichung bei {t.name}: {a} != {b}")
+        welt.tick()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ticks/s der Tiersimulation messen.")
+    parser.add_argument("--mit-linear", action="store_true",
+                        help="lineare Suche auch bei 10000 Tieren messen")
+    parser.add_argument("--sekunden", type=float, default=2.0, help="Messdauer pro Fall")
+    parser.add_argument("--speicher-tiere", type=int, default=1_000_000, metavar="N",
+                        help="Anzahl Tiere für die Speichermessung")
+    args = parser.parse_args()
+
+    pruefe_gleichheit()
+    print("Tierindex liefert dieselben Ergebnisse wie die lineare Suche.\n")
+
+    print(f"{'Tiere':>8} {'Index [Ticks/s]':>16} {'Linear [Ticks/s]':>17}")
+    for n in (100, 1_000, 10_000):
+        mit_index = ticks_pro_sekunde(baue_welt(n), args.sekunden)
+        if n <= 1_000 or args.mit_linear:
+            linear = f"{ticks_pro_sekunde(baue_welt(n, LineareWelt), args.sekunden):17.1f}"
+        else:
+            linear = f"{'–':>17}"
+        print(f"{n:>8} {mit_index:16.1f} {linear}")
+
+    n = args.speicher_tiere
+    vorher = bytes_pro_tier(n, AlterLoewe, AltesNilpferd)
+    nachher = bytes_pro_tier(n)
+    print(f"\nSpeicher bei {n} Tieren: früher {vorher:.0f} Bytes/Tier, "
+          f"mit __slots__ {nachher:.0f} Bytes/Tier ({100 * (1 - nachher / vorher):.0f} % weniger)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+"""
+Ensemble: viele kleine, voneinander unabhängige Welten in einem Rutsch rechnen.
+
+Für Statistik braucht man hunderte Läufe auf kleinen Karten (GRID_W x GRID_H). Einzeln
+gerechnet kostet dabei der Python-Aufwand pro Lauf und Tick mehr als die eigentliche Rechnung.
+Ensemble legt deshalb K Welten gleicher Größe und gleicher Startbesetzung in gemeinsame
+Arrays mit einer führenden Welt-Achse:
+
+    pflanzen[k, y, x]      Pflanzenraster jeder Welt
+    x[k, i], y[k, i]       Position von Tier i in Welt k (Spalte i hat in allen Welten dieselbe Art)
+    energie[k, i]          Energie
+    lebt[k, i]             False, sobald das Tier erlegt wurde (der Platz bleibt frei)
+
+Ein Tick ist dann EIN Satz Array-Operationen für alle Welten zusammen.
+
+Regeln wie in KachelWelt (synchron, alle Entscheidungen nach dem Stand zu Tickbeginn):
+Weiden (kleinster Index pro Zelle gewinnt), Jagd auf den nächsten Pflanzenfresser in Sichtweite
+(im Abstand <= 1 erwischt, umkämpfte Beute bekommt der nächste Jäger; weiter weg ein Schritt auf
+ihn zu), sonst Schlafen unter der Energieschwelle oder Wandern in zufällige Richtung, dann mit
+kleiner Chance eine neue Pflanze.
+
+Jede Welt hat ihren eigenen Samen. Aufgebaut wird mit einem Generator pro Welt, die Zufallszahlen
+der Ticks kommen aus einem Zufallsstrom (zufallsstrom.py) mit einem Schlüssel pro Welt: Der Winkel
+von Tier i in Welt k und Tick t hängt nur von (samen[k], t, i) ab und wird für alle Welten in
+einem Aufruf berechnet. Das Ergebnis einer Welt hängt deshalb nur von ihrem Samen ab – nicht
+davon, welche und wie viele Welten mit ihr im Ensemble stecken – und ist bitgleich zu
+KachelWelt(breite, hoehe, ..., samen=samen[k]) mit demselben Aufbau.
+
+Aufruf:
+    python -m ensemble --welten 500 --ticks 1000 --arten Loewe=2,Nilpferd=20 --samen 1
+    python -m ensemble --welten 100 --json > ergebnis.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from batchlauf import STANDARD_ARTEN, arten_lesen
+from kachelwelt import JAGD_DISTANZ
+from tiersimulationV3 import (ARTEN, ERHOLUNG_PRO_STUNDE, GRID_H, GRID_W, MUEDE_FLEISCHFRESSER,
+                              MUEDE_PFLANZENFRESSER, Nahrung, Tier)
+from vektorwelt import Art, bewegen, verbrauch
+from zufallsstrom import Zufallsstrom
+
+JAGD_BLOCK = 1 << 22
+# Höchstens so viele Jäger-Beute-Paare (über alle Welten eines Blocks) auf einmal vergleichen.
+
+
+class Ensemble:
+    """K unabhängige Welten gleicher Größe, gemeinsam in Arrays [K, ...] gerechnet."""
+
+    def __init__(self, samen: list[int], breite: int = GRID_W, hoehe: int = GRID_H):
+        if not samen:
+            raise ValueError("Ein Ensemble braucht mindestens eine Welt (einen Samen).")
+        self.samen = list(samen)
+        self.breite = breite
+        self.hoehe = hoehe
+        self.anzahl_welten = k = len(self.samen)
+        self._rngs = [np.random.default_rng(s) for s in self.samen]
+        # Ein Generator pro Welt für den Aufbau: gleiche Samen -> gleiche Startwelt.
+        self.strom = Zufallsstrom(np.array(self.samen)[:, None])
+        # Zufallszahlen der Ticks: Schlüssel pro Welt (Spalte), Zähler pro Tierplatz.
+
+        self.pflanzen = np.zeros((k, hoehe, breite), dtype=bool)
+
+        self.arten: list[Art] = []
+        self._art_nr: dict[type, int] = {}
+
+        self.x = np.empty((k, 0), dtype=np.float64)
+        self.y = np.empty((k, 0), dtype=np.float64)
+        self.energie = np.empty((k, 0), dtype=np.int32)
+        self.lebt = np.empty((k, 0), dtype=bool)
+        # Zustand pro Welt und Tierplatz.
+
+        self.art = np.empty(0, dtype=np.int16)
+        self.schrittweite = np.empty(0, dtype=np.float64)
+        self.sichtweite = np.empty(0, dtype=np.float64)
+        self.pflanzenfresser = np.empty(0, dtype=bool)
+        self.fressgewinn = np.empty(0, dtype=np.int32)
+        # Konstanten pro Tierplatz (in allen Welten gleich).
+
+        self.ticks = 0
+
+    # -------- Aufbau --------
+
+    def _art_index(self, klasse: type[Tier]) -> int:
+        if klasse not in self._art_nr:
+            self._art_nr[klasse] = len(self.arten)
+            self.arten.append(Art(klasse("vorlage")))
+        return self._art_nr[klasse]
+
+    def add_pflanzen_random(self, anzahl: int) -> None:
+        # In jeder Welt "anzahl" Pflanzen an zufälligen Zellen (doppelte Zellen fallen zusammen).
+        for k, rng in enumerate(self._rngs):
+            self.pflanzen[k, rng.integers(0, self.hoehe, anzahl), rng.integers(0, self.breite, anzahl)] = True
+
+    def add_tiere(self, klasse: type[Tier], anzahl: int) -> None:
+        # In jeder Welt "anzahl" Tiere dieser Art an zufälligen Positionen anhängen.
+        nr = self._art_index(klasse)
+        art = self.arten[nr]
+        x = np.stack([rng.uniform(0, self.breite - 1, anzahl) for rng in self._rngs])
+        y = np.stack([rng.uniform(0, self.hoehe - 1, anzahl) for rng in self._rngs])
+        k = self.anzahl_welten
+
+        self.x = np.concatenate([self.x, x], axis=1)
+        self.y = np.concatenate([self.y, y], axis=1)
+        self.energie = np.concatenate([self.energie, np.full((k, anzahl), 100, dtype=np.int32)], axis=1)
+        self.lebt = np.concatenate([self.lebt, np.ones((k, anzahl), dtype=bool)], axis=1)
+
+        self.art = np.concatenate([self.art, np.full(anzahl, nr, dtype=np.int16)])
+        self.schrittweite = np.concatenate([self.schrittweite, np.full(anzahl, art.schrittweite)])
+        self.sichtweite = np.concatenate([self.sichtweite, np.full(anzahl, art.sichtweite)])
+        self.pflanzenfresser = np.concatenate(
+            [self.pflanzenfresser, np.full(anzahl, art.nahrung == Nahrung.PFLANZENFRESSER)]
+        )
+        self.fressgewinn = np.concatenate(
+            [self.fressgewinn, np.full(anzahl, art.fressgewinn, dtype=np.int32)]
+        )
+
+    # -------- Simulation --------
+
+    def _jagen(self, aktiv: np.ndarray) -> tuple[np.ndarray, ...]:
+        # Wer jagt wen? Liefert (beschäftigte Jäger, erfolgreiche Jäger, erlegt, Verfolger,
+        # Winkel der Verfolger zu ihrer Beute), alles als Arrays [K, N].
+        jaeger_spalten = np.flatnonzero(~self.pflanzenfresser)
+        beute_spalten = np.flatnonzero(self.pflanzenfresser)
+        n = self.x.shape[1]
+        beschaeftigt = np.zeros((self.anzahl_welten, n), dtype=bool)
+        erfolg = np.zeros_like(beschaeftigt)
+        erlegt = np.zeros_like(beschaeftigt)
+        verfolgt = np.zeros_like(beschaeftigt)
+        winkel = np.zeros((self.anzahl_welten, n))
+        nj, nb = len(jaeger_spalten), len(beute_spalten)
+        if not nj or not nb:
+            return beschaeftigt, erfolg, erlegt, verfolgt, winkel
+        sicht = self.sichtweite[jaeger_spalten, None]
+
+        block = max(1, JAGD_BLOCK // (nj * nb))
+        for von in range(0, self.anzahl_welten, block):
+            w = slice(von, von + block)
+            jx = self.x[w][:, jaeger_spalten, None]
+            jy = self.y[w][:, jaeger_spalten, None]
+            bx = self.x[w][:, None, beute_spalten]
+            by = self.y[w][:, None, beute_spalten]
+            d = np.hypot(bx - jx, by - jy)
+            # d[k, j, b]: Abstand von Jäger j zu Beute b in Welt k.
+            moeglich = (aktiv[w][:, jaeger_spalten, None] & self.lebt[w][:, None, beute_spalten]
+                        & (d <= sicht))
+            d = np.where(moeglich, d, np.inf)
+
+            wahl = d.argmin(axis=2)
+            # Nächste Beute jedes Jägers in Sichtweite (bei Gleichstand die mit dem kleineren Index).
+            abstand = np.take_along_axis(d, wahl[..., None], axis=2)[..., 0]
+            sieht = np.isfinite(abstand)
+            hat = abstand <= JAGD_DISTANZ
+            # Erwischt; die übrigen Jäger, die Beute sehen, gehen auf sie zu.
+            jagt = sieht & ~hat
+            ziel_x = np.take_along_axis(bx[:, 0, :], wahl, axis=1)
+            ziel_y = np.take_along_axis(by[:, 0, :], wahl, axis=1)
+
+            anspruch = np.where(hat[..., None] & (wahl[..., None] == np.arange(nb)), d, np.inf)
+            sieger = anspruch.argmin(axis=1)
+            # Pro Beute der nächste Jäger, der sie gewählt hat (bei Gleichstand kleinerer Index).
+            gefangen = np.isfinite(anspruch.min(axis=1))
+            gewinnt = hat & (np.take_along_axis(sieger, wahl, axis=1) == np.arange(nj))
+
+            beschaeftigt[w, jaeger_spalten] = sieht
+            erfolg[w, jaeger_spalten] = gewinnt
+            erlegt[w, beute_spalten] = gefangen
+            verfolgt[w, jaeger_spalten] = jagt
+            winkel[w, jaeger_spalten] = np.where(jagt, np.arctan2(ziel_y - jy[..., 0], ziel_x - jx[..., 0]), 0.0)
+        return beschaeftigt, erfolg, erlegt, verfolgt, winkel
+
+    def tick(self, chance_nachwachsen: float = 0.06) -> None:
+        n = self.x.shape[1]
+        aktiv = self.lebt & (self.energie > 0)
+        zx = np.rint(self.x).astype(np.intp)
+        zy = np.rint(self.y).astype(np.intp)
+        welt_nr = np.broadcast_to(np.arange(self.anzahl_welten)[:, None], aktiv.shape)
+
+        # 1) Weiden: pro Welt und Zelle bekommt das Tier mit dem kleinsten Index die Pflanze.
+        auf_pflanze = aktiv & self.pflanzenfresser & self.pflanzen[welt_nr, zy, zx]
+        wk, wi = np.nonzero(auf_pflanze)
+        # Zeilenweise: nach Welt, innerhalb der Welt nach Index sortiert.
+        if len(wk):
+            _, erste = np.unique((wk * self.hoehe + zy[wk, wi]) * self.breite + zx[wk, wi],
+                                 return_index=True)
+            wk, wi = wk[erste], wi[erste]
+            self.energie[wk, wi] = np.minimum(100, self.energie[wk, wi] + self.fressgewinn[wi])
+            self.pflanzen[wk, zy[wk, wi], zx[wk, wi]] = False
+        beschaeftigt = np.zeros_like(aktiv)
+        beschaeftigt[wk, wi] = True
+
+        # 2) Jagen (nach dem Stand zu Tickbeginn; Erlegte verschwinden erst am Ende).
+        jagt, erfolg, erlegt, verfolgt, ziel_winkel = self._jagen(aktiv)
+        beschaeftigt |= jagt
+
+        # 3) Schlafen unter der Energieschwelle.
+        schwelle = np.where(self.pflanzenfresser, MUEDE_PFLANZENFRESSER, MUEDE_FLEISCHFRESSER)
+        schlaeft = aktiv & ~beschaeftigt & (self.energie < schwelle)
+        self.energie[schlaeft] = np.minimum(100, self.energie[schlaeft] + ERHOLUNG_PRO_STUNDE)
+
+        # 4) Wandern mit den Winkeln aus dem Zufallsstrom (für alle Plätze aller Welten auf einmal);
+        #    Verfolger gehen in Richtung ihrer Beute.
+        laeuft = (aktiv & ~beschaeftigt & ~schlaeft) | verfolgt
+        schritt = np.broadcast_to(self.schrittweite, laeuft.shape)[laeuft]
+        winkel = np.where(verfolgt, ziel_winkel, self.strom.winkel_viele(self.ticks, np.arange(n)))[laeuft]
+        self.x[laeuft], self.y[laeuft], _ = bewegen(
+            self.x[laeuft], self.y[laeuft], winkel, schritt, self.breite, self.hoehe
+        )
+        self.energie[laeuft] = np.maximum(0, self.energie[laeuft] - verbrauch(schritt))
+
+        # 5) Jagdbeute verteilen.
+        self.energie[erfolg] = np.minimum(100, self.energie[erfolg]
+                                          + np.broadcast_to(self.fressgewinn, erfolg.shape)[erfolg])
+        self.lebt &= ~erlegt
+
+        # 6) Nachwachsen: in jeder Welt mit kleiner Chance eine Pflanze.
+        neu, nx, ny = (w[:, 0] for w in self.strom.nachwuchs_viele(
+            self.ticks, chance_nachwachsen, self.breite, self.hoehe))
+        self.pflanzen[np.flatnonzero(neu), ny[neu], nx[neu]] = True
+
+        self.ticks += 1
+
+    def laufen(self, ticks: int, chance_nachwachsen: float = 0.06) -> None:
+        for _ in range(ticks):
+            self.tick(chance_nachwachsen)
+
+    # -------- Auswertung --------
+
+    def zaehlen(self) -> np.ndarray:
+        # Lebende Tiere pro Welt und Art als Array [K, Arten] (Spalten wie self.arten).
+        zaehler = np.zeros((self.anzahl_welten, len(self.arten)), dtype=np.int64)
+        for nr in range(len(self.arten)):
+            zaehler[:, nr] = self.lebt[:, self.art == nr].sum(axis=1)
+        return zaehler
+
+    def ergebnisse(self) -> list[dict]:
+        # Zusammenfassung pro Welt, mit denselben Schlüsseln wie batchlauf.zusammenfassung.
+        zaehler = self.zaehlen()
+        tiere = self.lebt.sum(axis=1)
+        summe = np.where(self.lebt, self.energie, 0).sum(axis=1)
+        minimum = np.where(self.lebt, self.energie, 101).min(axis=1, initial=101)
+        erschoepft = (self.lebt & (self.energie <= 0)).sum(axis=1)
+        pflanzen = self.pflanzen.sum(axis=(1, 2))
+        namen = [a.name for a in self.arten]
+        return [
+            {
+                "samen": self.samen[k],
+                "ticks": self.ticks,
+                "tiere": int(tiere[k]),
+                "pro_art": {name: int(z) for name, z in zip(namen, zaehler[k]) if z},
+                "erschoepft": int(erschoepft[k]),
+                "energie_mittel": float(summe[k] / tiere[k]) if tiere[k] else 0.0,
+                "energie_min": int(minimum[k]) if tiere[k] else 0,
+                "pflanzen": int(pflanzen[k]),
+            }
+            for k in range(self.anzahl_welten)
+        ]
+
+
+def ensemble_erzeugen(samen: list[int], breite: int, hoehe: int, pflanzen: int,
+                      arten: dict[str, int]) -> Ensemble:
+    ens = Ensemble(samen, breite, hoehe)
+    ens.add_pflanzen_random(pflanzen)
+    for name, anzahl in arten.items():
+        ens.add_tiere(ARTEN[name], anzahl)
+    return ens
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Viele kleine Welten gemeinsam (vektorisiert) rechnen.")
+    parser.add_argument("--welten", type=int, default=100, help="Anzahl Welten im Ensemble")
+    parser.add_argument("--samen", type=int, default=1, help="Samen der ersten Welt (dann +1, +2, ...)")
+    parser.add_argument("--breite", type=int, default=GRID_W)
+    parser.add_argument("--hoehe", type=int, default=GRID_H)
+    parser.add_argument("--pflanzen", type=int, default=100, help="Startpflanzen pro Welt")
+    parser.add_argument("--arten", default=STANDARD_ARTEN, help="Artenmischung pro Welt")
+    parser.add_argument("--ticks", type=int, default=1000)
+    parser.add_argument("--nachwuchs", type=float, default=0.06,
+                        help="Chance pro Tick und Welt, dass eine Pflanze nachwächst")
+    parser.add_argument("--json", action="store_true", help="Ergebnis jeder Welt als JSON ausgeben")
+    args = parser.parse_args(argv)
+    if args.welten < 1:
+        parser.error("--welten muss mindestens 1 sein")
+    try:
+        arten = arten_lesen(args.arten)
+    except ValueError as fehler:
+        parser.error(str(fehler))
+
+    ens = ensemble_erzeugen(list(range(args.samen, args.samen + args.welten)), args.breite,
+                            args.hoehe, args.pflanzen, arten)
+    start = time.perf_counter()
+    ens.laufen(args.ticks, args.nachwuchs)
+    dauer = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps(ens.ergebnisse(), ensure_ascii=False, indent=2))
+        return
+    print(f"{args.welten} Welten {args.breite}x{args.hoehe}, {args.ticks} Ticks in {dauer:.2f} s "
+          f"({args.welten * args.ticks / dauer:.0f} Welt-Ticks/s)")
+    zaehler = ens.zaehlen()
+    for nr, art in enumerate(ens.arten):
+        spalte = zaehler[:, nr]
+        print(f"  {art.name:<10} Mittel {spalte.mean():6.2f}  Min {spalte.min():4d}  Max {spalte.max():4d}  "
+              f"ausgestorben in {np.count_nonzero(spalte == 0)} Welten")
+    pflanzen = ens.pflanzen.sum(axis=(1, 2))
+    print(f"Pflanzen: Mittel {pflanzen.mean():.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,449 @@
+# -*- coding: utf-8 -*-
+"""
+Live-Ansicht der Tiersimulation im Browser, für Läufe auf Servern ohne Bildschirm.
+
+Statt der Tkinter-App läuft hier ein asyncio-Server (nur Standardbibliothek):
+
+    - Eine Aufgabe ruft Welt.tick() so schnell wie möglich (oder mit "ticks_pro_s").
+    - Eine zweite Aufgabe schickt höchstens "bilder_pro_s" mal pro Sekunde die Änderungen
+      seit dem letzten Bild an alle Zuschauer (WebSocket, Binärnachrichten).
+    - Die Änderungen kommen aus einem Journal der Welt (Welt.journal_anmelden), wie bei der
+      App: Zwischen zwei Bildern können viele Ticks liegen, geschickt wird nur das Ergebnis.
+
+Die Simulation wartet nie auf Zuschauer: Nachrichten werden nur in den Sendepuffer gelegt.
+Wächst der Puffer eines langsamen Zuschauers über "puffer_grenze", bekommt er keine
+Änderungen mehr, sondern sobald er wieder aufgeholt hat ein vollständiges Bild.
+
+Standardmäßig nimmt der Server nur Verbindungen von diesem Rechner an (127.0.0.1).
+Von außen erreicht man ihn z. B. per SSH-Tunnel: ssh -L 8765:localhost:8765 server
+
+Aufruf (im Ordner tiersimulation), dann http://localhost:8765/ im Browser öffnen:
+    python -m fernansicht --breite 120 --hoehe 80 --pflanzen 2000 --arten Loewe=5,Nilpferd=40
+    python -m fernansicht --laden lauf.welt --ticks-pro-s 50
+
+Nachrichten an den Zuschauer (nach dem Handshake):
+    1. Text (JSON): {"breite", "hoehe", "arten": [[Name, Emoji], ...]}
+    2. Binär, Kopf "<cQ": Art und Tick, danach je nach Art
+       b"V" (vollständiges Bild): "<II" #Pflanzen, #Tiere; Pflanzen als x,y (uint32);
+            Tiere spaltenweise: id (uint32), x, y (float32), Art (uint8, Index in "arten")
+       b"D" (Änderungen):  "<IIII" #Tiere bewegt/neu, #Tiere weg, #Pflanzen neu, #Pflanzen weg;
+            bewegte/neue Tiere wie oben, Ids der verschwundenen Tiere (uint32),
+            neue und gefressene Pflanzen als x,y (uint32)
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import struct
+from array import array
+from time import perf_counter
+
+from tiersimulationV3 import ARTEN, Aenderungen, Welt, _Leser, _roh
+
+_WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+# Fester Wert aus dem WebSocket-Standard (RFC 6455) für Sec-WebSocket-Accept.
+
+_TEXT, _BINAER, _SCHLIESSEN, _PING, _PONG = 0x1, 0x2, 0x8, 0x9, 0xA
+# WebSocket-Opcodes, die hier vorkommen.
+
+_MAX_NACHRICHT = 1 << 16
+# Zuschauer schicken höchstens Steuernachrichten; alles Größere wird abgelehnt.
+
+_BILD = struct.Struct("<cQ")
+_VOLL = struct.Struct("<II")
+_DELTA = struct.Struct("<IIII")
+_ART_NR = {klasse: i for i, klasse in enumerate(ARTEN.values())}
+
+
+# -------- Bilder (Binärnachrichten) --------
+
+def _tiere_bytes(tiere) -> list[bytes]:
+    # Tiere spaltenweise: Ids, x, y, Art.
+    tiere = list(tiere)
+    return [
+        _roh(array("I", [t.id for t in tiere])),
+        _roh(array("f", [t.x for t in tiere])),
+        _roh(array("f", [t.y for t in tiere])),
+        _roh(array("B", [_ART_NR[type(t)] for t in tiere])),
+    ]
+
+
+def _zellen_bytes(zellen) -> bytes:
+    return _roh(array("I", [k for zelle in zellen for k in zelle]))
+
+
+def vollbild(welt: Welt) -> bytes:
+    # Alle Pflanzen und Tiere.
+    teile = [_BILD.pack(b"V", welt.tick_nr), _VOLL.pack(len(welt.pflanzen), len(welt.tiere)),
+             _roh(welt.pflanzen.als_koordinaten())]
+    teile += _tiere_bytes(welt.tiere)
+    return b"".join(teile)
+
+
+def delta(welt: Welt, journal: Aenderungen) -> bytes:
+    # Änderungen aus dem Journal (das Journal wird hier nicht geleert).
+    teile = [_BILD.pack(b"D", welt.tick_nr),
+             _DELTA.pack(len(journal.tiere_bewegt), len(journal.tiere_weg),
+                         len(journal.pflanzen_neu), len(journal.pflanzen_weg))]
+    teile += _tiere_bytes(journal.tiere_bewegt)
+    teile.append(_roh(array("I", [t.id for t in journal.tiere_weg])))
+    teile.append(_zellen_bytes(journal.pflanzen_neu))
+    teile.append(_zellen_bytes(journal.pflanzen_weg))
+    return b"".join(teile)
+
+
+def bild_lesen(daten: bytes) -> dict:
+    # Gegenstück zu vollbild/delta (für Zuschauer in Python und zum Prüfen).
+    leser = _Leser(daten)
+    art, tick = leser.struct(_BILD)
+
+    def tiere_lesen(anzahl: int) -> dict[int, tuple[int, float, float]]:
+        ids = leser.array("I", anzahl)
+        xs = leser.array("f", anzahl)
+        ys = leser.array("f", anzahl)
+        arten = leser.array("B", anzahl)
+        return {i: (a, x, y) for i, x, y, a in zip(ids, xs, ys, arten)}
+
+    def zellen_lesen(anzahl: int) -> set[tuple[int, int]]:
+        werte = leser.array("I", 2 * anzahl)
+        return set(zip(werte[0::2], werte[1::2]))
+
+    if art == b"V":
+        n_pflanzen, n_tiere = leser.struct(_VOLL)
+        pflanzen = zellen_lesen(n_pflanzen)
+        return {"art": "V", "tick": tick, "pflanzen": pflanzen, "tiere": tiere_lesen(n_tiere)}
+    if art == b"D":
+        n_bewegt, n_weg, n_neu, n_gefressen = leser.struct(_DELTA)
+        bewegt = tiere_lesen(n_bewegt)
+        weg = list(leser.array("I", n_weg))
+        return {"art": "D", "tick": tick, "tiere": bewegt, "tiere_weg": weg,
+                "pflanzen_neu": zellen_lesen(n_neu), "pflanzen_weg": zellen_lesen(n_gefressen)}
+    raise ValueError(f"Unbekannte Bildart {art!r}.")
+
+
+# -------- WebSocket (RFC 6455, nur das Nötigste) --------
+
+def _rahmen(opcode: int, nutzdaten: bytes) -> bytes:
+    # Ein unfragmentierter, unmaskierter Rahmen (Server -> Zuschauer).
+    n = len(nutzdaten)
+    if n < 126:
+        kopf = struct.pack("!BB", 0x80 | opcode, n)
+    elif n < 1 << 16:
+        kopf = struct.pack("!BBH", 0x80 | opcode, 126, n)
+    else:
+        kopf = struct.pack("!BBQ", 0x80 | opcode, 127, n)
+    return kopf + nutzdaten
+
+
+async def _rahmen_lesen(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    # Einen Rahmen vom Zuschauer lesen (die sind immer maskiert).
+    b0, b1 = await reader.readexactly(2)
+    laenge = b1 & 0x7F
+    if laenge == 126:
+        (laenge,) = struct.unpack("!H", await reader.readexactly(2))
+    elif laenge == 127:
+        (laenge,) = struct.unpack("!Q", await reader.readexactly(8))
+    if laenge > _MAX_NACHRICHT:
+        raise ValueError("Nachricht zu groß.")
+    maske = await reader.readexactly(4) if b1 & 0x80 else b"\0\0\0\0"
+    daten = await reader.readexactly(laenge)
+    return b0 & 0x0F, bytes(b ^ maske[i % 4] for i, b in enumerate(daten))
+
+
+class _Zuschauer:
+    # Eine WebSocket-Verbindung und ob sie als Nächstes ein vollständiges Bild braucht.
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.vollbild_noetig = True
+
+    def senden(self, opcode: int, nutzdaten: bytes) -> None:
+        # Nur in den Sendepuffer legen, nie warten.
+        self.writer.write(_rahmen(opcode, nutzdaten))
+
+    def puffer(self) -> int:
+        return self.writer.transport.get_write_buffer_size()
+
+
+# -------- Server --------
+
+class Fernansicht:
+    """Rechnet eine Welt im Hintergrund und zeigt sie per WebSocket an."""
+
+    def __init__(self, welt: Welt, *, host: str = "127.0.0.1", port: int = 8765,
+                 bilder_pro_s: float = 20.0, ticks_pro_s: float | None = None,
+                 ticks: int | None = None, puffer_grenze: int = 1 << 20):
+        self.welt = welt
+        self.host = host
+        self.port = port
+        # Mit port=0 sucht sich das System einen freien Port (steht nach starten() hier).
+        self.bilder_pro_s = bilder_pro_s
+        self.ticks_pro_s = ticks_pro_s
+        # None: so schnell wie möglich.
+        self.ticks = ticks
+        # None: ohne Ende, sonst nach so vielen Ticks anhalten (die Anzeige läuft weiter).
+        self.puffer_grenze = puffer_grenze
+
+        self.zuschauer: set[_Zuschauer] = set()
+        self.bilder_gesendet = 0
+        self.bilder_verworfen = 0
+        # Wie oft ein Zuschauer wegen vollem Sendepuffer ausgelassen wurde.
+
+        self._journal = welt.journal_anmelden()
+        self._gesendet_tick = welt.tick_nr
+        self._server: asyncio.base_events.Server | None = None
+        self._aufgaben: list[asyncio.Task] = []
+        self._verbindungen: set[asyncio.Task] = set()
+        self.fertig = asyncio.Event()
+        # Wird gesetzt, wenn die vorgegebene Anzahl Ticks erreicht ist.
+
+    # -------- Start / Stopp --------
+
+    async def starten(self) -> None:
+        self._server = await asyncio.start_server(self._verbindung, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._aufgaben = [asyncio.create_task(self._simulieren()),
+                          asyncio.create_task(self._bilder_schicken())]
+
+    async def beenden(self) -> None:
+        for aufgabe in self._aufgaben:
+            aufgabe.cancel()
+        await asyncio.gather(*self._aufgaben, return_exceptions=True)
+        self._aufgaben = []
+        for z in list(self.zuschauer):
+            z.writer.transport.abort()
+        # Die Verbindungsaufgaben enden dann von selbst (Lesen bricht ab).
+        await asyncio.gather(*self._verbindungen, return_exceptions=True)
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        self.welt.journal_abmelden(self._journal)
+
+    async def laufen(self) -> None:
+        # Starten und bis zum Abbruch (Strg+C) bedienen.
+        await self.starten()
+        print(f"Ansicht unter http://{self.host}:{self.port}/ (Strg+C beendet)")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await self.beenden()
+
+    # -------- Simulation und Bilder --------
+
+    async def _simulieren(self) -> None:
+        # Ticks in Scheiben von höchstens ~10 ms rechnen, dazwischen kommt der Server dran.
+        abstand = 1.0 / self.ticks_pro_s if self.ticks_pro_s else 0.0
+        naechster = perf_counter()
+        gerechnet = 0
+        while self.ticks is None or gerechnet < self.ticks:
+            ende = perf_counter() + 0.01
+            while perf_counter() < ende and (self.ticks is None or gerechnet < self.ticks):
+                if abstand and perf_counter() < naechster:
+                    break
+                self.welt.tick()
+                gerechnet += 1
+                naechster += abstand
+            warten = naechster - perf_counter() if abstand else 0.0
+            await asyncio.sleep(max(0.0, warten))
+        self.fertig.set()
+
+    async def _bilder_schicken(self) -> None:
+        while True:
+            await asyncio.sleep(1.0 / self.bilder_pro_s)
+            self.bild_senden()
+
+    def bild_senden(self) -> None:
+        # Änderungen seit dem letzten Bild an alle Zuschauer (jedes Bild wird nur einmal gebaut).
+        j = self._journal
+        geaendert = (self.welt.tick_nr != self._gesendet_tick or j.tiere_bewegt or j.tiere_weg
+                     or j.pflanzen_neu or j.pflanzen_weg)
+        aenderung = voll = None
+        for z in list(self.zuschauer):
+            if z.writer.is_closing():
+                continue
+            if z.puffer() > self.puffer_grenze:
+                z.vollbild_noetig = True
+                self.bilder_verworfen += 1
+                continue
+            if z.vollbild_noetig:
+                if voll is None:
+                    voll = vollbild(self.welt)
+                z.senden(_BINAER, voll)
+                z.vollbild_noetig = False
+            elif geaendert:
+                if aenderung is None:
+                    aenderung = delta(self.welt, j)
+                z.senden(_BINAER, aenderung)
+            else:
+                continue
+            self.bilder_gesendet += 1
+        j.leeren()
+        self._gesendet_tick = self.welt.tick_nr
+
+    # -------- Verbindungen --------
+
+    async def _verbindung(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        aufgabe = asyncio.current_task()
+        self._verbindungen.add(aufgabe)
+        try:
+            anfrage = await reader.readuntil(b"\r\n\r\n")
+            zeilen = anfrage.decode("latin-1").split("\r\n")
+            teile = zeilen[0].split()
+            pfad = teile[1] if len(teile) > 1 else "/"
+            kopf = {}
+            for zeile in zeilen[1:]:
+                name, _, wert = zeile.partition(":")
+                kopf[name.strip().lower()] = wert.strip()
+
+            if kopf.get("upgrade", "").lower() != "websocket":
+                self._seite_senden(writer, pfad)
+                await writer.drain()
+                return
+
+            schluessel = kopf.get("sec-websocket-key", "")
+            antwort = base64.b64encode(hashlib.sha1((schluessel + _WS_GUID).encode()).digest())
+            writer.write(b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n"
+                         b"Connection: Upgrade\r\nSec-WebSocket-Accept: " + antwort + b"\r\n\r\n")
+            z = _Zuschauer(writer)
+            z.senden(_TEXT, json.dumps({
+                "breite": self.welt.breite, "hoehe": self.welt.hoehe,
+                "arten": [[name, klasse.emoji] for name, klasse in ARTEN.items()],
+            }).encode("utf-8"))
+            self.zuschauer.add(z)
+            # Das vollständige Bild kommt mit dem nächsten Bildtakt.
+            try:
+                await self._zuhoeren(reader, z)
+            finally:
+                self.zuschauer.discard(z)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+            self._verbindungen.discard(aufgabe)
+
+    async def _zuhoeren(self, reader: asyncio.StreamReader, z: _Zuschauer) -> None:
+        # Nachrichten des Zuschauers: nur Ping und Schließen werden beantwortet.
+        while True:
+            opcode, daten = await _rahmen_lesen(reader)
+            if opcode == _SCHLIESSEN:
+                z.senden(_SCHLIESSEN, daten[:2])
+                return
+            if opcode == _PING:
+                z.senden(_PONG, daten)
+
+    def _seite_senden(self, writer: asyncio.StreamWriter, pfad: str) -> None:
+        if pfad not in ("/", "/index.html"):
+            writer.write(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            return
+        inhalt = SEITE.encode("utf-8")
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/html; charset=utf-8\r\n"
+                     b"Content-Length: " + str(len(inhalt)).encode() + b"\r\nConnection: close\r\n\r\n"
+                     + inhalt)
+
+
+SEITE = """<!DOCTYPE html>
+<html lang="de"><head><meta charset="utf-8"><title>Tiersimulation</title></head>
+<body style="font-family:sans-serif">
+<div id="status">verbinde …</div>
+<canvas id="bild" style="border:1px solid #888"></canvas>
+<script>
+const ZELLE = 12;
+const leinwand = document.getElementById("bild"), g = leinwand.getContext("2d");
+const status = document.getElementById("status");
+let arten = [], tick = 0, pflanzen = new Set(), tiere = new Map(), geplant = false;
+
+function lesen(puffer) {
+  const d = new DataView(puffer); let pos = 0;
+  const u32 = () => { const v = d.getUint32(pos, true); pos += 4; return v; };
+  const spalte = (n, f, b) => { const w = []; for (let i = 0; i < n; i++) { w.push(f(pos)); pos += b; } return w; };
+  const tiereLesen = n => {
+    const ids = spalte(n, p => d.getUint32(p, true), 4), xs = spalte(n, p => d.getFloat32(p, true), 4);
+    const ys = spalte(n, p => d.getFloat32(p, true), 4), as = spalte(n, p => d.getUint8(p), 1);
+    ids.forEach((id, i) => tiere.set(id, [as[i], xs[i], ys[i]]));
+  };
+  const zellen = (n, f) => { for (let i = 0; i < n; i++) { const x = u32(), y = u32(); f(x + "," + y); } };
+  const art = String.fromCharCode(d.getUint8(0)); pos = 1;
+  tick = Number(d.getBigUint64(pos, true)); pos += 8;
+  if (art === "V") {
+    const nP = u32(), nT = u32();
+    pflanzen = new Set(); tiere = new Map();
+    zellen(nP, k => pflanzen.add(k)); tiereLesen(nT);
+  } else {
+    const nB = u32(), nW = u32(), nN = u32(), nG = u32();
+    tiereLesen(nB);
+    for (let i = 0; i < nW; i++) tiere.delete(u32());
+    zellen(nN, k => pflanzen.add(k)); zellen(nG, k => pflanzen.delete(k));
+  }
+}
+
+function zeichnen() {
+  geplant = false;
+  g.fillStyle = "#fff"; g.fillRect(0, 0, leinwand.width, leinwand.height);
+  g.fillStyle = "#3a3";
+  for (const k of pflanzen) { const [x, y] = k.split(","); g.fillRect(x * ZELLE, y * ZELLE, ZELLE - 1, ZELLE - 1); }
+  g.font = ZELLE + "px sans-serif"; g.textAlign = "center"; g.textBaseline = "middle";
+  for (const [a, x, y] of tiere.values()) g.fillText(arten[a][1], (x + 0.5) * ZELLE, (y + 0.5) * ZELLE);
+  status.textContent = "Tick " + tick + " – " + tiere.size + " Tiere, " + pflanzen.size + " Pflanzen";
+}
+
+const ws = new WebSocket("ws://" + location.host + "/ws");
+ws.binaryType = "arraybuffer";
+ws.onmessage = e => {
+  if (typeof e.data === "string") {
+    const info = JSON.parse(e.data); arten = info.arten;
+    leinwand.width = info.breite * ZELLE; leinwand.height = info.hoehe * ZELLE;
+    return;
+  }
+  lesen(e.data);
+  if (!geplant) { geplant = true; requestAnimationFrame(zeichnen); }
+};
+ws.onclose = () => { status.textContent = "Verbindung beendet (Tick " + tick + ")"; };
+</script>
+</body></html>
+"""
+
+
+def main(argv: list[str] | None = None) -> None:
+    import batchlauf
+    # Welt aufbauen wie beim Headless-Lauf.
+
+    parser = argparse.ArgumentParser(description="Tiersimulation rechnen und im Browser ansehen.")
+    parser.add_argument("--breite", type=int, default=batchlauf.GRID_W)
+    parser.add_argument("--hoehe", type=int, default=batchlauf.GRID_H)
+    parser.add_argument("--pflanzen", type=int, default=100, help="Anzahl Startpflanzen")
+    parser.add_argument("--arten", default=batchlauf.STANDARD_ARTEN,
+                        help="Artenmischung, z. B. Loewe=2,Nilpferd=10")
+    parser.add_argument("--samen", type=int, default=7, help="Zufalls-Seed")
+    parser.add_argument("--laden", metavar="DATEI", help="gespeicherte Welt fortsetzen")
+    parser.add_argument("--ticks", type=int, default=None, help="nach N Ticks anhalten")
+    parser.add_argument("--ticks-pro-s", type=float, default=None,
+                        help="Ticks pro Sekunde begrenzen (Standard: so schnell wie möglich)")
+    parser.add_argument("--bilder-pro-s", type=float, default=20.0)
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="Adresse, an die der Server gebunden wird (Standard: nur lokal)")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    if args.laden:
+        welt = Welt.load(args.laden)
+    else:
+        try:
+            arten = batchlauf.arten_lesen(args.arten)
+        except ValueError as fehler:
+            parser.error(str(fehler))
+        welt = batchlauf.welt_erzeugen(args.breite, args.hoehe, args.pflanzen, arten, args.samen)
+
+    ansicht = Fernansicht(welt, host=args.host, port=args.port, bilder_pro_s=args.bilder_pro_s,
+                          ticks_pro_s=args.ticks_pro_s, ticks=args.ticks)
+    try:
+        asyncio.run(ansicht.laufen())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
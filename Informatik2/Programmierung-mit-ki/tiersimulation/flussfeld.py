@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+Flussfeld zur nächsten Pflanze für die Tiersimulation (tiersimulationV3.py).
+
+Statt dass jeder Pflanzenfresser selbst das Raster um sich herum absucht, steht für jede Zelle
+fertig im Feld, wo die nächste Pflanze liegt (höchstens "radius" Zellen weit). Damit ist die
+Entscheidung eines Pflanzenfressers ein Arrayzugriff.
+
+Gespeichert wird pro Zelle nur eine kleine Zahl, der "Rang": Alle Versätze (dx, dy) im Umkreis
+sind einmal nach Abstand sortiert (bei Gleichstand wie PflanzenRaster.naechste: nähere Zeile,
+obere Zeile, linke Zelle). Rang r heißt: die nächste Pflanze liegt bei Zelle + versatz[r].
+Daraus folgen Abstand und Richtung, und "besser" ist einfach "kleinerer Rang".
+
+Das Feld hängt an einem Journal der Welt (wie die Anzeige, aber nur für Pflanzen) und wird vor
+jeder Abfrage nachgeführt:
+    - neue Pflanze:     im Fenster um sie bekommt jede Zelle mit schlechterem Rang den neuen,
+    - Pflanze gefressen: Zellen, deren Ziel sie war, werden als "unbekannt" markiert und erst
+                         bei ihrer nächsten Abfrage lokal neu gesucht (Umkreissuche im Raster).
+Bei sehr vielen Änderungen auf einmal (flächiges Wachstum) wird das ganze Feld mit NumPy neu gebaut.
+
+Wichtig: Das Feld kennt die nächste Pflanze zur MITTE der Zelle, auf der ein Tier steht,
+nicht zu seiner genauen Position. Die liegt bis zu s = sqrt(0.5) ≈ 0.71 neben der Mitte, also ist
+jede andere Pflanze von ihr mindestens (Abstand zur Mitte) - s entfernt. Nur wenn die nachgeschlagene
+Pflanze von der genauen Position aus näher liegt als diese Schranke, steht sie sicher fest; sonst
+sucht naechste im Raster wie ohne Feld, aber nur bis zu ihrem Abstand (ebenso, wenn der Umkreis des
+Felds für "max_dist" nicht reicht).
+Das Ergebnis ist damit immer dasselbe wie mit PflanzenRaster.naechste; das Feld spart nur die Suche
+in den eindeutigen Fällen. Nachprüfen: python -m flussfeld (siehe pruefe_gleichheit).
+
+Beispiel:
+    welt.flussfeld = Flussfeld(welt)
+    for _ in range(1000):
+        welt.tick()
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from tiersimulationV3 import INDEX_ZELLE, Welt
+
+
+class Flussfeld:
+    """Rang der nächsten Pflanze für jede Zelle einer Welt, inkrementell nachgeführt."""
+
+    UNBEKANNT = -1
+    # Rang einer Zelle, deren Ziel gefressen wurde und die noch nicht neu gesucht ist.
+
+    def __init__(self, welt: Welt, radius: int = INDEX_ZELLE):
+        self.welt = welt
+        self.radius = r = int(radius)
+        # Reicht für alle Sichtweiten der Pflanzenfresser (6.0) plus den Weg zur Zellmitte.
+
+        versaetze = [(dx, dy) for dy in range(-r, r + 1) for dx in range(-r, r + 1) if dx * dx + dy * dy <= r * r]
+        versaetze.sort(key=lambda v: (v[0] * v[0] + v[1] * v[1], abs(v[1]), v[1], v[0]))
+        self._dx = [v[0] for v in versaetze]
+        self._dy = [v[1] for v in versaetze]
+        # Versatz zur Pflanze für jeden Rang (als Listen: schneller Einzelzugriff).
+
+        self.KEINE = len(versaetze)
+        # Rang für "keine Pflanze im Umkreis" (schlechter als jeder echte Rang).
+
+        tabelle = np.full((2 * r + 1, 2 * r + 1), self.KEINE, dtype=np.int16)
+        for rang, (dx, dy) in enumerate(versaetze):
+            tabelle[dy + r, dx + r] = rang
+        self._rang_von = tabelle
+        # Versatz (dx, dy) -> Rang, als Tabelle [dy + r, dx + r].
+        self._rang_zur_mitte = tabelle[::-1, ::-1]
+        # Gespiegelt: für eine Zelle im Fenster um eine Pflanze der Rang des Versatzes zur Pflanze.
+
+        zellen = welt.breite * welt.hoehe
+        self.neu_ab = max(256, zellen // 500)
+        # Ab so vielen Pflanzenänderungen seit der letzten Abfrage lohnt der Neubau des ganzen Felds.
+
+        self.rang = np.full((welt.hoehe, welt.breite), self.KEINE, dtype=np.int16)
+        self._journal = welt.journal_anmelden(tiere=False)
+        # Nur Pflanzenänderungen: Tierbewegungen braucht das Feld nicht.
+        self.neu_berechnen()
+
+    # -------- Aufbau / Nachführen --------
+
+    def neu_berechnen(self) -> None:
+        # Ganzes Feld aus dem Raster: Versätze vom schlechtesten zum besten Rang eintragen,
+        # der beste (zuletzt geschriebene) bleibt stehen. Ein NumPy-Schritt pro Versatz.
+        h, b = self.rang.shape
+        pflanzen = self.welt.pflanzen.als_array().view(bool)
+        self.rang.fill(self.KEINE)
+        for rang in range(self.KEINE - 1, -1, -1):
+            dx, dy = self._dx[rang], self._dy[rang]
+            x0, x1 = max(0, -dx), min(b, b - dx)
+            y0, y1 = max(0, -dy), min(h, h - dy)
+            if x0 >= x1 or y0 >= y1:
+                continue
+            ziel = self.rang[y0:y1, x0:x1]
+            ziel[pflanzen[y0 + dy:y1 + dy, x0 + dx:x1 + dx]] = rang
+        self._journal.leeren()
+
+    def _fenster(self, x: int, y: int):
+        # Ausschnitt des Felds um Zelle (x, y) und der passende Ausschnitt der Rangtabelle.
+        r = self.radius
+        h, b = self.rang.shape
+        x0, x1 = max(0, x - r), min(b, x + r + 1)
+        y0, y1 = max(0, y - r), min(h, y + r + 1)
+        feld = self.rang[y0:y1, x0:x1]
+        tabelle = self._rang_zur_mitte[y0 - y + r:y1 - y + r, x0 - x + r:x1 - x + r]
+        return feld, tabelle
+
+    def _pflanze_neu(self, zelle: tuple[int, int]) -> None:
+        feld, tabelle = self._fenster(*zelle)
+        besser = (tabelle < feld) & (feld != self.UNBEKANNT)
+        # Unbekannte Zellen bleiben unbekannt: ihr altes Ziel könnte noch besser gewesen sein.
+        feld[besser] = tabelle[besser]
+
+    def _pflanze_weg(self, zelle: tuple[int, int]) -> None:
+        feld, tabelle = self._fenster(*zelle)
+        feld[(feld == tabelle) & (tabelle != self.KEINE)] = self.UNBEKANNT
+        # Genau die Zellen, deren Ziel diese Pflanze war.
+
+    def _abgleichen(self) -> None:
+        # Änderungen aus dem Journal übernehmen (zuerst die gefressenen, dann die neuen Pflanzen).
+        j = self._journal
+        if not (j.pflanzen_weg or j.pflanzen_neu):
+            return
+        if len(j.pflanzen_weg) + len(j.pflanzen_neu) > self.neu_ab:
+            self.neu_berechnen()
+            return
+        for zelle in j.pflanzen_weg:
+            self._pflanze_weg(zelle)
+        for zelle in j.pflanzen_neu:
+            self._pflanze_neu(zelle)
+        j.leeren()
+
+    def _zelle_suchen(self, x: int, y: int) -> int:
+        # Rang einer unbekannten Zelle über die Umkreissuche im Raster bestimmen.
+        treffer = self.welt.pflanzen.naechste(x, y, self.radius)
+        if treffer is None:
+            return self.KEINE
+        r = self.radius
+        return int(self._rang_von[treffer[1] - y + r, treffer[0] - x + r])
+
+    def reparieren(self) -> None:
+        # Alle unbekannten Zellen sofort neu suchen (sonst geschieht das erst bei ihrer Abfrage).
+        self._abgleichen()
+        ys, xs = np.nonzero(self.rang == self.UNBEKANNT)
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            self.rang[y, x] = self._zelle_suchen(x, y)
+
+    def abmelden(self) -> None:
+        # Journal bei der Welt abmelden (danach wird das Feld nicht mehr nachgeführt).
+        self.welt.journal_abmelden(self._journal)
+
+    # -------- Abfragen --------
+
+    def naechste(self, x: float, y: float, max_dist: float):
+        # Wie PflanzenRaster.naechste: (px, py, Abstand) oder None – aber per Nachschlagen.
+        self._abgleichen()
+        h, b = self.rang.shape
+        cx = min(max(round(x), 0), b - 1)
+        cy = min(max(round(y), 0), h - 1)
+        rang = int(self.rang[cy, cx])
+        if rang == self.UNBEKANNT:
+            rang = self._zelle_suchen(cx, cy)
+            self.rang[cy, cx] = rang
+        if rang == self.KEINE:
+            return None
+        versatz = math.hypot(x - cx, y - cy)
+        # Wie weit die genaue Position neben der Zellmitte liegt (höchstens ≈ 0.71).
+        if rang == self.KEINE:
+            if max_dist + versatz <= self.radius:
+                return None
+                # Nichts im Umkreis der Mitte, also auch nichts im Umkreis "max_dist" um (x, y).
+            return self.welt.pflanzen.naechste(x, y, max_dist)
+        px, py = cx + self._dx[rang], cy + self._dy[rang]
+        d = math.hypot(px - x, py - y)
+        if d < math.hypot(self._dx[rang], self._dy[rang]) - versatz - 1e-9:
+            return (px, py, d) if d <= max_dist else None
+            # Jede andere Pflanze ist von (x, y) mindestens (Abstand zur Mitte - versatz) weit weg:
+            # Diese hier ist sicher die nächste.
+        return self.welt.pflanzen.naechste(x, y, min(max_dist, d + 1e-9))
+        # Eine andere Pflanze könnte von der genauen Position aus näher (oder gleich nah) sein.
+        # Weiter als d kann die nächste nicht liegen: Die Suche im Raster bleibt klein.
+
+    def kandidaten(self, x: float, y: float, max_dist: float) -> int:
+        # Für den TickProfiler: Eine Abfrage prüft einen Eintrag (ohne die Suche im Raster als Rückfall).
+        return 1
+
+    def abstand(self) -> np.ndarray:
+        # Abstand jeder Zellmitte zur nächsten Pflanze (inf: keine im Umkreis).
+        self.reparieren()
+        tabelle = np.append(np.hypot(self._dx, self._dy), np.inf).astype(np.float32)
+        return tabelle[self.rang]
+
+    def richtung(self) -> tuple[np.ndarray, np.ndarray]:
+        # Versatz (dx, dy) jeder Zelle zu ihrer nächsten Pflanze ((0, 0): keine im Umkreis).
+        self.reparieren()
+        dx = np.append(np.array(self._dx, dtype=np.int16), 0)
+        dy = np.append(np.array(self._dy, dtype=np.int16), 0)
+        return dx[self.rang], dy[self.rang]
+
+
+def pruefe_gleichheit(breite: int = 200, hoehe: int = 150, pflanzen: int = 300, abfragen: int = 100_000,
+                      max_dist: float = 6.0, samen: int = 7) -> None:
+    # Flussfeld und Umkreissuche im Raster müssen an zufälligen Positionen dasselbe liefern,
+    # auch nachdem Pflanzen gefressen wurden und nachgewachsen sind (inkrementelles Nachführen).
+    welt = Welt(breite, hoehe, samen=samen)
+    welt.add_pflanzen_random(pflanzen)
+    feld = Flussfeld(welt)
+    rng = welt.rng
+    for _ in range(4):
+        for _ in range(abfragen // 4):
+            x = rng.uniform(0, breite - 1)
+            y = rng.uniform(0, hoehe - 1)
+            a = feld.naechste(x, y, max_dist)
+            b = welt.pflanzen.naechste(x, y, max_dist)
+            if a != b:
+                raise AssertionError(f"Abweichung bei ({x}, {y}): Flussfeld {a} != Raster {b}")
+        for _ in range(pflanzen // 4):
+            zelle = (rng.randrange(breite), rng.randrange(hoehe))
+            if zelle in welt.pflanzen:
+                welt.pflanze_entfernen(zelle)
+            else:
+                welt.pflanze_setzen(zelle)
+        # Zwischen den Runden ein Viertel der Pflanzenzahl fressen bzw. nachwachsen lassen.
+
+
+if __name__ == "__main__":
+    pruefe_gleichheit()
+    print("Flussfeld liefert dieselben Ergebnisse wie die Umkreissuche im Raster.")
@@ -0,0 +1,431 @@
+# -*- coding: utf-8 -*-
+"""
+Gekachelte Welt für sehr große Karten: ein Tick auf mehreren Prozessorkernen.
+
+Die Karte wird in kx * ky rechteckige Kacheln geteilt. Alle Tierspalten (wie in VektorWelt)
+und das Pflanzenraster liegen in gemeinsamem Speicher (multiprocessing.shared_memory); jeder
+Arbeiterprozess rechnet die Tiere "seiner" Kachel und schreibt nur deren Zeilen bzw. nur die
+Pflanzenzellen der Kachel. Jäger sehen über Kachelgrenzen hinweg; Jagden werden danach im
+Hauptprozess in einer festen Reihenfolge aufgelöst ("Grenzaustausch").
+
+Regeln pro Tick (synchron: alle Entscheidungen beruhen auf dem Stand zu Tickbeginn):
+    - Ein Tier gehört zu der Kachel, in der seine gerundete Zelle liegt.
+    - Pflanzenfresser auf einer Pflanzen-Zelle weiden; stehen mehrere auf derselben Zelle,
+      bekommt sie das Tier mit dem kleinsten Index (wie VektorWelt). Alle Tiere einer Zelle
+      liegen in derselben Kachel, das kann also jede Kachel allein entscheiden.
+    - Fleischfresser suchen wie Tier._tick_fleischfresser den nächsten Pflanzenfresser in ihrer
+      Sichtweite (bei gleichem Abstand den kleineren Index). Ist er höchstens 1 entfernt, jagen
+      sie ihn und bleiben stehen; sonst gehen sie einen Schritt auf ihn zu. Beanspruchen mehrere
+      Jäger dieselbe Beute, bekommt sie der nächste Jäger, bei gleichem Abstand der mit dem
+      kleineren Index. Die anderen gehen leer aus. Erlegte Tiere verschwinden am Ende des Ticks.
+    - Sonst: unter der Energieschwelle schlafen, darüber in zufällige Richtung wandern.
+    - Den Winkel zum Wandern berechnet jede Kachel für ihre Tiere selbst, aus einem
+      Zufallsstrom (zufallsstrom.py): Er hängt nur von Samen, Tick und Platz des Tiers ab.
+
+Dadurch ist das Ergebnis (welche Tiere überleben, Positionen, Energie) unabhängig davon,
+in wie viele Kacheln geteilt wird und wie viele Prozesse rechnen – auch prozesse=0
+(alles im Hauptprozess) liefert exakt dasselbe.
+
+Beispiel:
+    with KachelWelt(2000, 2000, kapazitaet=500_000, kacheln=(4, 4), prozesse=4) as kw:
+        kw.add_tiere(Nilpferd, 400_000)
+        kw.add_tiere(Loewe, 100_000)
+        kw.add_pflanzen_random(400_000)
+        for _ in range(100):
+            kw.tick()
+        print(kw.zaehlen())
+"""
+
+from __future__ import annotations
+
+import math
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from tiersimulationV3 import (ERHOLUNG_PRO_STUNDE, MUEDE_FLEISCHFRESSER, MUEDE_PFLANZENFRESSER, Nahrung,
+                              Tier, Welt)
+from vektorwelt import Art, bewegen, verbrauch
+from zufallsstrom import Zufallsstrom
+
+JAGD_DISTANZ = 1.0
+# Wie Tier._tick_fleischfresser: ab diesem Abstand ist die Beute "erwischt".
+
+_SPALTEN = (
+    ("x", np.float64), ("y", np.float64), ("x_neu", np.float64), ("y_neu", np.float64),
+    ("energie", np.int32), ("schrittweite", np.float64), ("pflanzenfresser", np.bool_),
+    ("art", np.int16), ("lebt", np.bool_),
+    ("beute", np.int64), ("beute_dist", np.float64),
+    ("reihenfolge", np.int64), ("beute_schluessel", np.int64), ("beute_slots", np.int64),
+)
+# Alle Spalten haben eine Zeile pro Tierplatz (kapazitaet).
+
+
+class Speicher:
+    """
+    Benannte NumPy-Arrays in gemeinsamem Speicher.
+    Der Hauptprozess legt sie an (anlegen), Arbeiter hängen sich per Beschreibung an (anhaengen).
+    """
+
+    def __init__(self):
+        self.arrays: dict[str, np.ndarray] = {}
+        self._bloecke: list[shared_memory.SharedMemory] = []
+        self._besitzer = False
+        self.beschreibung: dict[str, tuple[str, str, tuple]] = {}
+        # Name -> (Speichername, dtype, Form): genug, damit ein anderer Prozess die Arrays findet.
+
+    @classmethod
+    def anlegen(cls, formen: dict[str, tuple[tuple, type]]) -> Speicher:
+        sp = cls()
+        sp._besitzer = True
+        for name, (form, dtype) in formen.items():
+            groesse = max(1, int(np.prod(form)) * np.dtype(dtype).itemsize)
+            block = shared_memory.SharedMemory(create=True, size=groesse)
+            sp._bloecke.append(block)
+            sp.arrays[name] = np.ndarray(form, dtype=dtype, buffer=block.buf)
+            sp.arrays[name][...] = 0
+            sp.beschreibung[name] = (block.name, np.dtype(dtype).str, form)
+        return sp
+
+    @classmethod
+    def anhaengen(cls, beschreibung: dict) -> Speicher:
+        sp = cls()
+        sp.beschreibung = beschreibung
+        for name, (blockname, dtype, form) in beschreibung.items():
+            block = shared_memory.SharedMemory(name=blockname)
+            sp._bloecke.append(block)
+            sp.arrays[name] = np.ndarray(form, dtype=dtype, buffer=block.buf)
+        return sp
+
+    def schliessen(self) -> None:
+        # Views zuerst loslassen, sonst kann der Speicher nicht geschlossen werden.
+        self.arrays.clear()
+        for block in self._bloecke:
+            block.close()
+            if self._besitzer:
+                block.unlink()
+        self._bloecke.clear()
+
+
+def _suchringe(sichtweite: float) -> tuple[list[tuple[int, int]], list[float]]:
+    """
+    Zellversätze (dx, dy) für die Beutesuche, nach dem kleinstmöglichen Abstand zweier Tiere in
+    den beiden Zellen sortiert (jedes steht höchstens 0.5 von seiner Zellmitte), dazu diese
+    Abstände. Versätze, die schon weiter als "sichtweite" sind, fehlen.
+    """
+    halo = int(sichtweite) + 1
+    versaetze = []
+    for dy in range(-halo, halo + 1):
+        for dx in range(-halo, halo + 1):
+            mindest = math.hypot(max(abs(dx) - 1, 0), max(abs(dy) - 1, 0))
+            if mindest <= sichtweite:
+                versaetze.append((mindest, dx, dy))
+    versaetze.sort()
+    return [(dx, dy) for _, dx, dy in versaetze], [m for m, _, _ in versaetze]
+
+
+# -------- Arbeiterseite --------
+
+_SPEICHER: Speicher | None = None
+_KONSTANTEN: dict | None = None
+# Im Arbeiterprozess, gesetzt von _arbeiter_start. Der Speicher bleibt so lange angehängt
+# (und seine Blöcke offen), wie der Arbeiter lebt.
+
+
+def _arbeiter_start(beschreibung: dict, konstanten: dict) -> None:
+    global _SPEICHER, _KONSTANTEN
+    _SPEICHER = Speicher.anhaengen(beschreibung)
+    _KONSTANTEN = konstanten
+
+
+def _kachel_aufgabe(aufgabe: tuple[int, int, int, int]) -> None:
+    # Einstieg im Arbeiterprozess.
+    kachel_schritt(_SPEICHER.arrays, _KONSTANTEN, *aufgabe)
+
+
+def kachel_schritt(a: dict, k: dict, start: int, ende: int, n_beute: int, tick: int) -> None:
+    """
+    Einen Tick für die Tiere a["reihenfolge"][start:ende] (eine Kachel, Indizes aufsteigend).
+    Liest alle Spalten nur im Stand zu Tickbeginn und schreibt ausschließlich die eigenen
+    Zeilen (x_neu, y_neu, energie, beute, beute_dist) und Pflanzenzellen der eigenen Kachel.
+    """
+    breite, hoehe = k["breite"], k["hoehe"]
+    idx = a["reihenfolge"][start:ende]
+    x = a["x"][idx]
+    y = a["y"][idx]
+    energie = a["energie"][idx]
+    pf = a["pflanzenfresser"][idx]
+    aktiv = energie > 0
+    zx = np.rint(x).astype(np.intp)
+    zy = np.rint(y).astype(np.intp)
+
+    # 1) Weiden: kleinster Index pro Zelle gewinnt (idx ist aufsteigend sortiert).
+    pflanzen = a["pflanzen"]
+    fresser = np.flatnonzero(aktiv & pf & pflanzen[zy, zx])
+    if len(fresser):
+        _, erste = np.unique(zy[fresser] * breite + zx[fresser], return_index=True)
+        fresser = fresser[erste]
+        energie[fresser] = np.minimum(100, energie[fresser] + k["fressgewinn"][a["art"][idx[fresser]]])
+        pflanzen[zy[fresser], zx[fresser]] = False
+    beschaeftigt = np.zeros(len(idx), dtype=bool)
+    beschaeftigt[fresser] = True
+
+    # 2) Jagen: nächster Pflanzenfresser in Sichtweite (auch aus Nachbarkacheln).
+    jaeger = np.flatnonzero(aktiv & ~pf)
+    ziel = np.full(len(jaeger), -1, dtype=np.int64)
+    beste = np.full(len(jaeger), np.inf)
+    bx, by = a["x"], a["y"]
+    jx, jy = x[jaeger], y[jaeger]
+    if len(jaeger) and n_beute:
+        schluessel = a["beute_schluessel"][:n_beute]
+        slots = a["beute_slots"][:n_beute]
+        sicht = k["sichtweite"][a["art"][idx[jaeger]]]
+        versaetze, mindest = _suchringe(float(sicht.max()))
+        offen = np.arange(len(jaeger))
+        # Jäger, deren Ergebnis sich in weiteren Zellen noch ändern kann.
+        for i, (dx, dy) in enumerate(versaetze):
+            cx = zx[jaeger[offen]] + dx
+            cy = zy[jaeger[offen]] + dy
+            gueltig = (cx >= 0) & (cx < breite) & (cy >= 0) & (cy < hoehe)
+            zelle = cy * breite + cx
+            von = np.searchsorted(schluessel, zelle, "left")
+            bis = np.where(gueltig, np.searchsorted(schluessel, zelle, "right"), von)
+            # Eine Zelle kann mehrere Pflanzenfresser enthalten: der Reihe nach prüfen.
+            for nr in range(int((bis - von).max(initial=0))):
+                hat = von + nr < bis
+                kandidat = slots[np.minimum(von + nr, n_beute - 1)]
+                d = np.hypot(bx[kandidat] - jx[offen], by[kandidat] - jy[offen])
+                besser = hat & (d <= sicht[offen]) & (
+                    (d < beste[offen]) | ((d == beste[offen]) & (kandidat < ziel[offen]))
+                )
+                beste[offen[besser]] = d[besser]
+                ziel[offen[besser]] = kandidat[besser]
+            if i + 1 < len(versaetze):
+                naechster = mindest[i + 1]
+                offen = offen[(beste[offen] >= naechster) & (sicht[offen] >= naechster)]
+                # Alle weiteren Zellen sind mindestens "naechster" entfernt: Wer schon näher
+                # etwas gefunden hat oder nicht so weit sieht, ist fertig.
+                if not len(offen):
+                    break
+        beschaeftigt[jaeger[ziel >= 0]] = True
+    erwischt = beste <= JAGD_DISTANZ
+    a["beute"][idx[jaeger]] = np.where(erwischt, ziel, -1)
+    a["beute_dist"][idx[jaeger]] = beste
+    # Nur erwischte Beute wird beansprucht (beute_dist zählt nur dort).
+    jagt = np.flatnonzero((ziel >= 0) & ~erwischt)
+    # Beute gesehen, aber weiter als 1 entfernt: ein Schritt auf sie zu (unten in 4).
+
+    # 3) Schlafen unter der Energieschwelle.
+    schwelle = np.where(pf, MUEDE_PFLANZENFRESSER, MUEDE_FLEISCHFRESSER)
+    schlaeft = aktiv & ~beschaeftigt & (energie < schwelle)
+    energie[schlaeft] = np.minimum(100, energie[schlaeft] + ERHOLUNG_PRO_STUNDE)
+
+    # 4) Wandern; die Winkel hängen nur von (Samen, Tick, Platz) ab, nicht von der Kachel.
+    #    Verfolger gehen stattdessen in Richtung ihrer Beute (Stand zu Tickbeginn).
+    laeuft = np.flatnonzero(aktiv & ~beschaeftigt & ~schlaeft)
+    winkel = k["strom"].winkel_viele(tick, idx[laeuft])
+    beute = ziel[jagt]
+    laeuft = np.concatenate([laeuft, jaeger[jagt]])
+    winkel = np.concatenate([winkel, np.arctan2(by[beute] - jy[jagt], bx[beute] - jx[jagt])])
+    schritt = a["schrittweite"][idx[laeuft]]
+    nx, ny = x.copy(), y.copy()
+    nx[laeuft], ny[laeuft], _ = bewegen(x[laeuft], y[laeuft], winkel, schritt, breite, hoehe)
+    energie[laeuft] = np.maximum(0, energie[laeuft] - verbrauch(schritt))
+
+    a["x_neu"][idx] = nx
+    a["y_neu"][idx] = ny
+    a["energie"][idx] = energie
+
+
+# -------- Hauptprozess --------
+
+class KachelWelt:
+    """
+    Welt in Spaltenform wie VektorWelt, aber mit fester Kapazität in gemeinsamem Speicher
+    und kachelweise parallelem Tick. Nach Gebrauch schliessen() aufrufen (oder "with" benutzen),
+    sonst bleiben die Speicherblöcke bis zum Programmende liegen.
+    """
+
+    def __init__(self, breite: int, hoehe: int, kapazitaet: int, *, kacheln: tuple[int, int] = (2, 2),
+                 prozesse: int | None = None, samen: int | None = 7):
+        self.breite = breite
+        self.hoehe = hoehe
+        self.kapazitaet = kapazitaet
+        self.kacheln = kacheln
+        self.rng = np.random.default_rng(samen)
+        self.strom = Zufallsstrom(samen)
+        # rng für den Aufbau, strom für die Ticks (wie VektorWelt).
+        self.arten: list[Art] = []
+        self._art_nr: dict[type, int] = {}
+        self.namen: list[str] = []
+        self.anzahl = 0
+        # Belegte Plätze (lebende und erlegte); erlegte Plätze werden nicht wiederverwendet.
+        self.ticks = 0
+
+        formen = {name: ((kapazitaet,), dtype) for name, dtype in _SPALTEN}
+        formen["pflanzen"] = ((hoehe, breite), np.bool_)
+        self._speicher = Speicher.anlegen(formen)
+        self.a = self._speicher.arrays
+        # Kurzname für die Spalten, z. B. self.a["energie"].
+
+        self.prozesse = multiprocessing.cpu_count() if prozesse is None else prozesse
+        self._pool = None
+        # Wird erst beim ersten Tick gestartet, wenn die Artentabelle feststeht.
+
+    def __enter__(self) -> KachelWelt:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.schliessen()
+
+    def schliessen(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        self.a = None
+        self._speicher.schliessen()
+
+    @property
+    def pflanzen(self) -> np.ndarray:
+        return self.a["pflanzen"]
+
+    # -------- Aufbau --------
+
+    @classmethod
+    def aus_welt(cls, welt: Welt, **kw) -> KachelWelt:
+        # Bestehende objektbasierte Welt übernehmen (Reihenfolge der Tiere = Index).
+        kw.setdefault("kapazitaet", max(1, len(welt.tiere)))
+        kw_welt = cls(welt.breite, welt.hoehe, **kw)
+        kw_welt.pflanzen[:] = welt.pflanzen.als_array() != 0
+        for t in welt.tiere:
+            kw_welt.add_tiere(type(t), 1, namen=[t.name], x=[t.x], y=[t.y])
+            kw_welt.a["energie"][kw_welt.anzahl - 1] = t.energie
+        return kw_welt
+
+    def _art_index(self, klasse: type[Tier]) -> int:
+        if klasse not in self._art_nr:
+            if self._pool is not None:
+                raise RuntimeError("Neue Arten nur vor dem ersten Tick hinzufügen.")
+            self._art_nr[klasse] = len(self.arten)
+            self.arten.append(Art(klasse("vorlage")))
+        return self._art_nr[klasse]
+
+    def add_pflanzen_random(self, anzahl: int) -> None:
+        self.pflanzen[self.rng.integers(0, self.hoehe, anzahl), self.rng.integers(0, self.breite, anzahl)] = True
+
+    def add_tiere(self, klasse: type[Tier], anzahl: int, *, namen: list[str] | None = None,
+                  x=None, y=None) -> None:
+        # Wie VektorWelt.add_tiere, aber in die nächsten freien Plätze.
+        if self.anzahl + anzahl > self.kapazitaet:
+            raise ValueError(f"Kapazität {self.kapazitaet} reicht nicht für {self.anzahl + anzahl} Tiere.")
+        nr = self._art_index(klasse)
+        art = self.arten[nr]
+        if namen is None:
+            namen = [f"{art.name}{self.anzahl + i}" for i in range(anzahl)]
+        self.namen.extend(namen)
+        if x is None:
+            x = self.rng.uniform(0, self.breite - 1, anzahl)
+        if y is None:
+            y = self.rng.uniform(0, self.hoehe - 1, anzahl)
+
+        neu = slice(self.anzahl, self.anzahl + anzahl)
+        a = self.a
+        a["x"][neu] = x
+        a["y"][neu] = y
+        a["energie"][neu] = 100
+        a["schrittweite"][neu] = art.schrittweite
+        a["pflanzenfresser"][neu] = art.nahrung == Nahrung.PFLANZENFRESSER
+        a["art"][neu] = nr
+        a["lebt"][neu] = True
+        self.anzahl += anzahl
+
+    # -------- Simulation --------
+
+    def _konstanten(self) -> dict:
+        return {
+            "breite": self.breite, "hoehe": self.hoehe,
+            "fressgewinn": np.array([art.fressgewinn for art in self.arten], dtype=np.int32),
+            "sichtweite": np.array([art.sichtweite for art in self.arten]),
+            "strom": self.strom,
+        }
+
+    def _aufgaben_planen(self) -> list[tuple[int, int, int, int]]:
+        # Lebende Tiere nach Kachel sortieren und die Beute-Suchtabelle aufbauen.
+        a = self.a
+        n = self.anzahl
+        lebend = np.flatnonzero(a["lebt"][:n])
+        zx = np.rint(a["x"][lebend]).astype(np.int64)
+        zy = np.rint(a["y"][lebend]).astype(np.int64)
+        kx, ky = self.kacheln
+        kachel = (zy * ky // self.hoehe) * kx + (zx * kx // self.breite)
+        ordnung = np.argsort(kachel, kind="stable")
+        a["reihenfolge"][:len(lebend)] = lebend[ordnung]
+        grenzen = np.searchsorted(kachel[ordnung], np.arange(kx * ky + 1))
+
+        # Pflanzenfresser nach Zelle sortiert (bei gleicher Zelle nach Index) für die Jagd.
+        pf = a["pflanzenfresser"][lebend]
+        schluessel = (zy * self.breite + zx)[pf]
+        ordnung = np.argsort(schluessel, kind="stable")
+        n_beute = len(schluessel)
+        a["beute_schluessel"][:n_beute] = schluessel[ordnung]
+        a["beute_slots"][:n_beute] = lebend[pf][ordnung]
+
+        return [(int(grenzen[i]), int(grenzen[i + 1]), n_beute, self.ticks)
+                for i in range(kx * ky) if grenzen[i + 1] > grenzen[i]]
+
+    def tick(self, chance_nachwachsen: float = 0.06) -> None:
+        a = self.a
+        n = self.anzahl
+        a["beute"][:n] = -1
+
+        aufgaben = self._aufgaben_planen()
+        if self.prozesse > 1 and len(aufgaben) > 1:
+            if self._pool is None:
+                self._pool = multiprocessing.Pool(
+                    self.prozesse, _arbeiter_start, (self._speicher.beschreibung, self._konstanten())
+                )
+            self._pool.map(_kachel_aufgabe, aufgaben)
+        else:
+            konstanten = self._konstanten()
+            for aufgabe in aufgaben:
+                kachel_schritt(a, konstanten, *aufgabe)
+
+        # Neue Positionen übernehmen (erlegte Tiere behalten einfach ihren letzten Platz).
+        lebend = a["lebt"][:n]
+        a["x"][:n] = np.where(lebend, a["x_neu"][:n], a["x"][:n])
+        a["y"][:n] = np.where(lebend, a["y_neu"][:n], a["y"][:n])
+
+        self._jagden_aufloesen()
+
+        zelle = self.strom.nachwuchs(self.ticks, chance_nachwachsen, self.breite, self.hoehe)
+        if zelle is not None:
+            self.pflanzen[zelle[1], zelle[0]] = True
+        self.ticks += 1
+
+    def _jagden_aufloesen(self) -> None:
+        # Grenzaustausch: jede Beute an den nächsten Jäger (bei Gleichstand kleinerer Index).
+        a = self.a
+        jaeger = np.flatnonzero(a["beute"][:self.anzahl] >= 0)
+        if not len(jaeger):
+            return
+        beute = a["beute"][jaeger]
+        ordnung = np.lexsort((jaeger, a["beute_dist"][jaeger], beute))
+        jaeger, beute = jaeger[ordnung], beute[ordnung]
+        erster = np.ones(len(beute), dtype=bool)
+        erster[1:] = beute[1:] != beute[:-1]
+        jaeger, beute = jaeger[erster], beute[erster]
+
+        gewinn = self._konstanten()["fressgewinn"][a["art"][jaeger]]
+        a["energie"][jaeger] = np.minimum(100, a["energie"][jaeger] + gewinn)
+        a["lebt"][beute] = False
+
+    # -------- Auswertung --------
+
+    def zaehlen(self) -> dict[str, int]:
+        # Anzahl lebender Tiere pro Art.
+        a = self.a
+        lebend = a["lebt"][:self.anzahl]
+        anzahl = np.bincount(a["art"][:self.anzahl][lebend], minlength=len(self.arten))
+        return {art.name: int(k) for art, k in zip(self.arten, anzahl)}
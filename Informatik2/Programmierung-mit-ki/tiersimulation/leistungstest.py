@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+Reproduzierbarer Leistungstest für alle drei Fassungen der Tiersimulation
+(tiersimulation.py = V1, tiersimulationV2.py = V2, tiersimulationV3.py = V3).
+
+Jede Fassung läuft durch dieselben Szenarien mit festen Samen:
+
+    duenn            große Fläche, wenige Tiere, kaum Pflanzen
+    pflanzendicht    jede zweite Zelle hat eine Pflanze
+    raubtierlastig   halb Fleischfresser, halb Pflanzenfresser
+    riesenkarte      1000 x 1000 Zellen
+
+Gemessen werden pro Fassung und Szenario:
+
+    ticks_pro_s      Welt.tick() pro Sekunde (innerhalb von "sekunden", höchstens "max_ticks")
+    p50_ms, p99_ms   Median und 99. Perzentil der Dauer eines Ticks
+    spitze_mb        höchster Speicherbedarf (tracemalloc) beim Aufbau plus ein paar Ticks,
+                     in einem eigenen Durchlauf, weil tracemalloc alles langsamer macht
+    pflanze_us       naechste_pflanze: Mikrosekunden pro Aufruf
+    beute_us         naechster_pflanzenfresser: Mikrosekunden pro Aufruf
+    schritt_us       Tier._gehe_in_richtung: Mikrosekunden pro Aufruf
+                     (jeweils bester von 5 Durchgängen über bis zu "aufrufe" Tiere)
+
+Die drei letzten Werte trennen die Nachbarsuche und die Bewegung vom Rest des Ticks, damit
+eine Verschlechterung genau dort auffällt. tiere_ende/pflanzen_ende (nach den Ticks der
+Speichermessung) zeigen, ob die Läufe vergleichbar sind: gleiche Samen -> gleicher Verlauf,
+solange sich das Verhalten der Tiere nicht ändert.
+
+Das Ergebnis lässt sich als JSON speichern und später als Basislinie verwenden:
+
+    python leistungstest.py --json basis.json
+    python leistungstest.py --vergleich basis.json        # Exitcode 1 bei Verschlechterung
+    python leistungstest.py --versionen V3 --szenarien duenn,riesenkarte --sekunden 5
+
+Die Ausgaben von V1 (print in jedem Tick) werden während der Messung verworfen.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib
+import json
+import math
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import NamedTuple
+
+VERSIONEN = {"V1": "tiersimulation", "V2": "tiersimulationV2", "V3": "tiersimulationV3"}
+# Kürzel -> Modulname.
+
+
+class Szenario(NamedTuple):
+    breite: int
+    hoehe: int
+    pflanzen: int
+    raubtiere: int
+    pflanzenfresser: int
+    samen: int
+
+
+SZENARIEN = {
+    "duenn": Szenario(200, 200, 200, 25, 75, samen=11),
+    "pflanzendicht": Szenario(100, 100, 5000, 100, 300, samen=12),
+    "raubtierlastig": Szenario(120, 120, 1440, 300, 300, samen=13),
+    "riesenkarte": Szenario(1000, 1000, 5000, 250, 750, samen=14),
+}
+
+VERGLEICH = {
+    "ticks_pro_s": +1, "p50_ms": -1, "p99_ms": -1, "spitze_mb": -1,
+    "pflanze_us": -1, "beute_us": -1, "schritt_us": -1,
+}
+# Kennzahl -> Richtung: +1 = größer ist besser, -1 = kleiner ist besser.
+
+
+def welt_bauen(modul, s: Szenario):
+    # In jeder Fassung dieselbe Welt: Fleischfresser abwechselnd Loewe/Wolf, dann Nilpferde.
+    welt = modul.Welt(s.breite, s.hoehe, samen=s.samen)
+    welt.add_pflanzen_random(s.pflanzen)
+    for i in range(s.raubtiere):
+        klasse = modul.Loewe if i % 2 == 0 else modul.Wolf
+        welt.add_tier(klasse(f"{klasse.__name__}{i}"))
+    for i in range(s.pflanzenfresser):
+        welt.add_tier(modul.Nilpferd(f"Nilpferd{i}"))
+    return welt
+
+
+def perzentil(werte: list[float], anteil: float) -> float:
+    # Nächster-Rang-Perzentil der (unsortierten) Werte; 0 bei leerer Liste.
+    if not werte:
+        return 0.0
+    sortiert = sorted(werte)
+    return sortiert[max(0, math.ceil(anteil * len(sortiert)) - 1)]
+
+
+def _pro_aufruf(funktion, argumente: list[tuple], wiederholungen: int = 5) -> float:
+    # Mittlere Dauer eines Aufrufs in Mikrosekunden, bester von mehreren Durchgängen
+    # (wie bei timeit: Störungen von außen machen nur langsamer, nie schneller).
+    if not argumente:
+        return 0.0
+    bester = float("inf")
+    for _ in range(wiederholungen):
+        start = time.perf_counter()
+        for a in argumente:
+            funktion(*a)
+        bester = min(bester, time.perf_counter() - start)
+    return bester / len(argumente) * 1e6
+
+
+def messen(modul, s: Szenario, sekunden: float = 2.0, max_ticks: int = 500,
+           speicher_ticks: int = 3, aufrufe: int = 500) -> dict:
+    """Alle Kennzahlen für eine Fassung ("modul") in einem Szenario."""
+    ergebnis: dict = {}
+    with open(os.devnull, "w", encoding="utf-8") as stumm, contextlib.redirect_stdout(stumm):
+        # 1) Zeit pro Tick
+        welt = welt_bauen(modul, s)
+        dauern = []
+        beginn = time.perf_counter()
+        while len(dauern) < max_ticks:
+            start = time.perf_counter()
+            welt.tick()
+            ende = time.perf_counter()
+            dauern.append(ende - start)
+            if ende - beginn >= sekunden:
+                break
+        gesamt = sum(dauern)
+        ergebnis.update({
+            "ticks": len(dauern),
+            "ticks_pro_s": len(dauern) / gesamt if gesamt > 0 else float("inf"),
+            "p50_ms": perzentil(dauern, 0.50) * 1e3,
+            "p99_ms": perzentil(dauern, 0.99) * 1e3,
+        })
+        del welt
+
+        # 2) Speicher: Aufbau und ein paar Ticks unter tracemalloc
+        tracemalloc.start()
+        welt = welt_bauen(modul, s)
+        for _ in range(speicher_ticks):
+            welt.tick()
+        ergebnis["spitze_mb"] = tracemalloc.get_traced_memory()[1] / 1e6
+        tracemalloc.stop()
+        ergebnis["tiere_ende"] = len(welt.tiere)
+        ergebnis["pflanzen_ende"] = len(welt.pflanzen)
+        # Nach einer festen Zahl Ticks (anders als oben, wo die Messdauer die Zahl bestimmt).
+        del welt
+
+        # 3) Einzelne Bausteine an einer frischen Welt
+        welt = welt_bauen(modul, s)
+        tiere = list(welt.tiere)[:aufrufe]
+        fleisch = [t for t in welt.tiere if t.nahrung == modul.Nahrung.FLEISCHFRESSER][:aufrufe]
+        ergebnis["pflanze_us"] = _pro_aufruf(welt.naechste_pflanze,
+                                             [(t.x, t.y, t.sichtweite) for t in tiere])
+        ergebnis["beute_us"] = _pro_aufruf(welt.naechster_pflanzenfresser,
+                                           [(t, t.sichtweite) for t in fleisch])
+        ergebnis["schritt_us"] = _pro_aufruf(lambda t: t._gehe_in_richtung(1.0, 0.5, welt),
+                                             [(t,) for t in tiere])
+    return ergebnis
+
+
+def lauf(versionen: list[str], szenarien: list[str], **optionen) -> dict:
+    # Alle gewählten Kombinationen messen; nicht ladbare Fassungen werden übersprungen.
+    ergebnisse: dict[str, dict[str, dict]] = {}
+    for kuerzel in versionen:
+        try:
+            modul = importlib.import_module(VERSIONEN[kuerzel])
+        except ImportError as fehler:
+            print(f"{kuerzel} übersprungen: {fehler}", file=sys.stderr)
+            continue
+        ergebnisse[kuerzel] = {}
+        for name in szenarien:
+            ergebnisse[kuerzel][name] = messen(modul, SZENARIEN[name], **optionen)
+            print(f"  {kuerzel} {name} fertig", file=sys.stderr)
+    return {
+        "python": platform.python_version(),
+        "plattform": platform.platform(),
+        "zeitpunkt": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "optionen": optionen,
+        "ergebnisse": ergebnisse,
+    }
+
+
+def vergleichen(aktuell: dict, basis: dict, toleranz: float = 0.15) -> list[str]:
+    """
+    Meldungen für jede Kennzahl, die sich gegenüber der Basislinie um mehr als "toleranz"
+    (relativ) verschlechtert hat. Kombinationen, die nur in einem der Läufe vorkommen, zählen nicht.
+    """
+    meldungen = []
+    for kuerzel, szenarien in aktuell["ergebnisse"].items():
+        for name, werte in szenarien.items():
+            alt = basis.get("ergebnisse", {}).get(kuerzel, {}).get(name)
+            if alt is None:
+                continue
+            if (alt.get("tiere_ende"), alt.get("pflanzen_ende")) != (werte["tiere_ende"], werte["pflanzen_ende"]):
+                meldungen.append(f"{kuerzel} {name}: anderer Verlauf als in der Basislinie "
+                                 f"(Tiere/Pflanzen am Ende {alt.get('tiere_ende')}/{alt.get('pflanzen_ende')} "
+                                 f"-> {werte['tiere_ende']}/{werte['pflanzen_ende']})")
+            for kennzahl, richtung in VERGLEICH.items():
+                vorher, jetzt = alt.get(kennzahl), werte.get(kennzahl)
+                if not vorher or jetzt is None:
+                    continue
+                aenderung = (jetzt - vorher) / vorher * richtung
+                # Negativ = schlechter (weniger Ticks/s bzw. mehr Zeit/Speicher).
+                if aenderung < -toleranz:
+                    meldungen.append(f"{kuerzel} {name}: {kennzahl} {vorher:.3g} -> {jetzt:.3g} "
+                                     f"({100 * abs(aenderung):.0f} % schlechter)")
+    return meldungen
+
+
+def ausgeben(bericht: dict) -> None:
+    print(f"{'':4} {'Szenario':<15} {'Ticks/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'MB':>7} "
+          f"{'Pfl. µs':>8} {'Beute µs':>9} {'Schritt µs':>10}")
+    for kuerzel, szenarien in bericht["ergebnisse"].items():
+        for name, w in szenarien.items():
+            print(f"{kuerzel:4} {name:<15} {w['ticks_pro_s']:9.1f} {w['p50_ms']:8.2f} {w['p99_ms']:8.2f} "
+                  f"{w['spitze_mb']:7.1f} {w['pflanze_us']:8.1f} {w['beute_us']:9.1f} {w['schritt_us']:10.2f}")
+
+
+def _liste(text: str, erlaubt) -> list[str]:
+    werte = [t.strip() for t in text.split(",") if t.strip()]
+    for w in werte:
+        if w not in erlaubt:
+            raise argparse.ArgumentTypeError(f"{w!r} unbekannt. Erlaubt: {', '.join(erlaubt)}")
+    return werte
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Leistung der Tiersimulation (V1–V3) messen.")
+    parser.add_argument("--versionen", type=lambda t: _liste(t, VERSIONEN), default=list(VERSIONEN),
+                        help="z. B. V1,V3 (Standard: alle)")
+    parser.add_argument("--szenarien", type=lambda t: _liste(t, SZENARIEN), default=list(SZENARIEN),
+                        help=f"Auswahl aus {', '.join(SZENARIEN)} (Standard: alle)")
+    parser.add_argument("--sekunden", type=float, default=2.0, help="Messdauer pro Fall")
+    parser.add_argument("--max-ticks", type=int, default=500, help="höchstens so viele Ticks pro Fall")
+    parser.add_argument("--json", metavar="DATEI", help="Ergebnis als JSON speichern")
+    parser.add_argument("--vergleich", metavar="DATEI", help="mit gespeicherter Basislinie vergleichen")
+    parser.add_argument("--toleranz", type=float, default=0.15,
+                        help="erlaubte Verschlechterung (relativ, Standard 0.15 = 15 %%)")
+    args = parser.parse_args(argv)
+
+    bericht = lauf(args.versionen, args.szenarien, sekunden=args.sekunden, max_ticks=args.max_ticks)
+    ausgeben(bericht)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as datei:
+            json.dump(bericht, datei, indent=2)
+    if args.vergleich:
+        with open(args.vergleich, encoding="utf-8") as datei:
+            basis = json.load(datei)
+        meldungen = vergleichen(bericht, basis, args.toleranz)
+        if meldungen:
+            print("\nVerschlechterungen gegenüber der Basislinie:")
+            for m in meldungen:
+                print(f"  {m}")
+            raise SystemExit(1)
+        print("\nKeine Verschlechterung gegenüber der Basislinie.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+Zeitreihe der Population für lange Läufe der Tiersimulation (tiersimulationV3.py).
+
+Messreihe hängt sich als Beobachter an eine Welt und notiert nach jedem Tick eine Zeile
+Kennzahlen – spaltenweise in vorab angelegte NumPy-Arrays ("Blöcke" fester Länge):
+
+    tick              Ticknummer der Welt
+    anzahl_<Art>      Tiere je Art (eine Spalte pro Eintrag in ARTEN)
+    tiere             alle Tiere zusammen
+    energie_mittel    mittlere Energie (0, wenn keine Tiere mehr leben)
+    energie_min       kleinste Energie (0, wenn keine Tiere mehr leben)
+    pflanzen          Anzahl Pflanzen
+    erlegt            Jagderfolge in diesem Tick
+    geweidet          gefressene Pflanzen in diesem Tick
+
+Die erste Zeile ist der Ausgangszustand beim Anmelden. Ist ein Block voll, wird er abgegeben:
+Mit "ordner" schreibt ein Hintergrund-Thread jede Spalte als eigene .npy-Datei
+(<spalte>_<block>.npy), während die Simulation schon weiterläuft. Die Warteschlange dorthin
+ist begrenzt; im Speicher liegen also nie mehr als ein paar Blöcke, auch bei einer Million
+Ticks. Ohne "ordner" bleiben die Blöcke im Speicher (für kurze Läufe).
+
+Beispiel:
+    reihe = Messreihe(welt, "lauf_messung")
+    for _ in range(1_000_000):
+        welt.tick()
+    reihe.beenden()
+    daten = laden("lauf_messung")      # {"tick": array([...]), "anzahl_Loewe": ..., ...}
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import threading
+
+import numpy as np
+
+from tiersimulationV3 import ARTEN, EreignisArt, Welt
+
+KOPFDATEI = "messreihe.json"
+# Beschreibung der Spalten und Blöcke im Zielordner (von laden() gelesen).
+
+
+def spalten_typen() -> dict[str, np.dtype]:
+    # Name -> Datentyp aller Spalten, in der Reihenfolge, in der sie gespeichert werden.
+    typen = {"tick": np.dtype(np.int64)}
+    for name in ARTEN:
+        typen[f"anzahl_{name}"] = np.dtype(np.int32)
+    typen.update({
+        "tiere": np.dtype(np.int32),
+        "energie_mittel": np.dtype(np.float32),
+        "energie_min": np.dtype(np.float32),
+        "pflanzen": np.dtype(np.int64),
+        "erlegt": np.dtype(np.int32),
+        "geweidet": np.dtype(np.int32),
+    })
+    return typen
+
+
+class Messreihe:
+    """Sammelt pro Tick Kennzahlen der Welt in Spalten und schreibt volle Blöcke im Hintergrund."""
+
+    def __init__(self, welt: Welt, ordner: str | None = None, *, block: int = 65536,
+                 warteschlange: int = 4):
+        if block < 1:
+            raise ValueError("block muss mindestens 1 sein.")
+        self.welt = welt
+        self.ordner = ordner
+        self.block = block
+        self.typen = spalten_typen()
+        self._art_spalte = {klasse: f"anzahl_{name}" for name, klasse in ARTEN.items()}
+        # Tierklasse -> Spaltenname (type(t) statt isinstance: eine Spalte pro Art).
+
+        self._spalten = self._neuer_block()
+        self._fuellstand = 0
+        # Aktueller Block und wie viele Zeilen darin schon belegt sind.
+
+        self._bloecke: list[dict[str, np.ndarray]] = []
+        # Fertige Blöcke, wenn nicht in einen Ordner geschrieben wird.
+
+        self.bloecke_abgegeben = 0
+        self.zeilen = 0
+        # Zähler für die Kopfdatei und für len().
+
+        self._stand_erlegt, self._stand_geweidet = self._ereignisse_zaehlen()
+        # Ereigniszähler beim letzten Messen; die Differenz ergibt die Werte des Ticks.
+
+        self._fehler: BaseException | None = None
+        self._schlange: queue.Queue | None = None
+        self._thread: threading.Thread | None = None
+        if ordner is not None:
+            os.makedirs(ordner, exist_ok=True)
+            self._schlange = queue.Queue(maxsize=warteschlange)
+            # Begrenzt: Ist die Platte langsamer als die Simulation, wartet die Simulation.
+            self._thread = threading.Thread(target=self._schreiber, name="messreihe", daemon=True)
+            self._thread.start()
+
+        self.messen(welt)
+        welt.beobachter_anmelden(self)
+
+    def __call__(self, welt: Welt) -> None:
+        # Als Beobachter von Welt.tick aufgerufen.
+        self.messen(welt)
+
+    def __len__(self) -> int:
+        return self.zeilen
+
+    def __enter__(self) -> Messreihe:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.beenden()
+
+    # -------- Messen --------
+
+    def _neuer_block(self) -> dict[str, np.ndarray]:
+        return {name: np.zeros(self.block, dtype=typ) for name, typ in self.typen.items()}
+
+    def _ereignisse_zaehlen(self) -> tuple[int, int]:
+        pro_art = self.welt.ereignisse.pro_art
+        return pro_art[EreignisArt.ERLEGT], pro_art[EreignisArt.WEIDEN]
+
+    def messen(self, welt: Welt) -> None:
+        # Eine Zeile mit dem aktuellen Stand der Welt anhängen.
+        zaehler = dict.fromkeys(self._art_spalte.values(), 0)
+        summe = 0.0
+        minimum = None
+        for t in welt.tiere:
+            zaehler[self._art_spalte[type(t)]] += 1
+            summe += t.energie
+            if minimum is None or t.energie < minimum:
+                minimum = t.energie
+        anzahl = len(welt.tiere)
+        erlegt, geweidet = self._ereignisse_zaehlen()
+
+        i = self._fuellstand
+        s = self._spalten
+        s["tick"][i] = welt.tick_nr
+        for name, wert in zaehler.items():
+            s[name][i] = wert
+        s["tiere"][i] = anzahl
+        s["energie_mittel"][i] = summe / anzahl if anzahl else 0.0
+        s["energie_min"][i] = minimum if minimum is not None else 0.0
+        s["pflanzen"][i] = len(welt.pflanzen)
+        s["erlegt"][i] = erlegt - self._stand_erlegt
+        s["geweidet"][i] = geweidet - self._stand_geweidet
+        self._stand_erlegt, self._stand_geweidet = erlegt, geweidet
+
+        self._fuellstand += 1
+        self.zeilen += 1
+        if self._fuellstand == self.block:
+            self._block_abgeben()
+
+    def _block_abgeben(self) -> None:
+        # Aktuellen Block (nur belegte Zeilen) weiterreichen und einen neuen anfangen.
+        if not self._fuellstand:
+            return
+        fertig = {name: spalte[:self._fuellstand] for name, spalte in self._spalten.items()}
+        if self._schlange is not None:
+            self._fehler_pruefen()
+            self._schlange.put((self.bloecke_abgegeben, fertig))
+        else:
+            self._bloecke.append(fertig)
+        self.bloecke_abgegeben += 1
+        self._spalten = self._neuer_block()
+        self._fuellstand = 0
+
+    # -------- Schreiben im Hintergrund --------
+
+    def _schreiber(self) -> None:
+        # Läuft im eigenen Thread: Blöcke aus der Warteschlange als .npy-Dateien ablegen.
+        while True:
+            auftrag = self._schlange.get()
+            if auftrag is None:
+                break
+            if self._fehler is not None:
+                # Nach einem Fehler nur noch die Warteschlange leeren, damit niemand hängt.
+                continue
+            nummer, spalten = auftrag
+            try:
+                for name, werte in spalten.items():
+                    np.save(os.path.join(self.ordner, f"{name}_{nummer:06d}.npy"), werte)
+            except BaseException as fehler:
+                self._fehler = fehler
+
+    def _fehler_pruefen(self) -> None:
+        # Ein Schreibfehler im Hintergrund wird beim nächsten Block im Hauptthread gemeldet.
+        if self._fehler is not None:
+            raise RuntimeError("Messreihe konnte nicht geschrieben werden.") from self._fehler
+
+    # -------- Abschluss / Auslesen --------
+
+    def beenden(self) -> None:
+        # Abmelden, letzten (Teil-)Block abgeben, auf den Schreiber warten, Kopfdatei schreiben.
+        if self in self.welt._beobachter:
+            self.welt.beobachter_abmelden(self)
+        self._block_abgeben()
+        if self._thread is None:
+            return
+        if self._thread.is_alive():
+            self._schlange.put(None)
+            self._thread.join()
+        self._fehler_pruefen()
+        kopf = {
+            "spalten": {name: typ.str for name, typ in self.typen.items()},
+            "bloecke": self.bloecke_abgegeben,
+            "zeilen": self.zeilen,
+        }
+        with open(os.path.join(self.ordner, KOPFDATEI), "w", encoding="utf-8") as datei:
+            json.dump(kopf, datei, indent=2)
+
+    def daten(self) -> dict[str, np.ndarray]:
+        # Alle bisherigen Zeilen als zusammenhängende Spalten.
+        if self.ordner is not None:
+            if self._thread is not None and self._thread.is_alive():
+                raise RuntimeError("Erst beenden(), dann aus dem Ordner lesen.")
+            return laden(self.ordner)
+        teile = self._bloecke + [{name: spalte[:self._fuellstand]
+                                  for name, spalte in self._spalten.items()}]
+        return {name: np.concatenate([t[name] for t in teile]) for name in self.typen}
+
+
+def laden(ordner: str, spalten: list[str] | None = None) -> dict[str, np.ndarray]:
+    # Gespeicherte Messreihe lesen; mit "spalten" nur die genannten Spalten.
+    with open(os.path.join(ordner, KOPFDATEI), encoding="utf-8") as datei:
+        kopf = json.load(datei)
+    namen = spalten if spalten is not None else list(kopf["spalten"])
+    daten = {}
+    for name in namen:
+        if name not in kopf["spalten"]:
+            raise KeyError(f"Unbekannte Spalte {name!r}.")
+        teile = [np.load(os.path.join(ordner, f"{name}_{nummer:06d}.npy"))
+                 for nummer in range(kopf["bloecke"])]
+        daten[name] = (np.concatenate(teile) if teile
+                       else np.zeros(0, dtype=np.dtype(kopf["spalten"][name])))
+    return daten
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+Parameterstudie: viele unabhängige Simulationsläufe parallel auf allen Prozessorkernen.
+
+Variiert werden Samen (Seed), Pflanzendichte, Nachwuchs-Chance und Artenmischung.
+Jede Kombination ist ein eigener Lauf (batchlauf.simulieren) in einem eigenen Prozess
+(ProcessPoolExecutor). Da jede Welt ihren eigenen Zufallsgenerator hat, hängen die
+Ergebnisse nicht davon ab, welche Läufe sich einen Prozess teilen.
+
+Alle Läufe landen in EINER Tabelle (CSV) im "langen" Format: eine Zeile pro Lauf und
+Messzeitpunkt mit den Parametern und der Anzahl Tiere pro Art. Die Zeilen mit dem
+größten Tick jedes Laufs sind die Endbestände, alle Zeilen zusammen die Überlebenskurven.
+
+Aufruf:
+    python -m parameterstudie --samen 1-16 --dichte 0.05,0.1 --nachwuchs 0.03,0.06 \\
+        --mischung Loewe=2,Nilpferd=10 --mischung Wolf=4,Nilpferd=10 --ausgabe studie.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from batchlauf import STANDARD_ARTEN, arten_lesen, simulieren
+from tiersimulationV3 import ARTEN, GRID_H, GRID_W
+
+
+def zahlen_lesen(text: str, typ=float) -> list:
+    # "1,2,5-8" -> [1, 2, 5, 6, 7, 8] (Bereiche nur für ganze Zahlen)
+    werte = []
+    for teil in text.split(","):
+        if typ is int and "-" in teil.strip()[1:]:
+            von, bis = teil.split("-", 1)
+            werte.extend(range(int(von), int(bis) + 1))
+        elif teil.strip():
+            werte.append(typ(teil))
+    return werte
+
+
+def laeufe_planen(samen: list[int], dichten: list[float], nachwuchs: list[float],
+                  mischungen: list[str], *, breite: int = GRID_W, hoehe: int = GRID_H,
+                  ticks: int = 1000, verlauf_alle: int = 10) -> list[dict]:
+    # Kreuzprodukt aller Parameter -> eine Liste von Laufbeschreibungen (Argumente für simulieren).
+    laeufe = []
+    for nr, (m, d, n, s) in enumerate(itertools.product(mischungen, dichten, nachwuchs, samen)):
+        laeufe.append({
+            "lauf": nr, "mischung": m, "dichte": d,
+            "parameter": dict(breite=breite, hoehe=hoehe, pflanzen=round(d * breite * hoehe),
+                              arten=arten_lesen(m), samen=s, ticks=ticks,
+                              nachwuchs_chance=n, verlauf_alle=verlauf_alle),
+        })
+    return laeufe
+
+
+def _lauf_ausfuehren(lauf: dict) -> tuple[dict, dict]:
+    # Läuft im Arbeiterprozess. Muss auf Modulebene stehen, damit sie "gepickelt" werden kann.
+    return lauf, simulieren(**lauf["parameter"])
+
+
+def tabelle_erzeugen(ergebnisse: list[tuple[dict, dict]]) -> list[dict]:
+    # Ergebnisse aller Läufe zu einer Tabelle (Liste von Zeilen) zusammenfügen.
+    zeilen = []
+    for lauf, ergebnis in sorted(ergebnisse, key=lambda e: e[0]["lauf"]):
+        for tick, pro_art in ergebnis["verlauf"]:
+            zeile = {
+                "lauf": lauf["lauf"], "samen": ergebnis["samen"], "mischung": lauf["mischung"],
+                "dichte": lauf["dichte"], "nachwuchs_chance": ergebnis["nachwuchs_chance"],
+                "tick": tick, "tiere": sum(pro_art.values()),
+            }
+            for art in ARTEN:
+                zeile[art] = pro_art.get(art, 0)
+            zeilen.append(zeile)
+    return zeilen
+
+
+def studie_ausfuehren(laeufe: list[dict], prozesse: int | None = None) -> list[dict]:
+    """Alle Läufe parallel ausführen und die gemeinsame Ergebnistabelle liefern."""
+    prozesse = prozesse or os.cpu_count() or 1
+    # Viele kurze Läufe in Paketen verschicken, damit der Verwaltungsaufwand klein bleibt.
+    paket = max(1, len(laeufe) // (prozesse * 4))
+    with ProcessPoolExecutor(max_workers=prozesse) as pool:
+        ergebnisse = list(pool.map(_lauf_ausfuehren, laeufe, chunksize=paket))
+    return tabelle_erzeugen(ergebnisse)
+
+
+def csv_schreiben(zeilen: list[dict], ziel) -> None:
+    if not zeilen:
+        return
+    schreiber = csv.DictWriter(ziel, fieldnames=list(zeilen[0]))
+    schreiber.writeheader()
+    schreiber.writerows(zeilen)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Parameterstudie der Tiersimulation.")
+    parser.add_argument("--samen", default="1-8", help="Seeds, z. B. 1-16 oder 1,5,9")
+    parser.add_argument("--dichte", default="0.1", help="Pflanzen pro Zelle, z. B. 0.05,0.1")
+    parser.add_argument("--nachwuchs", default="0.06", help="Nachwuchs-Chancen, z. B. 0.03,0.06")
+    parser.add_argument("--mischung", action="append",
+                        help="Artenmischung (mehrfach angebbar), z. B. Loewe=2,Nilpferd=10")
+    parser.add_argument("--breite", type=int, default=GRID_W)
+    parser.add_argument("--hoehe", type=int, default=GRID_H)
+    parser.add_argument("--ticks", type=int, default=1000)
+    parser.add_argument("--verlauf-alle", type=int, default=10, help="Messabstand in Ticks")
+    parser.add_argument("--prozesse", type=int, default=None, help="Standard: alle Kerne")
+    parser.add_argument("--ausgabe", default="-", help="CSV-Datei ('-' = Standardausgabe)")
+    args = parser.parse_args(argv)
+
+    try:
+        laeufe = laeufe_planen(
+            zahlen_lesen(args.samen, int), zahlen_lesen(args.dichte), zahlen_lesen(args.nachwuchs),
+            args.mischung or [STANDARD_ARTEN],
+            breite=args.breite, hoehe=args.hoehe, ticks=args.ticks,
+            verlauf_alle=max(1, args.verlauf_alle),
+        )
+    except ValueError as fehler:
+        parser.error(str(fehler))
+
+    start = time.perf_counter()
+    zeilen = studie_ausfuehren(laeufe, args.prozesse)
+    print(f"{len(laeufe)} Läufe in {time.perf_counter() - start:.1f} s", file=sys.stderr)
+
+    if args.ausgabe == "-":
+        csv_schreiben(zeilen, sys.stdout)
+    else:
+        with open(args.ausgabe, "w", newline="", encoding="utf-8") as datei:
+            csv_schreiben(zeilen, datei)
+
+
+if __name__ == "__main__":
+    main()
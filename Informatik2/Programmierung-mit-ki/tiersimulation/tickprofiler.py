@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+Zeitmessung pro Tick-Phase für die Tiersimulation (tiersimulationV3.py).
+
+Ein TickProfiler wird an eine Welt gehängt (welt.profiler = TickProfiler()). Solange
+welt.profiler None ist, kostet das nichts außer einer Attributabfrage pro Tick bzw. Suche.
+Mit Profiler führt Welt.tick denselben Ablauf aus wie sonst (Welt._tick_ablauf, gleiche
+Zufallszahlen, gleiches Ergebnis) und übergibt ihm eine Stoppuhr, die die Wanduhrzeit jeder
+Phase misst:
+
+    mischen         rng.shuffle(tiere) und Reihenfolge merken
+    kopie           list(tiere)
+    mitgliedschaft  die Prüfungen "t in tiere" (wurde das Tier schon gefressen?)
+    tiere           alle Tier.tick-Aufrufe (enthält die Nachbarsuche)
+    nachbarsuche    davon: naechste_pflanze / naechster_pflanzenfresser (Teil von "tiere")
+    nachwachsen     regrow_pflanzen bzw. flächiges Wachstum
+    gesamt          der ganze Tick
+
+Dazu zählt er die Suchanfragen und wie viele Kandidaten (Tiere in den besuchten
+Indexblöcken bzw. Pflanzen im Suchfenster) dabei in Frage kamen. Jeder Tick ergibt eine Zeile; die Zeitreihe lässt sich
+als CSV oder JSON speichern.
+
+Beispiel:
+    welt.profiler = TickProfiler()
+    for _ in range(100):
+        welt.tick()
+    welt.profiler.speichern("profil.csv")
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from time import perf_counter
+
+PHASEN = ("mischen", "kopie", "mitgliedschaft", "tiere", "nachbarsuche", "nachwachsen", "gesamt")
+ABFRAGEN = ("pflanze", "beute")
+
+
+class TickProfiler:
+    """Sammelt pro Tick die Zeiten der Phasen und die Zähler der Nachbarsuche."""
+
+    def __init__(self):
+        self.zeilen: list[dict] = []
+        # Eine Zeile pro gemessenem Tick: tick, Phasenzeiten [s], Abfragen, Kandidaten.
+
+        self._aktuell: dict | None = None
+        # Zeile des laufenden Ticks (Abfragen außerhalb eines Ticks werden nicht gezählt).
+        self._letzte = 0.0
+        # Zeitpunkt der letzten Phasenmeldung (siehe _runde).
+        self._pause = 0.0
+        # Im laufenden Tick nicht mitgemessene Zeit (Zählen der Kandidaten, siehe abfrage).
+
+    # -------- Messung --------
+
+    def abfrage(self, art: str, index, suche, x: float, y: float, max_dist: float, **kw):
+        # Eine Nachbarsuche ausführen und Zeit, Anzahl und geprüfte Kandidaten notieren.
+        zeile = self._aktuell
+        if zeile is None:
+            return suche(x, y, max_dist, **kw)
+        start = perf_counter()
+        ergebnis = suche(x, y, max_dist, **kw)
+        ende = perf_counter()
+        zeile["nachbarsuche"] += ende - start
+        zeile[f"{art}_abfragen"] += 1
+        zeile[f"{art}_kandidaten"] += index.kandidaten(x, y, max_dist)
+        pause = perf_counter() - ende
+        self._letzte += pause
+        self._pause += pause
+        # Das Zählen der Kandidaten ist selbst eine zweite Umkreissuche: Die Stoppuhr der Phasen
+        # (und von "gesamt") wird um seine Dauer zurückgestellt, damit es nirgends mitgemessen wird.
+        return ergebnis
+
+    def tick_messen(self, welt) -> None:
+        # Welt._tick_ablauf mit Stoppuhr ausführen: Jede Phase meldet ihr Ende an _runde.
+        beginn = perf_counter()
+        zeile = {"tick": welt.tick_nr + 1, **dict.fromkeys(PHASEN, 0.0)}
+        for art in ABFRAGEN:
+            zeile[f"{art}_abfragen"] = 0
+            zeile[f"{art}_kandidaten"] = 0
+        self._aktuell = zeile
+        self._letzte = beginn
+        self._pause = 0.0
+        try:
+            welt._tick_ablauf(self._runde)
+            zeile["gesamt"] = perf_counter() - beginn - self._pause
+            zeile["anzahl_tiere"] = len(welt.tiere)
+        finally:
+            self._aktuell = None
+        self.zeilen.append(zeile)
+
+    def _runde(self, phase: str) -> None:
+        # Zeit seit der letzten Meldung der gerade beendeten Phase zuschreiben.
+        jetzt = perf_counter()
+        self._aktuell[phase] += jetzt - self._letzte
+        self._letzte = jetzt
+
+    # -------- Auswertung / Export --------
+
+    def summen(self) -> dict:
+        # Alle Ticks zusammengezählt (Zeiten in s, Zähler als Summe) plus Kandidaten pro Abfrage.
+        summe = {"ticks": len(self.zeilen)}
+        for schluessel in PHASEN:
+            summe[schluessel] = sum(z[schluessel] for z in self.zeilen)
+        for art in ABFRAGEN:
+            abfragen = sum(z[f"{art}_abfragen"] for z in self.zeilen)
+            kandidaten = sum(z[f"{art}_kandidaten"] for z in self.zeilen)
+            summe[f"{art}_abfragen"] = abfragen
+            summe[f"{art}_kandidaten"] = kandidaten
+            summe[f"{art}_kandidaten_pro_abfrage"] = kandidaten / abfragen if abfragen else 0.0
+        return summe
+
+    def als_csv(self) -> str:
+        puffer = io.StringIO()
+        if self.zeilen:
+            schreiber = csv.DictWriter(puffer, fieldnames=list(self.zeilen[0]))
+            schreiber.writeheader()
+            schreiber.writerows(self.zeilen)
+        return puffer.getvalue()
+
+    def als_json(self) -> str:
+        return json.dumps({"summen": self.summen(), "ticks": self.zeilen}, indent=2)
+
+    def speichern(self, pfad: str) -> None:
+        # Format nach Dateiendung: .json -> JSON, sonst CSV.
+        text = self.als_json() if pfad.lower().endswith(".json") else self.als_csv()
+        with open(pfad, "w", newline="", encoding="utf-8") as datei:
+            datei.write(text)
+
+    def bericht(self) -> str:
+        # Kurze Textübersicht: Anteil jeder Phase an der Gesamtzeit. Die Nachbarsuche ist ein Teil
+        # von "tiere" und steht eingerückt darunter (Anteil an "tiere"), damit die Prozente der
+        # Phasen zusammen 100 ergeben.
+        s = self.summen()
+        gesamt = s["gesamt"] or 1.0
+        zeilen = [f"{s['ticks']} Ticks, {s['gesamt']:.3f} s"]
+        for phase in PHASEN[:-1]:
+            if phase == "nachbarsuche":
+                anteil = 100 * s[phase] / (s["tiere"] or 1.0)
+                zeilen.append(f"  {'  ' + phase:<15} {s[phase]:8.3f} s {anteil:5.1f} % von tiere")
+                continue
+            zeilen.append(f"  {phase:<15} {s[phase]:8.3f} s {100 * s[phase] / gesamt:5.1f} %")
+        for art in ABFRAGEN:
+            zeilen.append(f"  {art}: {s[f'{art}_abfragen']} Abfragen, "
+                          f"{s[f'{art}_kandidaten_pro_abfrage']:.1f} Kandidaten/Abfrage")
+        return "\n".join(zeilen)
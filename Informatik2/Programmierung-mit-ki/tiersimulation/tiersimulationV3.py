@@ -23,9 +23,35 @@ import math
 import random
 # Standardbibliothek "random": Zufallszahlen (für Startpositionen/Bewegungsrichtungen/Pflanzenwachstum).
 
-import tkinter as tk
-# "tkinter" ist die Standard-GUI-Bibliothek von Python.
-# "as tk" gibt ihr einen kurzen Alias, damit wir z. B. tk.Tk(), tk.Canvas schreiben können.
+import time
+# Standardbibliothek "time": time.perf_counter() misst Zeitspannen sehr genau (für Tempo-Anzeige).
+
+import gc
+import os
+import struct
+import sys
+# gc: Speicherbereinigung; os: Dateien sicher ersetzen; struct: Zahlen in Bytes packen;
+# sys: Bytereihenfolge der Maschine.
+# Alle drei brauchen wir zum Speichern/Laden der Welt im Binärformat.
+
+try:
+    import tkinter as tk
+    # "tkinter" ist die Standard-GUI-Bibliothek von Python.
+    # "as tk" gibt ihr einen kurzen Alias, damit wir z. B. tk.Tk(), tk.Canvas schreiben können.
+except ImportError:
+    tk = None
+    # Auf Servern ohne Tk (headless) fehlt tkinter oft. Das Modell (Tier, Welt) soll dann
+    # trotzdem importierbar sein, z. B. für batchlauf.py; nur die GUI (App/main) ist nicht nutzbar.
+
+try:
+    import numpy as np
+    # NumPy: schnelle Berechnungen auf ganzen Arrays. Gebraucht für das flächige Pflanzenwachstum
+    # (Welt.wachstum), pflanzen_saeen/tiere_ansiedeln, den BildRenderer und PflanzenRaster.als_array
+    # (darauf bauen auch flussfeld.py und andere Zusatzmodule auf).
+except ImportError:
+    np = None
+    # Ohne NumPy läuft der Rest weiter: Die Pflanzen liegen ohnehin in einem bytearray, die Suche
+    # darin braucht kein NumPy, und gezeichnet wird dann mit dem ElementRenderer.
 
 from abc import ABC, abstractmethod
 # "abc" = Abstract Base Classes.
@@ -33,8 +59,20 @@ from abc import ABC, abstractmethod
 # @abstractmethod: Dekorator, der eine Methode als "abstrakt" markiert,
 # d. h. Unterklassen MÜSSEN diese Methode überschreiben.
 
-from enum import Enum
+from array import array
+# "array" speichert viele Zahlen eines Typs kompakt hintereinander (wie eine Liste, aber ohne
+# ein Python-Objekt pro Eintrag). Wir nutzen es für den Ereignis-Ringpuffer.
+
+from enum import Enum, IntEnum
 # "Enum" ermöglicht Aufzählungstypen: feste, benannte Werte (z. B. PFLANZENFRESSER/FLEISCHFRESSER).
+# "IntEnum" ist ein Enum, dessen Werte zugleich ganze Zahlen sind (passt in ein array).
+
+from collections.abc import MutableSet
+# MutableSet: Basisklasse für eigene Mengen-Typen. Wer __contains__, __iter__, __len__, add und
+# discard schreibt, bekommt remove, update (|=), ==, ... geschenkt.
+
+from typing import NamedTuple
+# NamedTuple: Tupel mit benannten Feldern (z. B. ereignis.tick statt ereignis[1]).
 
 # =========================
 #   Welt- und Darstellungs-Parameter
@@ -70,6 +108,52 @@ TOOLTIP_FG = "#222"
 TEXT_FG = "#E0E6ED"
 # Textfarbe der Statuszeile.
 
+FRAME_MS = 33
+# Feste Bildrate beim Vorspulen: alle 33 ms ein neues Bild (ca. 30 Bilder/s).
+# Zwischen zwei Bildern können dann beliebig viele Simulationsschritte (Ticks) liegen.
+
+TICK_BUDGET_ANTEIL = 0.8
+# Im Zeitbudget-Modus darf die Simulation 80 % eines Frames rechnen; der Rest bleibt fürs Zeichnen.
+
+PLANT_COLOR = "#43A047"
+# Farbe einer Pflanze, wenn die Welt als Bild gezeichnet wird (statt PLANT_EMOJI).
+
+MAX_CANVAS_PX = 1200
+# Größte Kantenlänge des Canvas in Pixeln. Größere Welten bekommen kleinere Zellen als TILE.
+
+BILD_AB_ZELLEN = 20_000
+# Ab so vielen Zellen zeichnet die App die Welt als EIN Bild (BildRenderer) statt mit einem
+# Canvas-Element pro Pflanze und Tier (ElementRenderer). Braucht NumPy.
+
+TREFFER_RADIUS = 1.2
+TREFFER_PX = 6
+# Ein Klick/Mauszeiger "trifft" das nächste Tier im Umkreis von 1.2 Zellen, mindestens aber
+# 6 Pixeln (sonst wären Tiere in großen Welten mit kleinen Zellen kaum zu treffen).
+
+INDEX_ZELLE = 8
+# Kantenlänge (in Weltzellen) eines Blocks im räumlichen Tierindex (TierIndex).
+# Entspricht der größten Sichtweite (Loewe/Tiger/Wolf = 8.0): Eine Suche im Radius
+# "sichtweite" muss dann höchstens die 3x3 benachbarten Blöcke ansehen.
+
+START_BESETZUNG = [
+    ("Loewe", "Simba"), ("Tiger", "ShereKhan"), ("Wolf", "Akela"), ("Hund", "Bello"), ("Katze", "Minka"),
+    ("Loewe", "Willi"), ("Tiger", "Bernd"), ("Wolf", "Andre"), ("Hund", "Wuffi"), ("Katze", "Tetzi"),
+    ("Katze", "mimi"), ("Nilpferd", "Wolle"),
+    ("Nilpferd", "Hippo1"), ("Nilpferd", "Hippo2"), ("Nilpferd", "Hippo3"),
+]
+# Tiere, mit denen die App startet (Art, Name), siehe App._setup_world. Die Reihenfolge zählt:
+# Sie bestimmt, welches Tier welche Zufallsposition und welche id bekommt.
+
+ERHOLUNG_PRO_STUNDE = 15
+# Energie, die eine Stunde Schlaf bringt (Tier.schlafen).
+
+MUEDE_PFLANZENFRESSER = 40
+MUEDE_FLEISCHFRESSER = 35
+# Unter dieser Energie schläft ein Tier, das kein Futter sieht, statt weiterzuwandern.
+
+ZEITPLAN_FAECHER = 64
+# Anzahl Fächer im "Zeitrad" des Zeitplans: Fach (Wecktick % 64) hält die Tiere, die dann aufwachen.
+
 # =========================
 #   Modellebene
 # =========================
@@ -82,39 +166,119 @@ class Nahrung(Enum):
     PFLANZENFRESSER = "Pflanzenfresser"
     # Zweiter Enum-Wert.
 
+class EreignisArt(IntEnum):
+    # Art eines Ereignisses in der Welt (als kleine Zahl gespeichert, Text erst bei Bedarf).
+    ABPRALL = 1
+    WEIDEN = 2
+    ERLEGT = 3
+
+class Ereignis(NamedTuple):
+    # Ein einzelnes Ereignis, wie es aus dem Ringpuffer gelesen wird.
+    art: EreignisArt
+    tick: int
+    akteur: int
+    # id des handelnden Tiers.
+    ziel: int
+    # id des betroffenen Tiers (z. B. Beute) oder -1.
+    x: float
+    y: float
+
+class EreignisPuffer:
+    """
+    Ringpuffer fester Größe für Ereignisse (Abprall, Weiden, Erlegen).
+    Jedes Ereignis wird als ein paar Zahlen in vorab angelegte Arrays geschrieben –
+    es entsteht dabei KEIN Text. Ist der Puffer voll, überschreiben neue Ereignisse die ältesten.
+    Erst wenn jemand (z. B. die Statuszeile der GUI) ein Ereignis anzeigen will,
+    wird mit Welt.ereignis_text() eine lesbare Meldung daraus gebaut.
+    """
+    def __init__(self, kapazitaet: int = 1024):
+        self.kapazitaet = kapazitaet
+        self.art = array("b", bytes(kapazitaet))
+        self.tick = array("q", [0]) * kapazitaet
+        self.akteur = array("q", [0]) * kapazitaet
+        self.ziel = array("q", [0]) * kapazitaet
+        self.x = array("d", [0.0]) * kapazitaet
+        self.y = array("d", [0.0]) * kapazitaet
+        # Spalten ("Structure of Arrays"), einmalig in voller Größe angelegt.
+
+        self.anzahl = 0
+        # Wie viele Ereignisse insgesamt geschrieben wurden (wächst immer weiter).
+        # Position im Puffer = anzahl % kapazitaet.
+
+        self.pro_art = array("q", [0]) * (max(EreignisArt) + 1)
+        # Zähler je Ereignisart seit Anlegen des Puffers (Index = EreignisArt). Anders als der
+        # Puffer selbst geht hier nichts verloren, auch wenn in einem Tick mehr als
+        # "kapazitaet" Ereignisse anfallen.
+
+    def schreiben(self, art: EreignisArt, tick: int, akteur: int, ziel: int, x: float, y: float) -> None:
+        i = self.anzahl % self.kapazitaet
+        self.art[i] = art
+        self.tick[i] = tick
+        self.akteur[i] = akteur
+        self.ziel[i] = ziel
+        self.x[i] = x
+        self.y[i] = y
+        self.anzahl += 1
+        self.pro_art[art] += 1
+
+    def lesen(self, nummer: int) -> Ereignis:
+        # Ereignis mit der laufenden Nummer "nummer" (0 = erstes jemals geschriebenes).
+        if not (self.anzahl - self.kapazitaet <= nummer < self.anzahl) or nummer < 0:
+            raise IndexError("Ereignis ist nicht (mehr) im Puffer.")
+        i = nummer % self.kapazitaet
+        return Ereignis(EreignisArt(self.art[i]), self.tick[i], self.akteur[i], self.ziel[i], self.x[i], self.y[i])
+
+    def letztes(self) -> Ereignis | None:
+        return self.lesen(self.anzahl - 1) if self.anzahl else None
+
+    def seit(self, nummer: int):
+        # Alle noch vorhandenen Ereignisse ab laufender Nummer "nummer" (ältere sind überschrieben).
+        for n in range(max(nummer, self.anzahl - self.kapazitaet, 0), self.anzahl):
+            yield self.lesen(n)
+
 class Tier(ABC):
     """
     Basisklasse für Tiere in der Simulation.
     "ABC" macht sie abstrakt: Von Tier direkt sollen keine Objekte erzeugt werden.
     Unterklassen (z. B. Loewe) erben und ergänzen fehlende Teile.
+
+    Was für alle Tiere einer Art gleich ist (Ernährung, Schrittweite, Sichtweite, Emoji,
+    Energiegewinn beim Fressen), steht als KLASSENATTRIBUT in der Unterklasse – also nur
+    einmal im Speicher statt in jedem einzelnen Tier. Jedes Objekt speichert nur seinen
+    eigenen Zustand (Name, Energie, Position, ...).
     """
-    def __init__(
-        self,
-        name: str,
-        nahrung: Nahrung,
-        *,
-        x: float = 0.0,
-        y: float = 0.0,
-        schrittweite: float = 1.0,
-        sichtweite: float = 6.0,
-        emoji: str = "?"
-    ):
+
+    __slots__ = ("name", "energie", "x", "y", "id", "_index_block", "_reihenfolge")
+    # __slots__: feste Liste der Attribute pro Objekt. Python legt dann kein __dict__ an,
+    # ein Tier braucht so etwa die Hälfte des Speichers. Nachteil: Andere Attribute
+    # lassen sich nicht mehr nachträglich anhängen (AttributeError).
+    # Wichtig: Jede Unterklasse braucht ebenfalls "__slots__ = ()", sonst gibt es doch ein __dict__.
+
+    # Art-Konstanten (Klassenattribute), werden in den Unterklassen überschrieben:
+    nahrung: Nahrung
+    # Ernährungsart (Enum oben).
+    schrittweite: float = 1.0
+    # Wie weit bewegt sich das Tier pro Tick maximal?
+    sichtweite: float = 6.0
+    # Radius, in dem das Tier Futter/Beute wahrnimmt.
+    emoji: str = "?"
+    # Nur für die Darstellung; welches Symbol diese Art hat.
+    farbe: str = "#B0BEC5"
+    # Ebenfalls nur Darstellung: Farbe des Punkts, wenn die Welt als Bild gezeichnet wird
+    # (BildRenderer, große Welten – dort sind Emojis zu klein).
+    fressgewinn: int = 20
+    # Energie, die essen() dazugibt.
+
+    def __init__(self, name: str, *, x: float = 0.0, y: float = 0.0):
         # __init__ ist der KONSTRUKTOR: Er legt Startwerte für das Objekt fest.
         # name:          Anzeigename des Tiers (Typ: str = Zeichenkette).
-        # nahrung:       Ernährungsart (Typ: Nahrung = Enum oben).
         # *,:            Das Sternchen vor dem Komma bewirkt: Alle folgenden Parameter
         #                müssen als "Keyword-Argumente" übergeben werden (z. B. x=1.0).
         # x, y:          Startposition in der Welt (Gleitkommazahlen für weiche Bewegung).
-        # schrittweite:  Wie weit bewegt sich das Tier pro Tick maximal?
-        # sichtweite:    Radius, in dem das Tier Futter/Beute wahrnimmt.
-        # emoji:         Nur für die Darstellung; welches Symbol dieses Tier hat.
 
         self.name = name
         # "self" ist die Referenz auf das konkrete Objekt. Wir speichern den Namen im Objekt.
 
-        self.nahrung = nahrung
-        # Ernährungsart speichern (Enum).
-
         self.energie = 100
         # Startenergie. Wir begrenzen Energie später auf 0..100.
 
@@ -122,14 +286,12 @@ class Tier(ABC):
         self.y = y
         # Startposition speichern.
 
-        self.schrittweite = schrittweite
-        # Maximale Bewegungsstrecke pro Tick.
+        self.id = -1
+        # Eindeutige Nummer des Tiers in seiner Welt (vergibt Welt.add_tier; -1 = noch in keiner Welt).
 
-        self.sichtweite = sichtweite
-        # Wahrnehmungsradius für Suchen nach Pflanzen/Beute.
-
-        self.emoji = emoji
-        # Symbol für die Darstellung (GUI).
+        self._index_block: tuple[int, int] | None = None
+        self._reihenfolge = 0
+        # Verwaltungsdaten für den räumlichen Tierindex der Welt (siehe TierIndex).
 
     # Alias mit Umlaut zur API aus deiner ursprünglichen Aufgabe
     def geräuschMachen(self):
@@ -151,7 +313,7 @@ class Tier(ABC):
         # Normale (konkrete) Methode: erhöht Energie abhängig von "stunden".
         # Parameter "stunden" hat Typ int und Standardwert 1.
         # Rückgabetyp "-> None": gibt nichts zurück.
-        zuwachs = 15 * max(0, stunden)
+        zuwachs = ERHOLUNG_PRO_STUNDE * max(0, stunden)
         # Berechne Energiezuwachs: 15 pro Stunde; negative Stunden werden mit max(0, stunden) verhindert.
         self.energie = min(100, self.energie + zuwachs)
         # Kappe Energie bei 100 (Obergrenze).
@@ -209,18 +371,24 @@ class Tier(ABC):
         self.y = max(0, min(welt.hoehe - 1, ny))
         # Sicherheitskappung: Stelle sicher, dass x,y im gültigen Bereich bleiben.
 
+        welt.tier_bewegt(self)
+        # Der Welt melden: räumlichen Tierindex nachführen, ggf. Änderung für die Anzeige merken.
+
         self.bewegen(self.schrittweite)
         # Energieverbrauch für die Bewegung.
 
-        if bounced and welt.on_event:
-            welt.on_event(f"{self.name} prallt an der Grenze ab.")
-            # Lose Kopplung: Wenn die Welt einen Ereignis-Callback hat (z. B. GUI),
-            # dann eine Statusmeldung ausgeben.
+        if bounced:
+            welt.ereignisse.schreiben(EreignisArt.ABPRALL, welt.tick_nr, self.id, -1, self.x, self.y)
+            # Ereignis nur als Zahlen festhalten; der Meldungstext entsteht erst beim Anzeigen.
 
     def _wandern(self, welt: "Welt") -> None:
         # Zufällige Bewegung ("Random Walk"):
-        winkel = random.uniform(0, 2 * math.pi)
-        # Zufallswinkel zwischen 0 und 2π (360 Grad).
+        if welt.zufallsstrom is not None:
+            winkel = welt.zufallsstrom.winkel(welt.tick_nr, self.id)
+            # Winkel als feste Funktion von (Samen, Tick, id) – unabhängig von der Reihenfolge.
+        else:
+            winkel = welt.rng.uniform(0, 2 * math.pi)
+            # Zufallswinkel zwischen 0 und 2π (360 Grad).
         self._gehe_in_richtung(math.cos(winkel), math.sin(winkel), welt)
         # Bewegung entlang der Richtung, Normierung passiert in _gehe_in_richtung.
 
@@ -242,12 +410,11 @@ class Tier(ABC):
         # Runde Position auf Gitterkoordinate: eine Pflanze sitzt genau auf Zellen.
         if kachel in welt.pflanzen:
             # Steht auf einer Pflanze? -> essen
-            welt.pflanzen.remove(kachel)
-            # Pflanze aus der Welt entfernen (wurde "gefressen").
+            welt.pflanze_entfernen(kachel)
+            # Pflanze aus dem Raster der Welt entfernen (wurde "gefressen"); die Journale erfahren es.
             self.essen()
             # Energie auffüllen gemäß Unterklassenlogik.
-            if welt.on_event:
-                welt.on_event(f"{self.name} weidet bei {kachel}.")
+            welt.ereignisse.schreiben(EreignisArt.WEIDEN, welt.tick_nr, self.id, -1, *kachel)
             return
 
         ziel = welt.naechste_pflanze(self.x, self.y, self.sichtweite)
@@ -258,6 +425,7 @@ class Tier(ABC):
             if d <= self.schrittweite:
                 # Nah genug: direkt dorthin "springen".
                 self.x, self.y = zx, zy
+                welt.tier_bewegt(self)
                 self.bewegen(d)
                 # Energieverbrauch proportional zur Distanz.
             else:
@@ -265,9 +433,11 @@ class Tier(ABC):
                 self._gehe_in_richtung(zx - self.x, zy - self.y, welt)
         else:
             # Keine Pflanze gesehen:
-            if self.energie < 40:
+            if self.energie < MUEDE_PFLANZENFRESSER:
                 self.schlafen(1)
                 # Bei niedriger Energie kurz ausruhen.
+                welt.tier_schlaeft(self)
+                # Der Welt melden (mit Zeitplan schläft das Tier dann gleich bis zum Ausgeruhtsein).
             else:
                 self._wandern(welt)
                 # Sonst zufällig weiterziehen.
@@ -281,75 +451,651 @@ class Tier(ABC):
             if d <= 1.0:
                 # Nah genug, um die Beute "zu erwischen".
                 if beute in welt.tiere:
-                    welt.tiere.remove(beute)
-                    # Beute aus der Welt entfernen.
+                    welt.tier_entfernen(beute)
+                    # Beute aus der Welt (und dem Tierindex) entfernen.
                     self.essen()
                     # Energie auffüllen.
-                    if welt.on_event:
-                        welt.on_event(f"{self.name} erlegt {beute.name}.")
+                    welt.ereignisse.schreiben(EreignisArt.ERLEGT, welt.tick_nr, self.id, beute.id, beute.x, beute.y)
                 return
             else:
                 # Noch nicht nah genug: bewege dich in Richtung Beute.
                 self._gehe_in_richtung(beute.x - self.x, beute.y - self.y, welt)
         else:
             # Keine Beute in Sicht:
-            if self.energie < 35:
+            if self.energie < MUEDE_FLEISCHFRESSER:
                 self.schlafen(1)
+                welt.tier_schlaeft(self)
             else:
                 self._wandern(welt)
 
 # Konkrete Arten
 class Loewe(Tier):
     # "Loewe" ERBT von "Tier": inherits Attribute/Methoden, überschreibt/ergänzt Spezifisches.
-    def __init__(self, name: str, **kw):
-        # Konstruktor ruft den Basisklassen-Konstruktor mit speziellen Standardwerten auf.
-        super().__init__(name, Nahrung.FLEISCHFRESSER, schrittweite=1.2, sichtweite=8.0, emoji="🦁", **kw)
-        # "super().__init__(...)" ruft den Konstruktor der Elternklasse (Tier).
-        # **kw nimmt optionale benannte Argumente entgegen (z. B. x=..., y=...).
+    __slots__ = ()
+    # Keine zusätzlichen Attribute pro Objekt (und dadurch auch kein __dict__).
+    nahrung = Nahrung.FLEISCHFRESSER
+    schrittweite = 1.2
+    sichtweite = 8.0
+    emoji = "🦁"
+    farbe = "#F2A93B"
+    fressgewinn = 25
+    # Art-Konstanten: überschreiben die Klassenattribute von Tier, gelten für jeden Löwen.
     def geraeusch_machen(self): pass
     # Überschreibt abstrakte Methode. "pass" = Platzhalter (keine Aktion, gültige leere Methode).
-    def essen(self): self.energie = min(100, self.energie + 25)
+    def essen(self): self.energie = min(100, self.energie + self.fressgewinn)
     # Konkrete Umsetzung: Löwe gewinnt 25 Energie (gedeckelt bei 100).
 
 class Nilpferd(Tier):
-    def __init__(self, name: str, **kw):
-        super().__init__(name, Nahrung.PFLANZENFRESSER, schrittweite=0.9, sichtweite=6.0, emoji="🦛", **kw)
+    __slots__ = ()
+    nahrung = Nahrung.PFLANZENFRESSER
+    schrittweite = 0.9
+    sichtweite = 6.0
+    emoji = "🦛"
+    farbe = "#9575CD"
+    fressgewinn = 22
     def geraeusch_machen(self): pass
-    def essen(self): self.energie = min(100, self.energie + 22)
+    def essen(self): self.energie = min(100, self.energie + self.fressgewinn)
 
 class Tiger(Tier):
-    def __init__(self, name: str, **kw):
-        super().__init__(name, Nahrung.FLEISCHFRESSER, schrittweite=1.3, sichtweite=8.0, emoji="🐯", **kw)
+    __slots__ = ()
+    nahrung = Nahrung.FLEISCHFRESSER
+    schrittweite = 1.3
+    sichtweite = 8.0
+    emoji = "🐯"
+    farbe = "#FF7043"
+    fressgewinn = 24
     def geraeusch_machen(self): pass
-    def essen(self): self.energie = min(100, self.energie + 24)
+    def essen(self): self.energie = min(100, self.energie + self.fressgewinn)
 
 class Hund(Tier):
-    def __init__(self, name: str, **kw):
-        super().__init__(name, Nahrung.FLEISCHFRESSER, schrittweite=1.1, sichtweite=7.0, emoji="🐕", **kw)
+    __slots__ = ()
+    nahrung = Nahrung.FLEISCHFRESSER
+    schrittweite = 1.1
+    sichtweite = 7.0
+    emoji = "🐕"
+    farbe = "#A1887F"
+    fressgewinn = 18
     def geraeusch_machen(self): pass
-    def essen(self): self.energie = min(100, self.energie + 18)
+    def essen(self): self.energie = min(100, self.energie + self.fressgewinn)
 
 class Katze(Tier):
-    def __init__(self, name: str, **kw):
-        super().__init__(name, Nahrung.FLEISCHFRESSER, schrittweite=1.0, sichtweite=6.5, emoji="🐈", **kw)
+    __slots__ = ()
+    nahrung = Nahrung.FLEISCHFRESSER
+    schrittweite = 1.0
+    sichtweite = 6.5
+    emoji = "🐈"
+    farbe = "#FFD54F"
+    fressgewinn = 16
     def geraeusch_machen(self): pass
-    def essen(self): self.energie = min(100, self.energie + 16)
+    def essen(self): self.energie = min(100, self.energie + self.fressgewinn)
 
 class Wolf(Tier):
-    def __init__(self, name: str, **kw):
-        super().__init__(name, Nahrung.FLEISCHFRESSER, schrittweite=1.2, sichtweite=8.0, emoji="🐺", **kw)
+    __slots__ = ()
+    nahrung = Nahrung.FLEISCHFRESSER
+    schrittweite = 1.2
+    sichtweite = 8.0
+    emoji = "🐺"
+    farbe = "#90A4AE"
+    fressgewinn = 20
     def geraeusch_machen(self): pass
-    def essen(self): self.energie = min(100, self.energie + 20)
+    def essen(self): self.energie = min(100, self.energie + self.fressgewinn)
 
 # Hinweis: Die sechs Unterklassen folgen demselben Muster:
-# - super().__init__(...) setzt art-spezifische Standardwerte (schrittweite/sichtweite/emoji/nahrung).
+# - __slots__ = () hält die Objekte schlank (nur die Attribute aus Tier.__slots__).
+# - Klassenattribute legen die Art-Konstanten fest (nahrung/schrittweite/sichtweite/emoji/fressgewinn).
 # - geraeusch_machen: als Platzhalter implementiert (könnte man mit Sound/Text füllen).
-# - essen: unterscheidet sich pro Art in der Energiemenge.
+# - essen: addiert den Energiegewinn der Art.
+
+ARTEN: dict[str, type[Tier]] = {
+    k.__name__: k for k in (Loewe, Nilpferd, Tiger, Hund, Katze, Wolf)
+}
+# Verzeichnis aller Arten nach Klassenname, z. B. ARTEN["Loewe"] -> Klasse Loewe.
+# Nützlich, wenn Arten als Text angegeben werden (Kommandozeile, Dateien).
+# Die Konstanten einer Art stehen an ihrer Klasse, z. B. ARTEN["Loewe"].sichtweite -> 8.0.
+
+class BlockIndex:
+    """
+    Basis für räumliche Indizes ("Uniform Grid"), z. B. TierIndex.
+    Die Welt wird in quadratische Blöcke der Kantenlänge "zelle" aufgeteilt.
+    Jeder Block ("Eimer") merkt sich die Objekte, die in ihm liegen.
+    Eine Umkreissuche muss so nur die Blöcke in der Nähe ansehen statt aller Objekte.
+    """
+    def __init__(self, zelle: float = INDEX_ZELLE):
+        self.zelle = zelle
+        # Kantenlänge eines Blocks in Weltzellen.
+
+        self.eimer: dict[tuple[int, int], set] = {}
+        # Block-Koordinate (bx, by) -> Menge der Objekte in diesem Block.
+        # Leere Blöcke werden gar nicht erst gespeichert.
+
+    def _block(self, x: float, y: float) -> tuple[int, int]:
+        # Zu welchem Block gehört die Weltposition (x, y)? "//" = ganzzahlige Division (abgerundet).
+        return int(x // self.zelle), int(y // self.zelle)
+
+    def kandidaten(self, x: float, y: float, max_dist: float) -> int:
+        # Wie viele Objekte eine Umkreissuche um (x, y) prüfen muss (nur für Messungen/Profiler).
+        bx0, by0 = self._block(x - max_dist, y - max_dist)
+        bx1, by1 = self._block(x + max_dist, y + max_dist)
+        return sum(
+            len(self.eimer.get((bx, by), ()))
+            for bx in range(bx0, bx1 + 1) for by in range(by0, by1 + 1)
+        )
+
+class PflanzenRaster(MutableSet):
+    """
+    Pflanzen als Raster: ein Byte pro Zelle (1 = Pflanze, 0 = leer), zeilenweise in einem bytearray.
+    Von außen verhält sich das Raster wie die frühere Menge von Zellen (x, y):
+    "zelle in pflanzen", "for (x, y) in pflanzen", len(), add(), discard(), remove().
+    Eine 10.000 x 10.000-Welt braucht so 100 MB statt eines Tupels und Hash-Eintrags pro Pflanze.
+    """
+    def __init__(self, breite: int, hoehe: int):
+        self.breite = breite
+        self.hoehe = hoehe
+        self.zellen = bytearray(breite * hoehe)
+        # Zelle (x, y) liegt bei Position y * breite + x.
+        self._anzahl = 0
+
+    def _pos(self, zelle) -> int:
+        # Position im bytearray; -1 für Zellen außerhalb der Welt.
+        x, y = zelle
+        if 0 <= x < self.breite and 0 <= y < self.hoehe:
+            return y * self.breite + x
+        return -1
+
+    def __contains__(self, zelle) -> bool:
+        try:
+            i = self._pos(zelle)
+        except (TypeError, ValueError):
+            return False
+        return i >= 0 and self.zellen[i] != 0
+
+    def __len__(self) -> int:
+        return self._anzahl
+
+    def __iter__(self):
+        # Alle Pflanzen zeilenweise von oben links nach unten rechts.
+        b = self.breite
+        for i in self._positionen():
+            yield (i % b, i // b)
+
+    def _positionen(self):
+        if np is not None:
+            return np.flatnonzero(self.als_array()).tolist()
+        positionen = []
+        i = self.zellen.find(1)
+        while i >= 0:
+            positionen.append(i)
+            i = self.zellen.find(1, i + 1)
+        return positionen
+
+    def add(self, zelle) -> None:
+        i = self._pos(zelle)
+        if i < 0:
+            raise ValueError(f"Zelle {zelle} liegt außerhalb der Welt")
+        if not self.zellen[i]:
+            self.zellen[i] = 1
+            self._anzahl += 1
+
+    def discard(self, zelle) -> None:
+        i = self._pos(zelle)
+        if i >= 0 and self.zellen[i]:
+            self.zellen[i] = 0
+            self._anzahl -= 1
+
+    def clear(self) -> None:
+        self.zellen[:] = bytes(len(self.zellen))
+        self._anzahl = 0
+
+    def als_array(self):
+        # NumPy-Sicht (hoehe x breite, uint8) auf dieselben Bytes – Änderungen wirken direkt.
+        return np.frombuffer(self.zellen, dtype=np.uint8).reshape(self.hoehe, self.breite)
+
+    def nachzaehlen(self) -> None:
+        # Nach direkten Änderungen an zellen/als_array() die Anzahl neu bestimmen.
+        self._anzahl = len(self.zellen) - self.zellen.count(0)
+
+    def als_koordinaten(self) -> array:
+        # x0, y0, x1, y1, ... (für das Binärformat).
+        if np is not None:
+            y, x = np.nonzero(self.als_array())
+            return array("I", np.column_stack((x, y)).astype(np.uint32).ravel().tobytes())
+        return array("I", [k for zelle in self for k in zelle])
+
+    def aus_koordinaten(self, koordinaten: array) -> None:
+        if np is not None:
+            xy = np.frombuffer(koordinaten, dtype=np.uint32).reshape(-1, 2)
+            self.als_array()[xy[:, 1], xy[:, 0]] = 1
+            self.nachzaehlen()
+        else:
+            self |= zip(koordinaten[0::2], koordinaten[1::2])
+
+    def _fenster(self, x: float, y: float, max_dist: float):
+        # Zeilen im Suchkreis, sortiert nach Abstand zu y (bei gleichem Abstand die obere zuerst),
+        # jeweils mit dem Spaltenbereich, den der Kreis in dieser Zeile überdeckt.
+        y0 = max(0, math.ceil(y - max_dist - 1e-9))
+        y1 = min(self.hoehe - 1, math.floor(y + max_dist + 1e-9))
+        for zeile in sorted(range(y0, y1 + 1), key=lambda z: (abs(z - y), z)):
+            halb = math.sqrt(max(0.0, max_dist * max_dist - (zeile - y) ** 2))
+            x0 = max(0, math.ceil(x - halb - 1e-9))
+            x1 = min(self.breite - 1, math.floor(x + halb + 1e-9))
+            if x0 <= x1:
+                yield zeile, x0, x1
+
+    def naechste(self, x: float, y: float, max_dist: float):
+        # Nächste Pflanze im Umkreis "max_dist" um (x, y).
+        # Die Zeilen werden von y aus abwechselnd nach oben und unten abgearbeitet; pro Zeile
+        # sucht bytearray.find/rfind (in C) die Pflanze links und rechts von x. Sobald eine Zeile
+        # weiter weg ist als der beste Fund, kann nichts Näheres mehr kommen.
+        # Gleichstand: nähere Zeile, dann obere Zeile, dann linke Zelle gewinnt.
+        z = self.zellen
+        b = self.breite
+        rand = b - 1
+        y0 = max(0, math.ceil(y - max_dist - 1e-9))
+        y1 = min(self.hoehe - 1, math.floor(y + max_dist + 1e-9))
+        oben = min(math.floor(y), y1)
+        unten = max(math.floor(y) + 1, y0)
+        # Nächste noch offene Zeile oberhalb (oben, läuft nach y0) bzw. unterhalb (unten, läuft nach y1).
+        r2 = max_dist * max_dist
+        mitte = math.ceil(x)
+        best = None
+        best_d = max_dist
+        while True:
+            if oben >= y0 and (unten > y1 or y - oben <= unten - y):
+                zeile = oben
+                oben -= 1
+            elif unten <= y1:
+                zeile = unten
+                unten += 1
+            else:
+                break
+            dy = zeile - y
+            if best is not None and abs(dy) > best_d:
+                break
+            halb = math.sqrt(max(0.0, r2 - dy * dy))
+            x0 = max(0, math.ceil(x - halb - 1e-9))
+            x1 = min(rand, math.floor(x + halb + 1e-9))
+            if x0 > x1:
+                continue
+            off = zeile * b
+            i = z.find(1, off + x0, off + x1 + 1)
+            if i < 0:
+                continue
+                # Leere Zeile: ein einziger Aufruf.
+            teilung = off + min(max(mitte, x0), x1 + 1)
+            if i < teilung:
+                # Pflanze links von x gefunden: die nächste links und die nächste rechts vergleichen.
+                kandidaten = (z.rfind(1, i, teilung), z.find(1, teilung, off + x1 + 1))
+            else:
+                kandidaten = (i,)
+            for i in kandidaten:
+                if i >= 0:
+                    d = math.hypot(i - off - x, dy)
+                    if d <= best_d and (best is None or d < best_d):
+                        best = (i - off, zeile, d)
+                        best_d = d
+        return best
+        # Gleiches Rückgabeformat wie Welt.naechste_pflanze: None oder (x, y, dist).
+
+    def kandidaten(self, x: float, y: float, max_dist: float) -> int:
+        # Pflanzen im Suchkreis (für den Profiler; die Suche selbst prüft höchstens zwei pro Zeile).
+        z = self.zellen
+        b = self.breite
+        return sum(z.count(1, zeile * b + x0, zeile * b + x1 + 1)
+                   for zeile, x0, x1 in self._fenster(x, y, max_dist))
+
+    def wachsen(self, rng, chance_zelle: float, chance_nachbar: float, band: int = 1 << 20):
+        """
+        Vektorisiertes Nachwachsen (braucht NumPy): Jede leere Zelle bekommt mit der
+        Wahrscheinlichkeit chance_zelle + chance_nachbar * (Pflanzen unter den 4 Nachbarn)
+        eine Pflanze. Maßgeblich ist der Stand vor dem Wachsen. Gerechnet wird in Bändern von
+        etwa "band" Zellen, damit auch riesige Raster nur wenig Zusatzspeicher brauchen.
+        Liefert die flachen Positionen der neuen Pflanzen (NumPy-Array).
+        """
+        if np is None:
+            raise RuntimeError("Vektorisiertes Pflanzenwachstum braucht NumPy.")
+        raster = self.als_array()
+        h, b = raster.shape
+        zeilen = max(1, band // max(1, b))
+        neu_alle = []
+        oben = np.zeros(b, dtype=np.uint8)
+        # Zeile über dem aktuellen Band im Stand VOR dem Wachsen.
+        for y0 in range(0, h, zeilen):
+            y1 = min(h, y0 + zeilen)
+            stueck = raster[y0:y1]
+            unten = raster[y1] if y1 < h else np.zeros(b, dtype=np.uint8)
+            nachbarn = np.zeros(stueck.shape, dtype=np.uint8)
+            nachbarn[1:] += stueck[:-1]
+            nachbarn[0] += oben
+            nachbarn[:-1] += stueck[1:]
+            nachbarn[-1] += unten
+            nachbarn[:, 1:] += stueck[:, :-1]
+            nachbarn[:, :-1] += stueck[:, 1:]
+            chance = chance_zelle + chance_nachbar * nachbarn.astype(np.float32)
+            neu = (stueck == 0) & (rng.random(stueck.shape, dtype=np.float32) < chance)
+            oben = stueck[-1].copy()
+            stueck[neu] = 1
+            neu_alle.append(np.flatnonzero(neu) + y0 * b)
+        neu_alle = np.concatenate(neu_alle) if neu_alle else np.empty(0, dtype=np.intp)
+        self._anzahl += len(neu_alle)
+        return neu_alle
+
+class Wachstum(NamedTuple):
+    """
+    Einstellungen für flächiges Pflanzenwachstum (Welt.wachstum, siehe PflanzenRaster.wachsen).
+    Die Raten schwanken über das Jahr: Faktor 1 + amplitude * sin(2 * pi * tick / periode).
+    """
+    chance_zelle: float = 0.0001
+    # Grundchance pro leerer Zelle und Tick.
+    chance_nachbar: float = 0.002
+    # Zusätzlich pro Pflanze unter den 4 Nachbarzellen (Ausbreitung / "Diffusion").
+    amplitude: float = 0.0
+    # Stärke der Jahreszeiten (0 = keine, 1 = im "Winter" gar kein Wachstum).
+    periode: int = 1000
+    # Länge eines Jahres in Ticks.
+
+    def faktor(self, tick: int) -> float:
+        return max(0.0, 1.0 + self.amplitude * math.sin(2 * math.pi * tick / self.periode))
+
+class Verteilung(Enum):
+    # Räumliche Verteilung beim Ansiedeln vieler Tiere auf einmal (Welt.tiere_ansiedeln).
+    GLEICH = "gleich"
+    # Jede Position gleich wahrscheinlich (wie add_tier ohne x/y).
+    HAUFEN = "haufen"
+    # Um einige zufällige Zentren gehäuft (Normalverteilung um das Zentrum, z. B. Herden).
+    POISSON = "poisson"
+    # Gleichmäßig gestreut mit Mindestabstand ("Poisson-Disk"), hier als gezittertes Gitter.
+
+def positionen_verteilen(rng, anzahl: int, breite: int, hoehe: int,
+                         verteilung: Verteilung = Verteilung.GLEICH, *, haufen: int = 8,
+                         streuung: float = 3.0, zittern: float = 0.5):
+    """
+    "anzahl" Positionen (x, y als NumPy-Arrays) in [0, breite-1] x [0, hoehe-1] ziehen.
+    rng ist ein NumPy-Generator. HAUFEN: "haufen" Zentren, Abweichung mit Standardabweichung
+    "streuung" (an den Rändern gespiegelt). POISSON: Die Fläche wird in mindestens "anzahl"
+    gleich große Gitterzellen geteilt, jede Position bekommt eine eigene Zelle und wackelt darin
+    um bis zu "zittern" Zellbreiten – zwei Tiere liegen so mindestens (1 - zittern) Zellbreiten
+    auseinander. Kein echtes Poisson-Disk-Sampling, aber ohne Verwerfen und Nachwürfeln.
+    """
+    rand_x, rand_y = breite - 1, hoehe - 1
+    if verteilung == Verteilung.POISSON and anzahl and rand_x > 0 and rand_y > 0:
+        seite = math.sqrt(rand_x * rand_y / anzahl)
+        while True:
+            spalten = max(1, int(rand_x / seite))
+            zeilen = max(1, int(rand_y / seite))
+            if spalten * zeilen >= anzahl:
+                break
+            seite *= 0.95
+            # Wegen des Abrundens reicht die erste Schätzung manchmal nicht ganz.
+        zellen = rng.choice(spalten * zeilen, anzahl, replace=False)
+        x = (zellen % spalten + 0.5 + (rng.random(anzahl) - 0.5) * zittern) * (rand_x / spalten)
+        y = (zellen // spalten + 0.5 + (rng.random(anzahl) - 0.5) * zittern) * (rand_y / zeilen)
+        return x, y
+    if verteilung == Verteilung.HAUFEN:
+        zentrum = rng.integers(0, max(1, haufen), anzahl)
+        x = rng.uniform(0, rand_x, max(1, haufen))[zentrum] + rng.normal(0, streuung, anzahl)
+        y = rng.uniform(0, rand_y, max(1, haufen))[zentrum] + rng.normal(0, streuung, anzahl)
+        x = np.clip(rand_x - np.abs(rand_x - np.abs(x)), 0, rand_x)
+        y = np.clip(rand_y - np.abs(rand_y - np.abs(y)), 0, rand_y)
+        # Wie beim Abprall: an beiden Rändern spiegeln, danach sicherheitshalber begrenzen.
+        return x, y
+    return rng.uniform(0, rand_x, anzahl), rng.uniform(0, rand_y, anzahl)
+    # GLEICH (und POISSON in einer Welt, die nur eine Zelle breit oder hoch ist).
+
+class TierIndex(BlockIndex):
+    """
+    Räumlicher Hash ("Spatial Hash") für bewegliche Objekte, hier: Tiere.
+    Wie ein Raster-Index, aber Tiere wechseln ständig ihre Position. Darum merkt sich
+    jedes Tier seinen aktuellen Block (Attribut _index_block) und wird nur dann
+    umsortiert, wenn es tatsächlich die Blockgrenze überschreitet.
+    """
+
+    def einfuegen(self, tier: Tier) -> None:
+        block = self._block(tier.x, tier.y)
+        self.eimer.setdefault(block, set()).add(tier)
+        tier._index_block = block
+        # Block am Tier merken, damit verschieben()/entfernen() ihn nicht suchen müssen.
+
+    def entfernen(self, tier: Tier) -> None:
+        block = tier._index_block
+        inhalt = self.eimer.get(block)
+        if inhalt is not None:
+            inhalt.discard(tier)
+            if not inhalt:
+                del self.eimer[block]
+
+    def einfuegen_viele(self, tiere) -> None:
+        # Wie einfuegen(), aber für viele Tiere auf einmal (z. B. beim Laden) – spart Methodenaufrufe.
+        z = self.zelle
+        eimer = self.eimer
+        for tier in tiere:
+            block = (int(tier.x // z), int(tier.y // z))
+            inhalt = eimer.get(block)
+            if inhalt is None:
+                eimer[block] = inhalt = set()
+            inhalt.add(tier)
+            tier._index_block = block
+
+    def verschieben(self, tier: Tier) -> None:
+        # Nach jeder Positionsänderung aufrufen. Im Normalfall (gleicher Block) passiert nichts.
+        block = self._block(tier.x, tier.y)
+        if block != tier._index_block:
+            self.entfernen(tier)
+            self.eimer.setdefault(block, set()).add(tier)
+            tier._index_block = block
+
+    def naechstes(self, x: float, y: float, max_dist: float, *, ausser: Tier | None = None,
+                  nahrung: Nahrung | None = None):
+        # Nächstes Tier im Umkreis "max_dist" um (x, y), optional nur einer Ernährungsart.
+        # Bei exakt gleichem Abstand gewinnt das Tier, das in welt.tiere weiter vorne steht
+        # (Attribut _reihenfolge) – genau wie bei der linearen Suche über die Liste.
+        bx0, by0 = self._block(x - max_dist, y - max_dist)
+        bx1, by1 = self._block(x + max_dist, y + max_dist)
+
+        best = None
+        for bx in range(bx0, bx1 + 1):
+            for by in range(by0, by1 + 1):
+                inhalt = self.eimer.get((bx, by))
+                if not inhalt:
+                    continue
+                for t in inhalt:
+                    if t is ausser or (nahrung is not None and t.nahrung != nahrung):
+                        continue
+                    d = math.hypot(t.x - x, t.y - y)
+                    if d <= max_dist and (
+                        best is None or d < best[1]
+                        or (d == best[1] and t._reihenfolge < best[0]._reihenfolge)
+                    ):
+                        best = (t, d)
+        return best
+        # Rückgabe entweder None oder (TierObjekt, Distanz).
+
+class Aenderungen:
+    """
+    Änderungsprotokoll ("Dirty Tracking") der Welt seit dem letzten Abholen.
+    Die Welt trägt hier ein, welche Pflanzen neu/weg sind und welche Tiere sich bewegt haben
+    oder verschwunden sind. Eine Anzeige muss dann nur diese Dinge neu zeichnen.
+    Jeder Interessent meldet sein eigenes Protokoll an (Welt.journal_anmelden).
+    """
+    def __init__(self):
+        self.pflanzen_neu: set[tuple[int, int]] = set()
+        self.pflanzen_weg: set[tuple[int, int]] = set()
+        self.tiere_bewegt: set[Tier] = set()
+        # Enthält auch neu hinzugekommene Tiere (die Anzeige kennt sie dann noch nicht).
+        self.tiere_weg: set[Tier] = set()
+
+    def pflanze_neu(self, zelle: tuple[int, int]) -> None:
+        # Weg und wieder da (im selben Zeitraum) hebt sich auf.
+        if zelle in self.pflanzen_weg:
+            self.pflanzen_weg.discard(zelle)
+        else:
+            self.pflanzen_neu.add(zelle)
+
+    def pflanze_weg(self, zelle: tuple[int, int]) -> None:
+        if zelle in self.pflanzen_neu:
+            self.pflanzen_neu.discard(zelle)
+        else:
+            self.pflanzen_weg.add(zelle)
+
+    def tier_weg(self, tier: Tier) -> None:
+        self.tiere_bewegt.discard(tier)
+        self.tiere_weg.add(tier)
+
+    def leeren(self) -> None:
+        self.pflanzen_neu.clear()
+        self.pflanzen_weg.clear()
+        self.tiere_bewegt.clear()
+        self.tiere_weg.clear()
+
+class Population:
+    """
+    Behälter für die Tiere einer Welt mit festen Nummern (Tier.id).
+    Verhält sich wie eine Liste (for, len, in, Index), aber "in" und remove() kosten O(1):
+    Lebende Tiere stehen zusätzlich in einem dict id -> Tier. Entfernte Tiere bleiben
+    zunächst in der Liste stehen ("Grabstein") und werden erst beim nächsten Durchlaufen
+    oder Mischen in einem Rutsch herausgefiltert. Die Reihenfolge der übrigen Tiere bleibt
+    dabei erhalten – Mischen mit demselben Zufallsgenerator ergibt also dieselbe Reihenfolge
+    wie früher mit einer einfachen Liste.
+    """
+    def __init__(self):
+        self._liste: list[Tier] = []
+        # Alle Tiere in Reihenfolge, evtl. mit schon entfernten dazwischen.
+
+        self._nach_id: dict[int, Tier] = {}
+        # Nur die lebenden Tiere: id -> Tier.
+
+        self._tote = 0
+        # Wie viele entfernte Tiere noch in _liste stehen.
+
+    def __contains__(self, tier) -> bool:
+        # O(1): Ist genau dieses Tier noch in der Welt?
+        return self._nach_id.get(getattr(tier, "id", None)) is tier
+
+    def __len__(self) -> int:
+        return len(self._nach_id)
+
+    def __iter__(self):
+        return iter(self._aufgeraeumt())
+
+    def __getitem__(self, i):
+        return self._aufgeraeumt()[i]
+
+    def _aufgeraeumt(self) -> list[Tier]:
+        # Grabsteine entfernen (stabil, O(n) – aber nur einmal nach beliebig vielen remove()).
+        if self._tote:
+            lebend = self._nach_id
+            self._liste = [t for t in self._liste if lebend.get(t.id) is t]
+            self._tote = 0
+        return self._liste
+
+    def nach_id(self, tier_id: int):
+        # Lebendes Tier zu einer id (oder None).
+        return self._nach_id.get(tier_id)
+
+    def append(self, tier: Tier) -> None:
+        self._aufgeraeumt()
+        # Vorher aufräumen: Ein entferntes und wieder eingefügtes Tier darf nicht doppelt auftauchen.
+        self._liste.append(tier)
+        self._nach_id[tier.id] = tier
+
+    def extend(self, tiere: list[Tier]) -> None:
+        self._aufgeraeumt()
+        self._liste.extend(tiere)
+        for t in tiere:
+            self._nach_id[t.id] = t
+
+    def remove(self, tier: Tier) -> None:
+        # O(1): nur aus dem dict nehmen; in der Liste bleibt ein Grabstein.
+        if self._nach_id.get(tier.id) is not tier:
+            raise ValueError(f"{tier!r} ist nicht in der Population")
+        del self._nach_id[tier.id]
+        self._tote += 1
+
+    def mischen(self, rng: random.Random) -> list[Tier]:
+        # Reihenfolge zufällig mischen (wie rng.shuffle(liste)) und die Liste zurückgeben.
+        liste = self._aufgeraeumt()
+        rng.shuffle(liste)
+        return liste
+
+class Zeitplan:
+    """
+    Optionaler Ablaufplan für Welt.tick: Nur Tiere, die gerade etwas tun können, kommen dran.
+    Ohne Zeitplan besucht jeder Tick ALLE Tiere – auch solche mit 0 Energie (die sofort
+    aufhören) und solche, die nur schlafen. Mit Zeitplan (welt.zeitplan = Zeitplan(welt)):
+      - Tiere mit 0 Energie scheiden aus dem Plan aus (sie bleiben in der Welt, z. B. als Beute).
+      - Ein Tier, das mangels Futter einschläft, schläft am Stück, bis es wieder über der
+        Müdigkeitsschwelle ist. Die Energie dafür bekommt es sofort; es wird erst im Tick nach
+        dem Ausschlafen wieder besucht. Die Wecktermine liegen in einem "Zeitrad"
+        (Liste von Fächern, Fach = Wecktick % ZEITPLAN_FAECHER) – Einschlafen und Aufwachen
+        kosten O(1), ein Tick kostet O(aktive Tiere) statt O(alle Tiere).
+    Achtung, das ändert den Ablauf: Ein Schläfer bemerkt Futter erst nach dem Aufwachen,
+    und gemischt werden nur die aktiven Tiere. Läufe mit und ohne Zeitplan unterscheiden sich
+    also (sind aber jeweils für sich reproduzierbar). Der Plan wird nicht gespeichert;
+    nach Welt.load einfach einen neuen anlegen.
+    """
+    def __init__(self, welt: "Welt"):
+        self.aktiv: dict[int, Tier] = {t.id: t for t in welt.tiere if t.energie > 0}
+        # Tiere, die in jedem Tick drankommen (id -> Tier, Einfügereihenfolge bleibt erhalten).
+
+        self._rad: list[list[tuple[int, Tier]]] = [[] for _ in range(ZEITPLAN_FAECHER)]
+        # Schlafende Tiere als (Wecktick, Tier) im Fach Wecktick % ZEITPLAN_FAECHER.
+
+        self.schlafend = 0
+        self.ausgeschieden = len(welt.tiere) - len(self.aktiv)
+        # Zähler für Anzeige/Auswertung.
+
+    def aufnehmen(self, tier: Tier) -> None:
+        # Neues (oder wiederbelebtes) Tier ab dem nächsten Tick einplanen.
+        if tier.energie > 0:
+            self.aktiv[tier.id] = tier
+
+    def einschlafen(self, tier: Tier, welt: "Welt") -> None:
+        # Tier hat gerade eine Stunde geschlafen: Rest der Ruhezeit am Stück und aus dem Plan nehmen.
+        schwelle = (MUEDE_PFLANZENFRESSER if tier.nahrung == Nahrung.PFLANZENFRESSER
+                    else MUEDE_FLEISCHFRESSER)
+        stunden = -(-(schwelle - tier.energie) // ERHOLUNG_PRO_STUNDE)
+        # Aufgerundete Division: so viele weitere Schlaf-Ticks bräuchte das Tier ohne Zeitplan.
+        if stunden <= 0 or self.aktiv.pop(tier.id, None) is None:
+            return
+        tier.schlafen(stunden)
+        weckt = welt.tick_nr + stunden + 1
+        self._rad[weckt % ZEITPLAN_FAECHER].append((weckt, tier))
+        self.schlafend += 1
+
+    def faellige(self, welt: "Welt") -> list[Tier]:
+        # Am Anfang eines Ticks: Fällige Schläfer wecken, ausgeschiedene Tiere streichen und
+        # die aktiven Tiere gemischt zurückgeben (ersetzt Welt._mischen für diesen Tick).
+        nr = welt.tick_nr
+        fach = self._rad[nr % ZEITPLAN_FAECHER]
+        if fach:
+            spaeter = []
+            for weckt, tier in fach:
+                if weckt > nr:
+                    spaeter.append((weckt, tier))
+                    # Liegt mindestens eine Radumdrehung in der Zukunft.
+                    continue
+                self.schlafend -= 1
+                if tier in welt.tiere:
+                    self.aktiv[tier.id] = tier
+            self._rad[nr % ZEITPLAN_FAECHER] = spaeter
+
+        tiere = welt.tiere
+        lebende = [t for t in self.aktiv.values() if t.energie > 0 and t in tiere]
+        if len(lebende) != len(self.aktiv):
+            self.ausgeschieden += sum(1 for t in self.aktiv.values() if t.energie <= 0 and t in tiere)
+            self.aktiv = {t.id: t for t in lebende}
+            # Erlegte Tiere fallen einfach heraus, erschöpfte zählen als ausgeschieden.
+
+        welt.rng.shuffle(lebende)
+        for i, t in enumerate(lebende):
+            t._reihenfolge = i
+        welt._reihenfolge_zaehler = len(lebende)
+        # Wie Welt._mischen, nur über die aktiven Tiere.
+        return lebende
 
 class Welt:
     """
     Eine einfache 2D-Welt.
-    Hält Größe, Pflanzen (als Koordinaten-Set), Tiere (als Liste) und ein optionales Ereignis-Callback.
+    Hält Größe, Pflanzen (als Raster, siehe PflanzenRaster), Tiere (als Liste) und ein optionales Ereignis-Callback.
     Steuert die Simulation über die Methode tick().
     """
     def __init__(self, breite: int, hoehe: int, samen: int | None = 7):
@@ -360,43 +1106,285 @@ class Welt:
         self.hoehe = hoehe
         # Anzahl Zellen vertikal.
 
-        if samen is not None:
-            random.seed(samen)
-            # "Seed" für Zufallszahlen: gleiche Startwerte -> reproduzierbares Verhalten (nützlich für Tests/Demos).
+        self.rng = random.Random(samen)
+        # Eigener Zufallszahlengenerator pro Welt (statt des globalen "random"-Moduls).
+        # "Seed" (samen): gleiche Startwerte -> reproduzierbares Verhalten (nützlich für Tests/Demos).
+        # Mehrere Welten im selben Prozess beeinflussen sich so nicht gegenseitig.
+        # samen=None: zufälliger Startwert vom Betriebssystem.
 
-        self.pflanzen: set[tuple[int, int]] = set()
-        # Set von Pflanzen-Positionen (jede Pflanze sitzt auf einer Gitterzelle).
-        # Type Hint "set[tuple[int,int]]": Menge von Tupeln (x,y).
+        self.nachwuchs_chance = 0.06
+        # Chance pro Tick, dass eine Pflanze nachwächst (wird in tick() an regrow_pflanzen übergeben).
 
-        self.tiere: list[Tier] = []
-        # Liste aller Tiere in der Welt (Type Hint: list[Tier]).
+        self.pflanzen = PflanzenRaster(breite, hoehe)
+        # Pflanzen-Positionen (jede Pflanze sitzt auf einer Gitterzelle) als Raster.
+        # Verhält sich wie ein Set von Tupeln (x,y); die Suche nach der nächsten Pflanze
+        # schaut nur in die Zellen im Umkreis und hängt nicht von der Gesamtzahl ab.
+        # Wichtig: Pflanzen nur über pflanze_setzen()/pflanze_entfernen() ändern,
+        # damit angemeldete Journale (Anzeige) Bescheid bekommen.
 
-        self.on_event: callable | None = None
-        # Optionaler Callback (Funktion), den die GUI setzen kann, um Statusmeldungen zu empfangen.
-        # "callable | None": Entweder eine aufrufbare Funktion ODER None (kein Callback gesetzt).
+        self.wachstum: Wachstum | None = None
+        # None: pro Tick wächst höchstens eine Pflanze (regrow_pflanzen mit nachwuchs_chance).
+        # Sonst: flächiges Wachstum auf allen Zellen gleichzeitig (braucht NumPy).
+
+        self.tiere = Population()
+        # Alle Tiere in der Welt; verhält sich wie eine Liste, "in" und Entfernen kosten aber O(1).
+        # Tiere nur über add_tier()/tier_entfernen() ändern (wegen des Tierindex).
+
+        self.tier_index = TierIndex(INDEX_ZELLE)
+        # Räumlicher Hash über alle Tiere für die Jagd (naechster_pflanzenfresser).
+
+        self._reihenfolge_zaehler = 0
+        # Laufende Nummer für Tier._reihenfolge (Position in der gemischten Liste, siehe tick()).
+
+        self._journale: list[Aenderungen] = []
+        # Angemeldete Änderungsprotokolle (z. B. von der GUI). Ohne Interessenten leer -> kein Aufwand.
+        self._tier_journale: list[Aenderungen] = []
+        # Die davon, die auch Tierbewegungen wollen (alle außer reinen Pflanzenprotokollen).
+
+        self._beobachter: list = []
+        # Funktionen f(welt), die nach jedem Tick aufgerufen werden (z. B. Aufzeichnung, Messreihen).
+
+        self.tick_nr = 0
+        # Zähler der Simulationsschritte (erster Tick = 1).
+
+        self.profiler = None
+        # Optionale Zeitmessung pro Tick-Phase (siehe tickprofiler.py). None = aus, kostet dann nichts.
+
+        self.flussfeld = None
+        # Optionales Feld "nächste Pflanze je Zelle" (siehe flussfeld.py). None = Umkreissuche im Raster.
+
+        self.zeitplan: Zeitplan | None = None
+        # Optionaler Ablaufplan (siehe Zeitplan). None = jeder Tick besucht alle Tiere.
+
+        self.zufallsstrom = None
+        # Optionaler zählerbasierter Zufall (siehe zufallsstrom.py) für Wandern und Nachwachsen.
+        # None = beides zieht der Reihe nach aus self.rng.
+
+        self.ereignisse = EreignisPuffer()
+        # Ringpuffer mit den letzten Ereignissen (Abprall, Weiden, Erlegen) als kompakte Datensätze.
+        # Wer Meldungen anzeigen will, liest sie dort aus und formatiert mit ereignis_text().
+
+        self._naechste_id = 0
+        self._entfernte_namen: dict[int, str] = {}
+        # id -> Name der erlegten Tiere, damit Ereignisse später noch Namen bekommen.
+
+    def pflanze_setzen(self, zelle: tuple[int, int]) -> None:
+        # Pflanze auf eine Zelle des Rasters setzen und alle angemeldeten Journale benachrichtigen.
+        if zelle not in self.pflanzen:
+            self.pflanzen.add(zelle)
+            for j in self._journale:
+                j.pflanze_neu(zelle)
+
+    def pflanze_entfernen(self, zelle: tuple[int, int]) -> None:
+        # Pflanze entfernen (z. B. gefressen): Zelle im Raster leeren und die Journale benachrichtigen.
+        if zelle in self.pflanzen:
+            self.pflanzen.remove(zelle)
+            for j in self._journale:
+                j.pflanze_weg(zelle)
 
     def add_pflanzen_random(self, anzahl: int) -> None:
         # Füge "anzahl" Pflanzen an zufälligen Positionen hinzu.
         for _ in range(anzahl):
-            self.pflanzen.add((random.randrange(self.breite), random.randrange(self.hoehe)))
-            # random.randrange(n) liefert eine Zufallszahl 0..n-1.
+            self.pflanze_setzen((self.rng.randrange(self.breite), self.rng.randrange(self.hoehe)))
+            # randrange(n) liefert eine Zufallszahl 0..n-1.
+
+    def pflanzen_saeen(self, anzahl: int) -> None:
+        # Wie add_pflanzen_random, aber für Millionen Pflanzen (braucht NumPy): Es werden genau
+        # "anzahl" verschiedene, bisher freie Zellen gezogen – ohne Kollisionen und Nachwürfeln.
+        if np is None:
+            raise RuntimeError("pflanzen_saeen braucht NumPy.")
+        raster = self.pflanzen.als_array().reshape(-1)
+        frei = np.flatnonzero(raster == 0)
+        if anzahl > len(frei):
+            raise ValueError(f"Nur noch {len(frei)} freie Zellen für {anzahl} Pflanzen.")
+        np_rng = np.random.default_rng(self.rng.getrandbits(64))
+        # Wie bei pflanzen_wachsen aus dem Weltzufall abgeleitet (gleicher Samen -> gleiche Pflanzen).
+        neu = np_rng.choice(frei, anzahl, replace=False)
+        raster[neu] = 1
+        self.pflanzen.nachzaehlen()
+        if self._journale:
+            b = self.breite
+            for i in neu.tolist():
+                for j in self._journale:
+                    j.pflanze_neu((i % b, i // b))
 
     def regrow_pflanzen(self, chance_pro_tick: float = 0.06) -> None:
         # Mit einer bestimmten Chance wächst pro Tick eine neue Pflanze irgendwo.
-        if random.random() < chance_pro_tick:
-            # random.random() gibt Zahl in [0.0, 1.0).
-            self.pflanzen.add((random.randrange(self.breite), random.randrange(self.hoehe)))
+        if self.zufallsstrom is not None:
+            zelle = self.zufallsstrom.nachwuchs(self.tick_nr, chance_pro_tick, self.breite, self.hoehe)
+            if zelle is not None:
+                self.pflanze_setzen(zelle)
+            return
+        if self.rng.random() < chance_pro_tick:
+            # random() gibt Zahl in [0.0, 1.0).
+            self.pflanze_setzen((self.rng.randrange(self.breite), self.rng.randrange(self.hoehe)))
+
+    def pflanzen_wachsen(self, wachstum: Wachstum) -> None:
+        # Flächiges Wachstum für alle Zellen auf einmal (siehe PflanzenRaster.wachsen).
+        faktor = wachstum.faktor(self.tick_nr)
+        if faktor <= 0:
+            return
+        np_rng = np.random.default_rng(self.rng.getrandbits(64))
+        # NumPy-Zufall aus dem Weltzufall ableiten: gleicher Samen -> gleiches Wachstum,
+        # und Speichern/Laden (nur self.rng wird gesichert) bleibt reproduzierbar.
+        neu = self.pflanzen.wachsen(np_rng, wachstum.chance_zelle * faktor,
+                                    wachstum.chance_nachbar * faktor)
+        if self._journale:
+            b = self.breite
+            for i in neu.tolist():
+                for j in self._journale:
+                    j.pflanze_neu((i % b, i // b))
+
+    def _nachwachsen(self) -> None:
+        # Pflanzenphase am Ende eines Ticks.
+        if self.wachstum is None:
+            self.regrow_pflanzen(self.nachwuchs_chance)
+        else:
+            self.pflanzen_wachsen(self.wachstum)
 
     def add_tier(self, tier: Tier, x: float | None = None, y: float | None = None) -> None:
         # Tier hinzufügen. Falls keine Position vorgegeben, wähle zufällige.
-        tier.x = random.uniform(0, self.breite - 1) if x is None else x
-        # random.uniform(a,b): Gleitkomma-Zahl in [a,b].
-        tier.y = random.uniform(0, self.hoehe - 1) if y is None else y
+        tier.x = self.rng.uniform(0, self.breite - 1) if x is None else x
+        # uniform(a,b): Gleitkomma-Zahl in [a,b].
+        tier.y = self.rng.uniform(0, self.hoehe - 1) if y is None else y
+        tier.id = self._naechste_id
+        self._naechste_id += 1
+        # Fortlaufende, nie wiederverwendete Nummer.
+        self._tier_aufnehmen(tier)
+
+    def tiere_ansiedeln(self, arten: dict[str, int], verteilung: Verteilung | str = Verteilung.GLEICH,
+                        *, namen: dict[str, list[str]] | None = None, **einstellungen) -> list[Tier]:
+        # Viele Tiere auf einmal einsetzen (braucht NumPy), z. B. {"Loewe": 1000, "Nilpferd": 50000}.
+        # Alle Positionen werden in einem Rutsch gezogen (positionen_verteilen, "einstellungen"
+        # wie haufen=, streuung=, zittern= gehen dorthin), danach einmal in alle Strukturen
+        # eingetragen. Namen: aus "namen" (pro Art eine Liste), sonst "<Art><Nummer>".
+        if np is None:
+            raise RuntimeError("tiere_ansiedeln braucht NumPy.")
+        verteilung = Verteilung(verteilung)
+        # Erlaubt auch Text ("haufen"), etwa von der Kommandozeile.
+        anzahl = sum(arten.values())
+        np_rng = np.random.default_rng(self.rng.getrandbits(64))
+        xs, ys = positionen_verteilen(np_rng, anzahl, self.breite, self.hoehe, verteilung, **einstellungen)
+        xs, ys = xs.tolist(), ys.tolist()
+        # Python-Listen: Einzelzugriffe darauf sind viel schneller als auf NumPy-Arrays.
+
+        war_an = gc.isenabled()
+        gc.disable()
+        # Wie in aus_bytes: beim Anlegen sehr vieler Objekte die Speicherbereinigung pausieren.
+        try:
+            tiere = []
+            i = 0
+            for name, n in arten.items():
+                klasse = ARTEN[name]
+                art_namen = (namen or {}).get(name) or [f"{name}{k + 1}" for k in range(n)]
+                if len(art_namen) < n:
+                    raise ValueError(f"{n} Tiere der Art {name}, aber nur {len(art_namen)} Namen.")
+                for k in range(n):
+                    tier = klasse(art_namen[k], x=xs[i], y=ys[i])
+                    tier.id = self._naechste_id + i
+                    tiere.append(tier)
+                    i += 1
+            self._naechste_id += anzahl
+            self._tiere_aufnehmen(tiere)
+        finally:
+            if war_an:
+                gc.enable()
+        return tiere
+
+    def _tier_aufnehmen(self, tier: Tier) -> None:
+        # Tier mit bereits gesetzter Position und id in alle Verwaltungsstrukturen eintragen.
         self.tiere.append(tier)
+        tier._reihenfolge = self._reihenfolge_zaehler
+        self._reihenfolge_zaehler += 1
+        # Neue Tiere stehen am Ende der Liste -> größte Reihenfolge-Nummer.
+        self.tier_index.einfuegen(tier)
+        for j in self._tier_journale:
+            j.tiere_bewegt.add(tier)
+        if self.zeitplan is not None:
+            self.zeitplan.aufnehmen(tier)
+
+    def _tiere_aufnehmen(self, tiere: list[Tier]) -> None:
+        # Wie _tier_aufnehmen(), aber für viele Tiere auf einmal (Laden großer Welten).
+        start = self._reihenfolge_zaehler
+        for i, tier in enumerate(tiere):
+            tier._reihenfolge = start + i
+        self._reihenfolge_zaehler = start + len(tiere)
+        self.tiere.extend(tiere)
+        self.tier_index.einfuegen_viele(tiere)
+        for j in self._tier_journale:
+            j.tiere_bewegt.update(tiere)
+        if self.zeitplan is not None:
+            for tier in tiere:
+                self.zeitplan.aufnehmen(tier)
+
+    def tier_entfernen(self, tier: Tier) -> None:
+        # Tier aus der Welt nehmen (z. B. erlegt).
+        self.tiere.remove(tier)
+        # O(1), siehe Population.
+        self.tier_index.entfernen(tier)
+        self._entfernte_namen[tier.id] = tier.name
+        for j in self._tier_journale:
+            j.tier_weg(tier)
+
+    def tier_bewegt(self, tier: Tier) -> None:
+        # Wird von Tier aufgerufen, nachdem sich x/y geändert haben.
+        self.tier_index.verschieben(tier)
+        for j in self._tier_journale:
+            j.tiere_bewegt.add(tier)
+
+    def tier_schlaeft(self, tier: Tier) -> None:
+        # Wird von Tier aufgerufen, wenn es mangels Futter geschlafen hat.
+        if self.zeitplan is not None:
+            self.zeitplan.einschlafen(tier, self)
+
+    def tier_name(self, tier_id: int) -> str:
+        # Name zu einer Tier-id (auch für bereits erlegte Tiere).
+        tier = self.tiere.nach_id(tier_id)
+        return tier.name if tier is not None else self._entfernte_namen.get(tier_id, f"#{tier_id}")
+
+    def ereignis_text(self, e: Ereignis) -> str:
+        # Lesbare Meldung zu einem Ereignis – wird nur aufgerufen, wenn jemand sie anzeigen will.
+        name = self.tier_name(e.akteur)
+        if e.art == EreignisArt.ABPRALL:
+            return f"{name} prallt an der Grenze ab."
+        if e.art == EreignisArt.WEIDEN:
+            return f"{name} weidet bei {(int(e.x), int(e.y))}."
+        return f"{name} erlegt {self.tier_name(e.ziel)}."
+
+    def journal_anmelden(self, tiere: bool = True) -> Aenderungen:
+        # Neues Änderungsprotokoll anlegen; ab jetzt werden alle Änderungen dort eingetragen.
+        # Mit tiere=False nur die Pflanzen: Tierbewegungen (jeder Schritt jedes Tiers) kosten dann
+        # nichts, z. B. für das Flussfeld, das nur Pflanzen braucht.
+        journal = Aenderungen()
+        self._journale.append(journal)
+        if tiere:
+            self._tier_journale.append(journal)
+        return journal
+
+    def journal_abmelden(self, journal: Aenderungen) -> None:
+        self._journale.remove(journal)
+        if journal in self._tier_journale:
+            self._tier_journale.remove(journal)
+
+    def beobachter_anmelden(self, funktion) -> None:
+        # funktion(welt) wird ab jetzt am Ende jedes Ticks aufgerufen.
+        self._beobachter.append(funktion)
+
+    def beobachter_abmelden(self, funktion) -> None:
+        self._beobachter.remove(funktion)
 
     def naechste_pflanze(self, x: float, y: float, max_dist: float):
         # Suche die NÄCHSTE Pflanze innerhalb von "max_dist".
-        # Einfacher Algorithmus: gehe alle Pflanzen durch und merke die beste (kleinsten Abstand).
+        # Über das Raster werden nur Zellen im Umkreis geprüft – oder, mit Flussfeld, nur nachgeschlagen.
+        index = self.pflanzen if self.flussfeld is None else self.flussfeld
+        if self.profiler is not None:
+            return self.profiler.abfrage("pflanze", index, index.naechste, x, y, max_dist)
+        return index.naechste(x, y, max_dist)
+        # Rückgabe entweder None (keine in Reichweite) oder (x,y,dist).
+
+    def _naechste_pflanze_linear(self, x: float, y: float, max_dist: float):
+        # Ursprünglicher Algorithmus ohne Index (zum Vergleichen/Testen):
+        # gehe alle Pflanzen durch und merke die beste (kleinsten Abstand).
         best = None
         for (px, py) in self.pflanzen:
             d = math.hypot(px - x, py - y)
@@ -409,7 +1397,19 @@ class Welt:
         # Rückgabe entweder None (keine in Reichweite) oder (x,y,dist).
 
     def naechster_pflanzenfresser(self, jaeger: Tier, max_dist: float):
-        # Suche den nächsten Pflanzenfresser (für Fleischfresser).
+        # Suche den nächsten Pflanzenfresser (für Fleischfresser) über den Tierindex.
+        # Liefert dasselbe Ergebnis wie die lineare Suche unten, besucht aber nur Nachbarblöcke.
+        if self.profiler is not None:
+            return self.profiler.abfrage(
+                "beute", self.tier_index, self.tier_index.naechstes, jaeger.x, jaeger.y, max_dist,
+                ausser=jaeger, nahrung=Nahrung.PFLANZENFRESSER,
+            )
+        return self.tier_index.naechstes(
+            jaeger.x, jaeger.y, max_dist, ausser=jaeger, nahrung=Nahrung.PFLANZENFRESSER
+        )
+
+    def _naechster_pflanzenfresser_linear(self, jaeger: Tier, max_dist: float):
+        # Ursprünglicher Algorithmus ohne Index (zum Vergleichen/Testen).
         best = None
         for t in self.tiere:
             if t is jaeger or t.nahrung != Nahrung.PFLANZENFRESSER:
@@ -424,26 +1424,482 @@ class Welt:
 
     def tick(self) -> None:
         # Ein Simulationsschritt für die gesamte Welt:
-        random.shuffle(self.tiere)
-        # Reihenfolge zufällig mischen (Fairness: nicht immer dieselbe Reihenfolge).
-
-        lebende = list(self.tiere)
-        # Kopie der Liste, damit wir sicher iterieren können,
-        # auch wenn während des Ticks Tiere aus self.tiere entfernt werden (Beute).
+        if self.profiler is not None:
+            self.profiler.tick_messen(self)
+            # Mit Profiler läuft derselbe Ablauf (_tick_ablauf), aber mit Stoppuhr für jede Phase.
+        else:
+            self._tick_ablauf()
+
+        for beobachter in self._beobachter:
+            beobachter(self)
+            # Angemeldete Beobachter sehen den fertigen Stand nach dem Tick.
+
+    def _tick_ablauf(self, runde=None) -> None:
+        # Der eigentliche Tick. "runde" ist eine optionale Stoppuhr (TickProfiler): runde(phase)
+        # wird am Ende jeder Phase aufgerufen und schreibt ihr die Zeit seit dem letzten Aufruf zu.
+        # Ohne Stoppuhr kostet das nur die Abfragen "runde is not None".
+        self.tick_nr += 1
+        if self.zeitplan is not None:
+            lebende = self.zeitplan.faellige(self)
+            # Nur die aktiven Tiere (ohne Schläfer und Erschöpfte), schon gemischt.
+            if runde is not None:
+                runde("mischen")
+                # Mit Zeitplan sind Wecken, Aussortieren und Mischen ein Schritt.
+        else:
+            self._mischen()
+            if runde is not None:
+                runde("mischen")
+            lebende = list(self.tiere)
+            # Kopie der Liste, damit wir sicher iterieren können,
+            # auch wenn während des Ticks Tiere aus self.tiere entfernt werden (Beute).
+            if runde is not None:
+                runde("kopie")
 
         for t in lebende:
-            if t in self.tiere:
-                # Prüfen, ob Tier noch existiert (könnte bereits gefressen sein).
+            noch_da = t in self.tiere
+            # Prüfen, ob Tier noch existiert (könnte bereits gefressen sein) – O(1).
+            if runde is not None:
+                runde("mitgliedschaft")
+            if noch_da:
                 t.tick(self)
                 # Das einzelne Tier führt seinen Tick aus.
+                if runde is not None:
+                    runde("tiere")
+
+        self._nachwachsen()
+        # Chance auf Nachwachsen einer Pflanze (bzw. flächiges Wachstum, falls eingestellt).
+        if runde is not None:
+            runde("nachwachsen")
+
+    def _mischen(self) -> None:
+        tiere = self.tiere.mischen(self.rng)
+        # Reihenfolge zufällig mischen (Fairness: nicht immer dieselbe Reihenfolge).
 
-        self.regrow_pflanzen()
-        # Chance auf Nachwachsen einer Pflanze.
+        for i, t in enumerate(tiere):
+            t._reihenfolge = i
+        self._reihenfolge_zaehler = len(self.tiere)
+        # Listenposition merken: Der Tierindex entscheidet Gleichstände danach.
+
+    # -------- Speichern / Laden --------
+
+    def als_bytes(self) -> bytes:
+        """
+        Zustand der Welt als kompaktes Binärformat (kein pickle):
+        Kopf (Größe, Tick, Zähler), Zufallszustand, Pflanzen und Tiere spaltenweise als Arrays.
+        """
+        teile = []
+        tiere = list(self.tiere)
+        arten = list(ARTEN)
+        art_nr = {name: i for i, name in enumerate(arten)}
+
+        teile.append(_KOPF.pack(
+            _MAGIE, _FORMAT_VERSION, self.breite, self.hoehe, self.tick_nr,
+            self._naechste_id, self.nachwuchs_chance, len(self.pflanzen), len(tiere), len(arten),
+        ))
+
+        # Artentabelle (Namen), damit die Artnummern der Tiere eindeutig bleiben.
+        for name in arten:
+            roh = name.encode("utf-8")
+            teile.append(struct.pack("<H", len(roh)) + roh)
+
+        # Zufallszustand: 625 Zahlen (Mersenne Twister) + evtl. zwischengespeicherter Gauß-Wert.
+        version, mt, gauss = self.rng.getstate()
+        teile.append(struct.pack("<BBd", version, gauss is not None, gauss or 0.0))
+        teile.append(_roh(array("I", mt)))
+
+        # Pflanzen: x0, y0, x1, y1, ...
+        teile.append(_roh(self.pflanzen.als_koordinaten()))
+
+        # Tiere spaltenweise.
+        teile.append(_roh(array("B", [art_nr[type(t).__name__] for t in tiere])))
+        teile.append(_roh(array("q", [t.id for t in tiere])))
+        teile.append(_roh(array("d", [t.x for t in tiere])))
+        teile.append(_roh(array("d", [t.y for t in tiere])))
+        teile.append(_roh(array("h", [t.energie for t in tiere])))
+        namen = "\0".join(t.name for t in tiere).encode("utf-8")
+        teile.append(struct.pack("<Q", len(namen)) + namen)
+
+        # Ab Version 2: Einstellungen des flächigen Wachstums.
+        w = self.wachstum
+        teile.append(_WACHSTUM.pack(w is not None, *(w or Wachstum())))
+
+        # Ab Version 3: Samen des Zufallsstroms (sonst bekäme eine fortgesetzte Welt einen neuen Schlüssel).
+        strom = self.zufallsstrom
+        teile.append(_ZUFALLSSTROM.pack(strom is not None, strom.samen & _MASKE_64 if strom else 0))
+        return b"".join(teile)
+
+    @classmethod
+    def aus_bytes(cls, daten: bytes) -> Welt:
+        # Gegenstück zu als_bytes(): baut eine Welt aus dem Binärformat wieder auf.
+        # Beim Anlegen sehr vieler Objekte springt sonst immer wieder die Speicherbereinigung (gc)
+        # an, obwohl nichts freizugeben ist – darum wird sie währenddessen kurz pausiert.
+        war_an = gc.isenabled()
+        gc.disable()
+        try:
+            return cls._aus_bytes(daten)
+        finally:
+            if war_an:
+                gc.enable()
+
+    @classmethod
+    def _aus_bytes(cls, daten: bytes) -> Welt:
+        leser = _Leser(daten)
+        (magie, version, breite, hoehe, tick_nr, naechste_id, nachwuchs,
+         n_pflanzen, n_tiere, n_arten) = leser.struct(_KOPF)
+        if magie != _MAGIE or not 1 <= version <= _FORMAT_VERSION:
+            raise ValueError("Keine (kompatible) Tiersimulations-Datei.")
+
+        arten = []
+        for _ in range(n_arten):
+            (laenge,) = leser.struct(struct.Struct("<H"))
+            arten.append(ARTEN[leser.bytes(laenge).decode("utf-8")])
+
+        welt = cls(breite, hoehe, samen=None)
+        welt.tick_nr = tick_nr
+        welt._naechste_id = naechste_id
+        welt.nachwuchs_chance = nachwuchs
+
+        rng_version, hat_gauss, gauss = leser.struct(struct.Struct("<BBd"))
+        mt = leser.array("I", 625)
+        welt.rng.setstate((rng_version, tuple(mt), gauss if hat_gauss else None))
+
+        koordinaten = leser.array("I", 2 * n_pflanzen)
+        welt.pflanzen.aus_koordinaten(koordinaten)
+        # Neue Welt: Raster direkt befüllen (es gibt noch keine angemeldeten Journale).
+
+        art = leser.array("B", n_tiere)
+        ids = leser.array("q", n_tiere)
+        xs = leser.array("d", n_tiere)
+        ys = leser.array("d", n_tiere)
+        energie = leser.array("h", n_tiere)
+        (laenge,) = leser.struct(struct.Struct("<Q"))
+        namen = leser.bytes(laenge).decode("utf-8").split("\0") if n_tiere else []
+
+        tiere = []
+        for i in range(n_tiere):
+            tier = arten[art[i]](namen[i])
+            tier.x, tier.y, tier.energie, tier.id = xs[i], ys[i], energie[i], ids[i]
+            tiere.append(tier)
+        welt._tiere_aufnehmen(tiere)
+
+        if version >= 2:
+            hat_wachstum, *werte = leser.struct(_WACHSTUM)
+            welt.wachstum = Wachstum(*werte) if hat_wachstum else None
+        if version >= 3:
+            hat_strom, strom_samen = leser.struct(_ZUFALLSSTROM)
+            if hat_strom:
+                from zufallsstrom import Zufallsstrom
+                # Erst hier importiert: Ohne gespeicherten Zufallsstrom wird das Modul nicht gebraucht.
+                welt.zufallsstrom = Zufallsstrom(strom_samen)
+        return welt
+
+    def save(self, pfad: str) -> None:
+        # In Datei speichern. Erst in eine Hilfsdatei schreiben und dann umbenennen:
+        # So bleibt bei einem Absturz mitten im Schreiben der alte Stand erhalten.
+        tmp = pfad + ".tmp"
+        with open(tmp, "wb") as datei:
+            datei.write(self.als_bytes())
+        os.replace(tmp, pfad)
+
+    @classmethod
+    def load(cls, pfad: str) -> Welt:
+        with open(pfad, "rb") as datei:
+            return cls.aus_bytes(datei.read())
+
+# Hilfen für das Binärformat
+_MAGIE = b"TSIM"
+_FORMAT_VERSION = 3
+_KOPF = struct.Struct("<4sHIIQQdQQH")
+# Kopf: Magie, Version, Breite, Höhe, Tick, nächste id, Nachwuchs-Chance, #Pflanzen, #Tiere, #Arten.
+_WACHSTUM = struct.Struct("<?dddQ")
+# Ab Version 2 am Dateiende: Wachstum gesetzt?, chance_zelle, chance_nachbar, amplitude, periode.
+_ZUFALLSSTROM = struct.Struct("<?Q")
+# Ab Version 3 danach: Zufallsstrom gesetzt?, sein Samen (die unteren 64 Bit bilden den Schlüssel).
+_MASKE_64 = (1 << 64) - 1
+
+def _roh(werte: array) -> bytes:
+    # Array als Bytes in "Little Endian"-Reihenfolge (unabhängig von der Maschine).
+    if sys.byteorder == "big":
+        werte.byteswap()
+    return werte.tobytes()
+
+class _Leser:
+    # Liest nacheinander Teile aus einem bytes-Objekt.
+    def __init__(self, daten: bytes):
+        self.daten = memoryview(daten)
+        self.pos = 0
+
+    def bytes(self, n: int) -> bytes:
+        teil = self.daten[self.pos:self.pos + n]
+        if len(teil) != n:
+            raise ValueError("Datei ist unvollständig.")
+        self.pos += n
+        return bytes(teil)
+
+    def struct(self, format: struct.Struct) -> tuple:
+        return format.unpack(self.bytes(format.size))
+
+    def array(self, typ: str, anzahl: int) -> array:
+        werte = array(typ)
+        werte.frombytes(self.bytes(anzahl * werte.itemsize))
+        if sys.byteorder == "big":
+            werte.byteswap()
+        return werte
 
 # =========================
 #   GUI-Schicht
 # =========================
 
+def kachel_fuer(breite: int, hoehe: int) -> int:
+    # Pixel pro Zelle: TILE, außer die Karte würde breiter/höher als MAX_CANVAS_PX.
+    seite = max(breite, hoehe)
+    if seite * TILE <= MAX_CANVAS_PX:
+        return TILE
+    return max(1, MAX_CANVAS_PX // seite)
+
+def _rgb(farbe: str) -> tuple[int, int, int]:
+    # "#RRGGBB" -> (r, g, b); "#RGB" wird verdoppelt (wie Tk es auch tut).
+    ziffern = farbe.lstrip("#")
+    if len(ziffern) == 3:
+        ziffern = "".join(z * 2 for z in ziffern)
+    return int(ziffern[0:2], 16), int(ziffern[2:4], 16), int(ziffern[4:6], 16)
+
+class Renderer(ABC):
+    """
+    Zeichnet eine Welt auf ein Canvas. Gemeinsam für alle Renderer:
+    - Umrechnung Welt <-> Pixel, für ganze Zellen (Pflanzen) als vorberechnete Tabelle,
+    - das Raster, das nur EINMAL in ein Bild gezeichnet wird (ein einziges Canvas-Element
+      statt breite + hoehe + 2 Linien).
+    Unterklassen legen fest, wie Pflanzen und Tiere gezeichnet werden (abstrakte Methoden wie bei
+    Tier: Fehlt eine davon, scheitert schon das Erzeugen des Renderers, nicht erst ein Bild).
+    """
+    def __init__(self, canvas, breite: int, hoehe: int, kachel: int = TILE):
+        self.canvas = canvas
+        self.breite = breite
+        self.hoehe = hoehe
+        self.kachel = kachel
+        # Pixel pro Zelle.
+
+        self.pixel_breite = breite * kachel + 2 * MARGIN
+        self.pixel_hoehe = hoehe * kachel + 2 * MARGIN
+        # Größe der ganzen Zeichenfläche inklusive Rand.
+
+        self._versatz = MARGIN + kachel / 2
+        # Pixel der Mitte von Zelle 0 (einmal ausgerechnet statt bei jedem Aufruf).
+
+        self.spalte_px = [int(self._versatz + gx * kachel) for gx in range(breite)]
+        self.zeile_px = [int(self._versatz + gy * kachel) for gy in range(hoehe)]
+        # Nachschlagetabellen: Pixelmitte jeder Spalte/Zeile. Pflanzen stehen immer auf ganzen
+        # Zellen, ihre Position ist dann nur noch ein Listenzugriff.
+
+        self._raster_bild = None
+        # Das Raster als Bild (tk.PhotoImage). Tk zeigt es nur, solange Python es festhält.
+
+    def px(self, gx: float, gy: float) -> tuple[int, int]:
+        """Weltkoordinaten -> Pixel (Zellmitte)."""
+        return int(self._versatz + gx * self.kachel), int(self._versatz + gy * self.kachel)
+
+    def welt(self, px: float, py: float) -> tuple[float, float]:
+        """Pixel -> Weltkoordinaten (Umkehrung von px)."""
+        return (px - self._versatz) / self.kachel, (py - self._versatz) / self.kachel
+
+    def treffer(self, welt: Welt, px: float, py: float) -> Tier | None:
+        # Tier unter dem Pixel (px, py) oder None. Gesucht wird im räumlichen Tierindex der
+        # Welt: nur die Blöcke um den Punkt, nicht alle Tiere (wichtig für Hover bei vielen Tieren).
+        wx, wy = self.welt(px, py)
+        radius = max(TREFFER_RADIUS, TREFFER_PX / self.kachel)
+        best = welt.tier_index.naechstes(wx, wy, radius)
+        return best[0] if best is not None else None
+
+    def raster_zeichnen(self) -> None:
+        # Hintergrund und Rasterlinien einmal in ein Bild malen und als ein Element anzeigen.
+        bild = tk.PhotoImage(master=self.canvas, width=self.pixel_breite, height=self.pixel_hoehe)
+        bild.put(BG_COLOR, to=(0, 0, self.pixel_breite, self.pixel_hoehe))
+        if self.kachel >= 4:
+            # Bei sehr kleinen Zellen würden die Linien alles zudecken: dann ohne Raster.
+            unten = MARGIN + self.hoehe * self.kachel
+            rechts = MARGIN + self.breite * self.kachel
+            for cx in range(self.breite + 1):
+                x = MARGIN + cx * self.kachel
+                bild.put(GRID_COLOR, to=(x, MARGIN, x + 1, unten + 1))
+            for cy in range(self.hoehe + 1):
+                y = MARGIN + cy * self.kachel
+                bild.put(GRID_COLOR, to=(MARGIN, y, rechts + 1, y + 1))
+        self.canvas.delete("raster")
+        self.canvas.create_image(0, 0, image=bild, anchor="nw", tags=("raster",))
+        self.canvas.tag_lower("raster")
+        # Ganz nach hinten, unter alle anderen Elemente.
+        self._raster_bild = bild
+
+    @abstractmethod
+    def alles_zeichnen(self, welt: Welt) -> None: ...
+    # Dynamische Ebene komplett neu (Start, nach dem Laden).
+
+    @abstractmethod
+    def aenderungen_zeichnen(self, welt: Welt, journal: Aenderungen) -> None: ...
+    # Nur das, was laut Journal seit dem letzten Bild anders ist (Journal leert die App).
+
+    def entfernen(self) -> None:
+        # Alles von diesem Renderer vom Canvas nehmen (z. B. vor einem Wechsel der Weltgröße).
+        self.canvas.delete("dyn")
+        self.canvas.delete("raster")
+        self._raster_bild = None
+
+class ElementRenderer(Renderer):
+    """
+    Ein Canvas-Element (Emoji) pro Pflanze und pro Tier. Die Elemente bleiben bestehen und
+    werden nur verschoben, angelegt oder gelöscht. Gut lesbar, aber für große Welten zu viele Elemente.
+    """
+    def __init__(self, canvas, breite: int, hoehe: int, kachel: int = TILE):
+        super().__init__(canvas, breite, hoehe, kachel)
+        self.pflanzen_items: dict[tuple[int, int], int] = {}
+        self.tier_items: dict[Tier, int] = {}
+        # Dauerhafte Canvas-Elemente: Pflanzenzelle bzw. Tier -> Canvas-ID.
+
+    def _pflanze_zeichnen(self, zelle: tuple[int, int]) -> None:
+        self.pflanzen_items[zelle] = self.canvas.create_text(
+            self.spalte_px[zelle[0]], self.zeile_px[zelle[1]], text=PLANT_EMOJI, tags=("dyn",),
+            font=("Segoe UI Emoji", max(1, int(self.kachel * 0.8)))
+        )
+        # Position aus den Tabellen statt neu gerechnet.
+
+    def _tier_zeichnen(self, t: Tier) -> None:
+        cx, cy = self.px(t.x, t.y)
+        self.tier_items[t] = self.canvas.create_text(
+            cx, cy, text=t.emoji, tags=("dyn", "tier"), font=("Segoe UI Emoji", max(1, int(self.kachel * 0.9)))
+        )
+
+    def alles_zeichnen(self, welt: Welt) -> None:
+        self.canvas.delete("dyn")
+        # "tags=('dyn', ...)" markieren dynamische Elemente; hier werden sie entfernt (Raster bleibt).
+        self.pflanzen_items.clear()
+        self.tier_items.clear()
+        for zelle in welt.pflanzen:
+            self._pflanze_zeichnen(zelle)
+        for t in welt.tiere:
+            self._tier_zeichnen(t)
+        # Tiere nach den Pflanzen anlegen: später angelegte Elemente liegen oben.
+
+    def aenderungen_zeichnen(self, welt: Welt, journal: Aenderungen) -> None:
+        # Aufwand wächst mit der Zahl der Änderungen, nicht mit der Gesamtzahl der Tiere/Pflanzen.
+        j = journal
+        for zelle in j.pflanzen_weg:
+            item = self.pflanzen_items.pop(zelle, None)
+            if item is not None:
+                self.canvas.delete(item)
+        for zelle in j.pflanzen_neu:
+            self._pflanze_zeichnen(zelle)
+            if self.tier_items:
+                self.canvas.tag_lower(self.pflanzen_items[zelle], "tier")
+            # Neue Pflanzen unter die Tiere schieben (sonst würden sie Tiere verdecken).
+
+        for t in j.tiere_weg:
+            item = self.tier_items.pop(t, None)
+            if item is not None:
+                self.canvas.delete(item)
+        for t in j.tiere_bewegt:
+            item = self.tier_items.get(t)
+            if item is None:
+                self._tier_zeichnen(t)
+                # Tier ist neu in der Welt.
+            else:
+                self.canvas.coords(item, *self.px(t.x, t.y))
+                # Vorhandenes Element nur verschieben.
+
+    def entfernen(self) -> None:
+        super().entfernen()
+        self.pflanzen_items.clear()
+        self.tier_items.clear()
+
+class BildRenderer(Renderer):
+    """
+    Die ganze Welt als EIN Bild: Pflanzen (Quadrate) und Tiere (farbige Punkte) werden mit NumPy
+    in einen Pixelpuffer gemalt und als PPM-Daten an ein einziges tk.PhotoImage übergeben.
+    Die Zahl der Canvas-Elemente bleibt konstant (Bild + Tooltip), egal wie groß die Welt ist.
+    Raster und Hintergrund liegen fertig im Puffer "_grund" und werden pro Bild nur kopiert.
+    """
+    def __init__(self, canvas, breite: int, hoehe: int, kachel: int = TILE):
+        if np is None:
+            raise RuntimeError("BildRenderer braucht NumPy.")
+        super().__init__(canvas, breite, hoehe, kachel)
+        self._grund = np.empty((self.pixel_hoehe, self.pixel_breite, 3), dtype=np.uint8)
+        self._grund[:] = _rgb(BG_COLOR)
+        if kachel >= 4:
+            # Rasterlinien wie in Renderer.raster_zeichnen, nur direkt in den Puffer.
+            unten = MARGIN + hoehe * kachel + 1
+            rechts = MARGIN + breite * kachel + 1
+            self._grund[MARGIN:unten, MARGIN:rechts:kachel] = _rgb(GRID_COLOR)
+            self._grund[MARGIN:unten:kachel, MARGIN:rechts] = _rgb(GRID_COLOR)
+        self._puffer = self._grund.copy()
+        # Arbeitspuffer für das aktuelle Bild (wird nicht bei jedem Bild neu angelegt).
+
+        self._rand = max(0, kachel // 6) if kachel >= 4 else 0
+        # Abstand der Pflanzenquadrate zum Zellrand (damit das Raster sichtbar bleibt).
+
+        r = max(0, int(kachel * 0.35))
+        self._punkt = [(dx, dy) for dy in range(-r, r + 1) for dx in range(-r, r + 1) if dx * dx + dy * dy <= r * r]
+        # Versätze eines runden Punkts mit Radius r (ein Eintrag pro Pixel des Punkts).
+
+        self._farben = np.array([_rgb(k.farbe) for k in ARTEN.values()], dtype=np.uint8)
+        self._art_nr = {k: i for i, k in enumerate(ARTEN.values())}
+        # Farbtabelle: Artnummer -> RGB.
+
+        self._bild = tk.PhotoImage(master=canvas, width=self.pixel_breite, height=self.pixel_hoehe)
+        self._item = None
+        # Das eine Canvas-Element, das die Welt zeigt.
+
+    def raster_zeichnen(self) -> None:
+        # Das Raster steckt schon im Bild (siehe _grund): kein eigenes Canvas-Element nötig.
+        self.canvas.delete("raster")
+
+    def _malen(self, welt: Welt) -> None:
+        # Puffer neu füllen: Grund kopieren, Pflanzen und Tiere darübermalen.
+        puffer = self._puffer
+        np.copyto(puffer, self._grund)
+        k = self.kachel
+
+        ys, xs = np.nonzero(welt.pflanzen.als_array())
+        if len(xs):
+            karte = puffer[MARGIN:MARGIN + self.hoehe * k, MARGIN:MARGIN + self.breite * k]
+            zellen = karte.reshape(self.hoehe, k, self.breite, k, 3)
+            # Sicht auf die Karte als [Zeile, Pixelzeile, Spalte, Pixelspalte, Farbe]:
+            # so lässt sich das Innere aller Pflanzenzellen mit einer Zuweisung füllen.
+            a, b = self._rand, k - self._rand
+            zellen[ys, a:b, xs, a:b] = _rgb(PLANT_COLOR)
+
+        n = len(welt.tiere)
+        if n:
+            gx = np.fromiter((t.x for t in welt.tiere), dtype=np.float64, count=n)
+            gy = np.fromiter((t.y for t in welt.tiere), dtype=np.float64, count=n)
+            art = np.fromiter((self._art_nr.get(type(t), 0) for t in welt.tiere), dtype=np.intp, count=n)
+            cx = (self._versatz + gx * k).astype(np.intp)
+            cy = (self._versatz + gy * k).astype(np.intp)
+            farbe = self._farben[art]
+            for dx, dy in self._punkt:
+                puffer[cy + dy, cx + dx] = farbe
+            # Eine NumPy-Zuweisung pro Pixel des Punkts, jeweils für alle Tiere auf einmal.
+
+    def _zeigen(self) -> None:
+        # Puffer als PPM-Daten ("P6": Kopf + rohe RGB-Bytes) an das PhotoImage geben.
+        kopf = b"P6 %d %d 255\n" % (self.pixel_breite, self.pixel_hoehe)
+        self._bild.configure(data=kopf + self._puffer.tobytes(), format="PPM")
+        if self._item is None:
+            self._item = self.canvas.create_image(0, 0, image=self._bild, anchor="nw", tags=("dyn", "bild"))
+
+    def alles_zeichnen(self, welt: Welt) -> None:
+        self._malen(welt)
+        self._zeigen()
+
+    def aenderungen_zeichnen(self, welt: Welt, journal: Aenderungen) -> None:
+        j = journal
+        if j.pflanzen_neu or j.pflanzen_weg or j.tiere_bewegt or j.tiere_weg:
+            self.alles_zeichnen(welt)
+            # Ein ganzes Bild mit NumPy ist billiger als viele einzelne Änderungen in Tk.
+
+    def entfernen(self) -> None:
+        super().entfernen()
+        self._item = None
+
 class App:
     # Klasse "App" bündelt GUI (View) und Steuerung (Controller).
     def __init__(self, root: tk.Tk):
@@ -459,17 +1915,15 @@ class App:
         # Fülle die Welt mit Pflanzen und Tieren (Startzustand).
 
         # UI
-        self.canvas_w = GRID_W * TILE + 2 * MARGIN
-        # Breite des Zeichenbereichs in Pixeln.
-
-        self.canvas_h = GRID_H * TILE + 2 * MARGIN
-        # Höhe des Zeichenbereichs in Pixeln.
+        self.canvas = tk.Canvas(root, bg=BG_COLOR, highlightthickness=0)
+        # Canvas ist die Zeichenfläche für Raster, Pflanzen und Tiere (Größe setzt _renderer_setzen).
 
-        self.canvas = tk.Canvas(root, width=self.canvas_w, height=self.canvas_h, bg=BG_COLOR, highlightthickness=0)
-        # Canvas ist die Zeichenfläche für Raster, Pflanzen und Tiere.
+        self.renderer: Renderer | None = None
+        self._renderer_setzen()
+        # Der Renderer zeichnet die Welt (Emojis als Canvas-Elemente oder, bei großen Welten, ein Bild).
 
-        self.canvas.grid(row=0, column=0, columnspan=4, padx=8, pady=8)
-        # Platziere das Canvas in einem einfachen Grid-Layout (Zeile 0, vier Spalten breit).
+        self.canvas.grid(row=0, column=0, columnspan=7, padx=8, pady=8)
+        # Platziere das Canvas in einem einfachen Grid-Layout (Zeile 0, sieben Spalten breit).
 
         # Steuerleiste
         self.btn_start = tk.Button(root, text="Start", command=self.start)
@@ -482,12 +1936,22 @@ class App:
         # Button "Langsamer": vergrößert die Tick-Verzögerung.
 
         self.btn_faster = tk.Button(root, text="Schneller ⟳", command=self.faster)
-        # Button "Schneller": verkleinert die Tick-Verzögerung.
+        # Button "Schneller": verkleinert die Tick-Verzögerung bzw. rechnet mehr Ticks pro Bild.
+
+        self.btn_turbo = tk.Button(root, text="⏩ Vorspulen", command=self.toggle_turbo)
+        # Button "Vorspulen": so viele Ticks wie in das Zeitbudget eines Frames passen.
 
         self.btn_start.grid(row=1, column=0, sticky="ew", padx=8, pady=(0,8))
         self.btn_pause.grid(row=1, column=1, sticky="ew", padx=8, pady=(0,8))
         self.btn_slower.grid(row=1, column=2, sticky="ew", padx=8, pady=(0,8))
         self.btn_faster.grid(row=1, column=3, sticky="ew", padx=8, pady=(0,8))
+        self.btn_speichern = tk.Button(root, text="💾 Speichern", command=self.speichern)
+        self.btn_laden = tk.Button(root, text="Laden", command=self.laden)
+        # Zustand der Welt in eine Datei sichern bzw. von dort wiederherstellen (Welt.save/Welt.load).
+
+        self.btn_turbo.grid(row=1, column=4, sticky="ew", padx=8, pady=(0,8))
+        self.btn_speichern.grid(row=1, column=5, sticky="ew", padx=8, pady=(0,8))
+        self.btn_laden.grid(row=1, column=6, sticky="ew", padx=8, pady=(0,8))
         # Anordnung der Buttons in der zweiten Zeile (row=1) nebeneinander.
 
         # Eventlabel
@@ -497,17 +1961,49 @@ class App:
         self.event_label = tk.Label(root, textvariable=self.event_var, fg=TEXT_FG, bg=BG_COLOR, anchor="w")
         # Label zeigt die aktuelle Statusnachricht an (verwendet textvariable).
 
-        self.event_label.grid(row=2, column=0, columnspan=4, sticky="ew", padx=8, pady=(0,8))
+        self.event_label.grid(row=2, column=0, columnspan=7, sticky="ew", padx=8, pady=(0,8))
         # Label unter den Buttons über die volle Breite.
 
+        self.stats_var = tk.StringVar(value="")
+        self.stats_label = tk.Label(root, textvariable=self.stats_var, fg=TEXT_FG, bg=BG_COLOR, anchor="w")
+        self.stats_label.grid(row=3, column=0, columnspan=7, sticky="ew", padx=8, pady=(0,8))
+        # Zweite Statuszeile: tatsächlich erreichte Ticks/s und Bilder/s (einmal pro Sekunde aktualisiert).
+
+        # Aufnahme / Zurückspulen
+        self.aufnahme_var = tk.BooleanVar(value=False)
+        self.chk_aufnahme = tk.Checkbutton(root, text="⏺ Aufnahme", variable=self.aufnahme_var,
+                                           command=self.aufnahme_umschalten)
+        self.chk_aufnahme.grid(row=4, column=0, sticky="w", padx=8, pady=(0,8))
+        self.zeitleiste = tk.Scale(root, from_=0, to=0, orient="horizontal", showvalue=True,
+                                   command=self.zeitleiste_bewegt)
+        self.zeitleiste.grid(row=4, column=1, columnspan=5, sticky="ew", padx=8, pady=(0,8))
+        # Schieberegler über alle aufgezeichneten Ticks: Ziehen zeigt den Stand zu diesem Tick.
+
+        self.hover_var = tk.BooleanVar(value=False)
+        self.chk_hover = tk.Checkbutton(root, text="🛈 Hover", variable=self.hover_var,
+                                        command=self.hover_umschalten)
+        self.chk_hover.grid(row=4, column=6, sticky="w", padx=8, pady=(0,8))
+        # Hover-Modus: Infobox folgt dem Tier unter dem Mauszeiger, Energie wird live nachgeführt.
+
+        self.aufzeichnung = None
+        # Laufende Aufzeichnung (aufzeichnung.Aufzeichnung) oder None.
+        self._wiedergabe = None
+        self._wiedergabe_laenge = -1
+        # Wiedergabe des bisherigen Protokolls; wird neu gelesen, wenn das Protokoll gewachsen ist.
+        self.live_welt: Welt | None = None
+        # Während der Wiedergabe: die eigentliche (weiterlaufende) Welt. self.world zeigt dann
+        # einen aufgezeichneten Stand, der nur angesehen wird.
+
         # Click-Handling
         self.canvas.bind("<Button-1>", self.on_click)
         # Mauslinksklicks auf dem Canvas werden an die Methode on_click übergeben (Controller).
+        self.canvas.bind("<Motion>", self.on_motion)
+        # Mausbewegungen (nur im Hover-Modus ausgewertet).
 
         # Welt -> GUI Eventbrücke
-        self.world.on_event = self.set_event
-        # Setze den Ereignis-Callback der Welt auf die GUI-Methode set_event,
-        # damit Domänenereignisse (z. B. "prallt an der Grenze ab") im Label landen.
+        self._ereignis_stand = self.world.ereignisse.anzahl
+        # Wie viele Ereignisse der Welt wir schon kennen. Neue Ereignisse werden nach jedem
+        # Bild abgefragt (siehe zeige_letztes_ereignis) – nur das jüngste wird als Text formatiert.
 
         # Renderstate
         self.running = False
@@ -516,87 +2012,96 @@ class App:
         self.delay_ms = 120
         # Startverzögerung zwischen Ticks in Millisekunden (Tempo).
 
+        self.ticks_pro_frame = 1
+        # Wie viele Simulationsschritte pro gezeichnetem Bild (1 = jeder Tick wird gezeigt).
+
+        self.turbo = False
+        # Zeitbudget-Modus: statt fester Tickzahl so viele Ticks pro Bild, wie die Zeit erlaubt.
+
+        self._messung_start = time.perf_counter()
+        self._gemessene_ticks = 0
+        self._gemessene_frames = 0
+        # Zähler für die Anzeige von Ticks/s und Bildern/s.
+
         self.tooltip_id: int | None = None
         # Speichert die ID des zuletzt gezeichneten Tooltip-Rechtecks (oder None, wenn keiner sichtbar ist).
         # Type Hint "int | None" = entweder eine Canvas-ID (int) oder kein Tooltip.
+        self._tooltip_text_id: int | None = None
+        # Canvas-ID des Tooltip-Textes: wird per itemconfigure geändert statt neu angelegt.
+        self._tooltip_timer = None
+        # after-ID des automatischen Ausblendens (wird bei einem neuen Tooltip abgebrochen).
+        self.tooltip_tier: Tier | None = None
+        # Im Hover-Modus: das Tier, dessen Werte der Tooltip gerade zeigt.
+
+        self.journal = self.world.journal_anmelden()
+        # Änderungsprotokoll der Welt: sagt uns, was sich seit dem letzten Frame geändert hat.
 
         self.draw_static_grid()
         # Zeichne das Raster 1x (bleibt als Hintergrund bestehen).
 
-        self.render()
-        # Zeichne den ersten dynamischen Frame.
+        self.full_render()
+        # Zeichne den ersten dynamischen Frame (komplett).
 
     def _setup_world(self):
         # Private Hilfsmethode: Startzustand der Welt konfigurieren.
         self.world.add_pflanzen_random(anzahl=100)
         # 100 Pflanzen zufällig verteilen.
 
-        # Tiere
-        self.world.add_tier(Loewe("Simba"))
-        # Tierobjekt erstellen und in die Welt einfügen. Position wird zufällig gesetzt (keine x,y übergeben).
-        self.world.add_tier(Tiger("ShereKhan"))
-        self.world.add_tier(Wolf("Akela"))
-        self.world.add_tier(Hund("Bello"))
-        self.world.add_tier(Katze("Minka"))
-        self.world.add_tier(Loewe("Willi"))
-        self.world.add_tier(Tiger("Bernd"))
-        self.world.add_tier(Wolf("Andre"))
-        self.world.add_tier(Hund("Wuffi"))
-        self.world.add_tier(Katze("Tetzi"))
-        # Die obigen Zeilen wiederholen das Muster: Erzeuge Unterklassen von Tier mit Namen, füge sie hinzu.
-
-        self.world.add_tier(Katze("mimi"))
-        self.world.add_tier(Nilpferd("Wolle"))
-        for i in range(3):
-            self.world.add_tier(Nilpferd(f"Hippo{i+1}"))
-        # Schleife: drei weitere Nilpferde mit Namen "Hippo1", "Hippo2", "Hippo3".
+        for art, name in START_BESETZUNG:
+            self.world.add_tier(ARTEN[art](name))
+            # Tierobjekt erstellen und in die Welt einfügen. Position wird zufällig gesetzt (keine x,y übergeben).
+            # Bei 15 Tieren lohnt tiere_ansiedeln nicht – und einzeln bleibt die Startwelt zu einem
+            # Samen dieselbe wie früher (gleiche Positionen, gleiche Reihenfolge).
 
     # -------- Darstellung --------
 
+    def _renderer_setzen(self):
+        # Passenden Renderer für die Größe der aktuellen Welt anlegen und das Canvas anpassen.
+        breite, hoehe = self.world.breite, self.world.hoehe
+        if self.renderer is not None:
+            self.renderer.entfernen()
+        klasse = BildRenderer if np is not None and breite * hoehe >= BILD_AB_ZELLEN else ElementRenderer
+        self.renderer = klasse(self.canvas, breite, hoehe, kachel_fuer(breite, hoehe))
+        self.canvas_w = self.renderer.pixel_breite
+        self.canvas_h = self.renderer.pixel_hoehe
+        # Größe des Zeichenbereichs in Pixeln.
+        self.canvas.config(width=self.canvas_w, height=self.canvas_h)
+
     def grid_to_px(self, gx: float, gy: float) -> tuple[int, int]:
         # Hilfsfunktion: Wandle Gitterkoordinate (Zelle) in Pixel-Koordinate (Canvas) um.
         """Weltkoordinaten -> Pixel (Zellmitte)."""
-        x = int(MARGIN + gx * TILE + TILE/2)
-        y = int(MARGIN + gy * TILE + TILE/2)
-        return x, y
+        return self.renderer.px(gx, gy)
 
     def draw_static_grid(self):
-        # Zeichne das Raster (nur Linien). Bleibt als "Hintergrund".
-        # Rasterlinien dezent
-        for cx in range(GRID_W + 1):
-            x = MARGIN + cx * TILE
-            self.canvas.create_line(x, MARGIN, x, MARGIN + GRID_H * TILE, fill=GRID_COLOR)
-        for cy in range(GRID_H + 1):
-            y = MARGIN + cy * TILE
-            self.canvas.create_line(MARGIN, y, MARGIN + GRID_W * TILE, y, fill=GRID_COLOR)
+        # Zeichne das Raster. Bleibt als "Hintergrund" (ein einziges Bild, siehe Renderer).
+        self.renderer.raster_zeichnen()
+
+    def full_render(self):
+        # Zeichne die dynamische Ebene komplett neu (nur beim Start bzw. wenn sich das Layout ändert).
+        self.journal.leeren()
+        # Alles, was im Protokoll steht, wird jetzt ohnehin gezeichnet.
+        self.renderer.alles_zeichnen(self.world)
+
+        self.canvas.tag_raise("tooltip")
+        # Tooltip (falls vorhanden) vorne halten.
 
     def render(self):
-        # Zeichne die dynamische Ebene neu (Pflanzen, Tiere, Tooltip).
-        # dynamische Ebene löschen (behalte Raster)
-        self.canvas.delete("dyn")
-        # "tags=('dyn', ...)" markieren dynamische Elemente; hier werden sie entfernt.
-
-        # Pflanzen zeichnen
-        for (px, py) in self.world.pflanzen:
-            cx, cy = self.grid_to_px(px, py)
-            self.canvas.create_text(cx, cy, text=PLANT_EMOJI, tags=("dyn",), font=("Segoe UI Emoji", int(TILE*0.8)))
-
-        # Tiere zeichnen
-        for t in self.world.tiere:
-            cx, cy = self.grid_to_px(t.x, t.y)
-            self.canvas.create_text(
-                cx, cy, text=t.emoji, tags=("dyn", f"tier"), font=("Segoe UI Emoji", int(TILE*0.9))
-            )
+        # Zeichne nur die Änderungen seit dem letzten Frame (laut Änderungsprotokoll der Welt).
+        self.renderer.aenderungen_zeichnen(self.world, self.journal)
+        self.journal.leeren()
+        # Protokoll ist abgearbeitet.
 
-        # Optional: Tooltip vorne halten
         if self.tooltip_id is not None:
-            self.canvas.tag_raise(self.tooltip_id)
+            self.canvas.tag_raise("tooltip")
             # Bringt den Tooltip in der Zeichenreihenfolge nach vorn.
 
     # -------- Steuerung --------
 
     def start(self):
         # Startet die Simulationsschleife (falls nicht schon laufend).
+        if self.live_welt is not None:
+            self._wiedergabe_uebernehmen()
+            # Zurückgespult: ab dem angezeigten Tick weiterrechnen.
         if not self.running:
             self.running = True
             self.loop()
@@ -605,106 +2110,327 @@ class App:
         # Stoppt die Simulationsschleife.
         self.running = False
 
+    def _tempo_melden(self):
+        if self.ticks_pro_frame > 1:
+            self.set_event(f"Tempo: {self.ticks_pro_frame} Ticks/Bild, ein Bild alle {FRAME_MS} ms")
+        else:
+            self.set_event(f"Tempo: {self.delay_ms} ms/Tick")
+
     def slower(self):
-        # Verlangsamt das Tempo (erhöht die Wartezeit pro Frame).
-        self.delay_ms = min(1000, int(self.delay_ms * 1.3))
-        self.set_event(f"Tempo: {self.delay_ms} ms/Tick")
+        # Verlangsamt das Tempo: erst weniger Ticks pro Bild, dann längere Wartezeit pro Frame.
+        self.turbo = False
+        if self.ticks_pro_frame > 1:
+            self.ticks_pro_frame //= 2
+        else:
+            self.delay_ms = min(1000, int(self.delay_ms * 1.3))
+        self._tempo_melden()
 
     def faster(self):
-        # Beschleunigt das Tempo (verkleinert die Wartezeit pro Frame).
-        self.delay_ms = max(15, int(self.delay_ms / 1.3))
-        self.set_event(f"Tempo: {self.delay_ms} ms/Tick")
+        # Beschleunigt das Tempo: erst kürzere Wartezeit, ab der festen Bildrate mehr Ticks pro Bild.
+        self.turbo = False
+        if self.delay_ms > FRAME_MS:
+            self.delay_ms = max(FRAME_MS, int(self.delay_ms / 1.3))
+        else:
+            self.ticks_pro_frame = min(4096, self.ticks_pro_frame * 2)
+        self._tempo_melden()
+
+    def toggle_turbo(self):
+        # Zeitbudget-Modus ein/aus.
+        self.turbo = not self.turbo
+        if self.turbo:
+            self.set_event(f"Vorspulen: max. {int(FRAME_MS * TICK_BUDGET_ANTEIL)} ms Simulation pro Bild")
+        else:
+            self._tempo_melden()
 
     def loop(self):
         # Hauptschleife der Simulation: wird immer wieder per Timer aufgerufen.
+        # Simulation und Darstellung sind entkoppelt: pro Bild laufen ggf. mehrere Ticks.
         if not self.running:
             return
-        self.world.tick()
-        # Model aktualisieren (ein Simulationsschritt).
+        start = time.perf_counter()
+
+        if self.turbo:
+            # So viele Ticks wie ins Zeitbudget passen (mindestens einer).
+            budget = FRAME_MS * TICK_BUDGET_ANTEIL / 1000
+            while True:
+                self.world.tick()
+                self._gemessene_ticks += 1
+                if time.perf_counter() - start >= budget:
+                    break
+        else:
+            for _ in range(self.ticks_pro_frame):
+                self.world.tick()
+                # Model aktualisieren (ein Simulationsschritt).
+            self._gemessene_ticks += self.ticks_pro_frame
 
         self.render()
-        # Neu zeichnen (View).
-
-        self.root.after(self.delay_ms, self.loop)
-        # Timer: ruft self.loop() nach delay_ms Millisekunden wieder auf (Echtzeitgefühl).
+        # Neu zeichnen (View) – einmal pro Bild, egal wie viele Ticks gelaufen sind.
+        self._tooltip_nachfuehren()
+        # Hover-Tooltip: Position und Energie des Tiers aktualisieren (nur zwei Canvas-Elemente).
+        if self.aufzeichnung is not None:
+            self.zeitleiste.config(to=self.world.tick_nr)
+            self.zeitleiste.set(self.world.tick_nr)
+            # Regler mitlaufen lassen (zeitleiste_bewegt erkennt, dass nichts zu tun ist).
+        self.zeige_letztes_ereignis()
+        self._gemessene_frames += 1
+        self._statistik_aktualisieren()
+
+        if self.turbo or self.ticks_pro_frame > 1:
+            intervall = FRAME_MS
+            # Feste Bildrate; die bereits verbrauchte Rechenzeit wird abgezogen.
+        else:
+            intervall = self.delay_ms
+        vergangen_ms = int((time.perf_counter() - start) * 1000)
+        self.root.after(max(1, intervall - vergangen_ms), self.loop)
+        # Timer: ruft self.loop() nach Ablauf des Intervalls wieder auf (Echtzeitgefühl).
+
+    def _statistik_aktualisieren(self):
+        # Einmal pro Sekunde die tatsächlich erreichten Raten anzeigen.
+        jetzt = time.perf_counter()
+        dauer = jetzt - self._messung_start
+        if dauer < 1.0:
+            return
+        self.stats_var.set(
+            f"{self._gemessene_ticks / dauer:.0f} Ticks/s  |  {self._gemessene_frames / dauer:.1f} Bilder/s"
+        )
+        self._messung_start = jetzt
+        self._gemessene_ticks = 0
+        self._gemessene_frames = 0
+
+    def speichern(self):
+        # Aktuellen Stand der Welt in eine Datei schreiben (Dateiauswahl-Dialog).
+        from tkinter import filedialog
+        pfad = filedialog.asksaveasfilename(defaultextension=".welt", filetypes=[("Tiersimulation", "*.welt")])
+        if pfad:
+            welt = self.world
+            if self.live_welt is not None:
+                welt = self._wiedergabe_lesen().welt_bei(welt.tick_nr, neu_rechnen=True)
+                # Eine Wiedergabe-Welt hat einen veralteten Zufallszustand: echten Stand nachrechnen.
+            welt.save(pfad)
+            self.set_event(f"Gespeichert (Tick {self.world.tick_nr}): {pfad}")
+
+    def laden(self):
+        # Gespeicherte Welt öffnen und anstelle der aktuellen anzeigen.
+        from tkinter import filedialog
+        pfad = filedialog.askopenfilename(filetypes=[("Tiersimulation", "*.welt")])
+        if not pfad:
+            return
+        try:
+            welt = Welt.load(pfad)
+        except (OSError, ValueError, KeyError) as fehler:
+            self.set_event(f"Laden fehlgeschlagen: {fehler}")
+            return
+        self.live_welt = None
+        self.welt_setzen(welt)
+        if self.aufzeichnung is not None:
+            self.aufzeichnung.beenden()
+            self._aufnahme_beginnen()
+            # Neue Welt = neue Aufzeichnung (die alte passt nicht mehr dazu).
+        self.set_event(f"Geladen (Tick {welt.tick_nr}): {pfad}")
+
+    def welt_setzen(self, welt: Welt):
+        # Andere Welt anzeigen: Journal umhängen, ggf. Canvasgröße anpassen, alles neu zeichnen.
+        self.world.journal_abmelden(self.journal)
+        groesse_neu = (welt.breite, welt.hoehe) != (self.world.breite, self.world.hoehe)
+        self.world = welt
+        self.journal = welt.journal_anmelden()
+        self._ereignis_stand = welt.ereignisse.anzahl
+        self.hide_tooltip()
+        if groesse_neu:
+            # Layout-Änderung: neuer Renderer (Zellgröße, ggf. Bild statt Elemente), Raster neu.
+            self._renderer_setzen()
+            self.draw_static_grid()
+        self.full_render()
+
+    # -------- Aufnahme / Wiedergabe --------
+
+    def aufnahme_umschalten(self):
+        if self.aufnahme_var.get():
+            self._aufnahme_beginnen()
+            self.set_event("Aufnahme läuft – mit dem Regler lässt sich zurückspulen.")
+        else:
+            if self.live_welt is not None:
+                self.welt_setzen(self.live_welt)
+                self.live_welt = None
+                # Zurück zur laufenden Welt.
+            self.aufzeichnung.beenden()
+            self.aufzeichnung = None
+            self._wiedergabe = None
+            self.zeitleiste.config(from_=0, to=0)
+            self.set_event("Aufnahme beendet.")
+
+    def _aufnahme_beginnen(self):
+        from aufzeichnung import Aufzeichnung
+        # Erst hier importieren: aufzeichnung.py importiert selbst dieses Modul.
+        self.aufzeichnung = Aufzeichnung(self.world, keyframe_alle=100)
+        self._wiedergabe = None
+        self.zeitleiste.config(from_=self.world.tick_nr, to=self.world.tick_nr)
+        self.zeitleiste.set(self.world.tick_nr)
+
+    def _wiedergabe_lesen(self):
+        from aufzeichnung import Wiedergabe
+        laenge = self.aufzeichnung.laenge
+        if self._wiedergabe is None or laenge != self._wiedergabe_laenge:
+            self._wiedergabe = Wiedergabe(self.aufzeichnung)
+            # Liest direkt im Puffer der Aufzeichnung: pro Sprung wird nur kopiert, was gebraucht wird.
+            self._wiedergabe_laenge = laenge
+        return self._wiedergabe
+
+    def zeitleiste_bewegt(self, wert):
+        # Callback des Reglers: aufgezeichneten Stand zu diesem Tick anzeigen.
+        if self.aufzeichnung is None:
+            return
+        tick = int(float(wert))
+        if tick == self.world.tick_nr:
+            return
+        self.pause()
+        live = self.live_welt or self.world
+        if tick == live.tick_nr:
+            self.welt_setzen(live)
+            self.live_welt = None
+            self.set_event(f"Tick {tick} (aktueller Stand)")
+            return
+        wg = self._wiedergabe_lesen()
+        if self.live_welt is None:
+            anzeige = wg.welt_bei(tick)
+            self.live_welt = live
+        else:
+            anzeige = wg.springen(self.world, tick)
+        if anzeige is self.world:
+            self.render()
+            # Vorwärts an derselben Welt: nur die Änderungen zeichnen.
+        else:
+            self.welt_setzen(anzeige)
+        self.set_event(f"Wiedergabe: Tick {tick} von {live.tick_nr} – Start rechnet ab hier weiter")
+
+    def _wiedergabe_uebernehmen(self):
+        # Ab dem gerade angezeigten Tick weiterrechnen: echten Stand nachrechnen, Rest verwerfen.
+        tick = self.world.tick_nr
+        welt = self._wiedergabe_lesen().welt_bei(tick, neu_rechnen=True)
+        self.aufzeichnung.kuerzen(tick)
+        self.aufzeichnung.welt_wechseln(welt)
+        self.live_welt = None
+        self.welt_setzen(welt)
+        self.zeitleiste.config(to=tick)
 
     def set_event(self, msg: str):
         # Aktualisiert die Statuszeile (unten).
         self.event_var.set(msg)
 
+    def zeige_letztes_ereignis(self):
+        # Falls seit dem letzten Bild neue Ereignisse in der Welt passiert sind:
+        # nur das jüngste in Text umwandeln und anzeigen.
+        puffer = self.world.ereignisse
+        if puffer.anzahl != self._ereignis_stand:
+            self._ereignis_stand = puffer.anzahl
+            self.set_event(self.world.ereignis_text(puffer.letztes()))
+
     # -------- Interaktion --------
 
     def on_click(self, ev):
         # Ereignis-Handler für Mausklicks auf dem Canvas.
-        # Nächstes Tier zur Klickposition finden
-        # Umrechnen Pixel->Weltgrobe Koordinate
-        wx = (ev.x - MARGIN) / TILE
-        wy = (ev.y - MARGIN) / TILE
-
-        best = None
-        for t in self.world.tiere:
-            d = math.hypot(t.x - wx, t.y - wy)
-            # Abstand in Weltkoordinaten.
-            if best is None or d < best[1]:
-                best = (t, d)
+        # Nächstes Tier zur Klickposition über den räumlichen Index finden (Renderer rechnet Pixel um).
+        t = self.renderer.treffer(self.world, ev.x, ev.y)
+        if t is None:
+            # Wenn kein Tier in der Nähe, Tooltip ausblenden.
+            self.hide_tooltip()
+            return
+        self.show_tooltip(ev.x, ev.y, self._tooltip_text(t))
 
-        if best is None or best[1] > 1.2:
-            # Wenn kein Tier in der Nähe (Schwelle 1.2 Zellen), Tooltip ausblenden.
+    def on_motion(self, ev):
+        # Mausbewegung: im Hover-Modus Infobox zum Tier unter dem Zeiger zeigen.
+        if not self.hover_var.get():
+            return
+        t = self.renderer.treffer(self.world, ev.x, ev.y)
+        if t is None:
             self.hide_tooltip()
             return
+        if t is not self.tooltip_tier:
+            self.tooltip_tier = t
+            self._tooltip_nachfuehren()
+            # Nur beim Wechsel des Tiers: bei jeder Mausbewegung übers selbe Tier passiert nichts.
+
+    def hover_umschalten(self):
+        if not self.hover_var.get():
+            self.hide_tooltip()
 
-        t = best[0]
-        txt = f"{t.name} ({t.nahrung.value})\nEnergie: {t.energie}"
+    @staticmethod
+    def _tooltip_text(t: Tier) -> str:
+        return f"{t.name} ({t.nahrung.value})\nEnergie: {t.energie}"
         # Text für Tooltip mit Name, Ernährungsart (value aus Enum) und Energie.
-        self.show_tooltip(ev.x, ev.y, txt)
+
+    def _tooltip_nachfuehren(self):
+        # Hover-Tooltip an Position und Energie "seines" Tiers anpassen (oder ausblenden, wenn es weg ist).
+        t = self.tooltip_tier
+        if t is None:
+            return
+        if t not in self.world.tiere:
+            self.hide_tooltip()
+            return
+        px, py = self.grid_to_px(t.x, t.y)
+        self._tooltip_setzen(px + TREFFER_PX, py + TREFFER_PX, self._tooltip_text(t))
+        # Leicht versetzt, damit die Box das Tier nicht verdeckt.
 
     def show_tooltip(self, px: int, py: int, text: str, ttl_ms: int = 1500):
-        # Zeichnet eine kleine Info-Box (Text + Hintergrund-Rechteck) am Klickpunkt.
-        self.hide_tooltip()
-        # Evtl. alten Tooltip entfernen.
+        # Zeigt eine kleine Info-Box (Text + Hintergrund-Rechteck) am Klickpunkt, für ttl_ms Millisekunden.
+        self.tooltip_tier = None
+        # Ein Klick-Tooltip hängt an keinem Tier (wird nicht nachgeführt).
+        self._tooltip_setzen(px, py, text)
+        if self._tooltip_timer is not None:
+            self.canvas.after_cancel(self._tooltip_timer)
+            # Den Timer eines älteren Tooltips abbrechen, sonst verschwindet der neue zu früh.
+        self._tooltip_timer = self.canvas.after(ttl_ms, self.hide_tooltip)
+        # Tooltip nach ttl_ms Millisekunden automatisch wieder entfernen.
 
+    def _tooltip_setzen(self, px: int, py: int, text: str):
+        # Tooltip anlegen oder – wenn schon sichtbar – nur Text und Position ändern.
         pad = 6
         # Innenabstand (Padding) im Tooltip.
 
-        # Text
-        tid = self.canvas.create_text(px, py, text=text, anchor="nw", fill=TOOLTIP_FG, font=("Segoe UI", 10), tags=("dyn",))
-        # create_text gibt eine Canvas-ID zurück (hier in "tid").
-
-        bbox = self.canvas.bbox(tid)
-        # Bounding Box (x0,y0,x1,y1) des soeben gezeichneten Textes abfragen.
+        if self.tooltip_id is None:
+            # Text
+            tid = self.canvas.create_text(px, py, text=text, anchor="nw", fill=TOOLTIP_FG, font=("Segoe UI", 10), tags=("tooltip",))
+            # create_text gibt eine Canvas-ID zurück (hier in "tid").
 
-        if bbox is None:
-            # Sicherheitsabfrage: sollte hier nicht passieren.
-            return
+            # Hintergrund (Größe wird unten an den Text angepasst)
+            rect = self.canvas.create_rectangle(px, py, px, py, fill=TOOLTIP_BG, outline="#D5C48C", tags=("tooltip",))
 
-        x0, y0, x1, y1 = bbox
-        # Koordinaten der Box entpacken.
+            # Z-Reihenfolge: Rechteck hinter Text
+            self.canvas.tag_lower(rect, tid)
+            # Schiebt das Rechteck hinter den Text (damit Text sichtbar bleibt).
 
-        # Hintergrund
-        rect = self.canvas.create_rectangle(x0 - pad, y0 - pad, x1 + pad, y1 + pad, fill=TOOLTIP_BG, outline="#D5C48C", tags=("dyn",))
-        # Rechteck hinter den Text zeichnen (leicht größer für Rand).
-
-        # Z-Reihenfolge: Rechteck hinter Text
-        self.canvas.tag_lower(rect, tid)
-        # Schiebt das Rechteck hinter den Text (damit Text sichtbar bleibt).
+            # Merken, damit wir es nach vorne holen/ändern/entfernen können
+            self.tooltip_id = rect
+            self._tooltip_text_id = tid
+        else:
+            self.canvas.itemconfigure(self._tooltip_text_id, text=text)
+            self.canvas.coords(self._tooltip_text_id, px, py)
+            # Vorhandene Elemente nur ändern: kein Löschen/Neuanlegen, kein Neuzeichnen der Szene.
 
-        # Merken, damit wir es nach vorne holen/entfernen können
-        self.tooltip_id = rect
-        # Speichern die ID des Rechtecks (Tooltip besteht grafisch aus Rechteck+Text).
+        bbox = self.canvas.bbox(self._tooltip_text_id)
+        # Bounding Box (x0,y0,x1,y1) des Textes abfragen.
 
-        self.canvas.after(ttl_ms, self.hide_tooltip)
-        # Tooltip nach ttl_ms Millisekunden automatisch wieder entfernen.
+        if bbox is not None:
+            x0, y0, x1, y1 = bbox
+            self.canvas.coords(self.tooltip_id, x0 - pad, y0 - pad, x1 + pad, y1 + pad)
+            # Rechteck um den Text legen (leicht größer für Rand).
+        self.canvas.tag_raise("tooltip")
+        self.canvas.tag_lower(self.tooltip_id, self._tooltip_text_id)
 
     def hide_tooltip(self):
-        # Entfernt den Tooltip, indem wir den Merker löschen und neu rendern.
+        # Entfernt den Tooltip (Rechteck + Text tragen beide das Tag "tooltip").
+        self.tooltip_tier = None
         if self.tooltip_id is not None:
-            # Lösche alle "dyn" Elemente reicht nicht; nur Tooltipelemente entfernen:
-            # Wir löschen einfach und zeichnen frame neu.
+            self.canvas.delete("tooltip")
+            # Nur die Tooltip-Elemente löschen; Pflanzen und Tiere bleiben unberührt stehen.
             self.tooltip_id = None
-            self.render()
+            self._tooltip_text_id = None
 
 def main():
     # Haupteinstiegspunkt, wenn die Datei direkt ausgeführt wird.
+    if tk is None:
+        raise SystemExit("tkinter ist nicht installiert – ohne GUI bitte batchlauf.py verwenden.")
+
     root = tk.Tk()
     # Erzeuge das Tkinter-Hauptfenster.
 
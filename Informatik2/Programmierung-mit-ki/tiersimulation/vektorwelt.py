@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+Vektorisierte Welt ("Structure of Arrays") für die Tiersimulation.
+
+Statt eines Python-Objekts pro Tier speichert VektorWelt alle Tiere spaltenweise in
+NumPy-Arrays (x, y, energie, schrittweite, ...). Ein Tick bearbeitet dann alle Tiere
+gleichzeitig mit Array-Operationen, statt jedes Tier einzeln durch _gehe_in_richtung
+zu schicken.
+
+Die Arten aus tiersimulationV3.py (Loewe, Tiger, Nilpferd, ...) bleiben die Definition:
+Aus einem Tier-Objekt werden Ernährungsart, Schrittweite, Sichtweite, Emoji und der
+Energiegewinn beim Fressen ausgelesen und in die Arrays übernommen.
+
+Pro Tick (vereinfachtes Modell, keine gezielte Futtersuche und keine Jagd):
+    - Pflanzenfresser auf einer Pflanzen-Zelle fressen diese,
+    - Tiere unter ihrer Energieschwelle (MUEDE_PFLANZENFRESSER bzw. MUEDE_FLEISCHFRESSER) schlafen,
+    - alle anderen wandern zufällig, prallen an den Grenzen ab und verbrauchen Energie,
+    - mit einer kleinen Chance wächst eine Pflanze nach.
+
+Die Zufallszahlen eines Ticks (Winkel, Nachwachsen) kommen aus einem Zufallsstrom
+(zufallsstrom.py): Der Winkel von Tier i in Tick t hängt nur von (samen, t, i) ab, nicht davon,
+wie viele andere Tiere gerade laufen. Nur der Aufbau (Startpositionen, Pflanzen) nutzt self.rng.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from tiersimulationV3 import (ERHOLUNG_PRO_STUNDE, MUEDE_FLEISCHFRESSER, MUEDE_PFLANZENFRESSER, Nahrung,
+                              Tier, Welt)
+from zufallsstrom import Zufallsstrom
+
+
+class Art:
+    """Konstanten einer Tierart, ausgelesen aus einer Tier-Unterklasse."""
+
+    def __init__(self, vorlage: Tier):
+        self.klasse = type(vorlage)
+        self.name = self.klasse.__name__
+        self.nahrung = vorlage.nahrung
+        self.emoji = vorlage.emoji
+        self.schrittweite = vorlage.schrittweite
+        self.sichtweite = vorlage.sichtweite
+        self.fressgewinn = self.klasse.fressgewinn
+
+
+def bewegen(x, y, winkel, schritt, breite, hoehe):
+    """
+    Ein Schritt der Länge "schritt" in Richtung "winkel" mit Abprall an den Weltgrenzen.
+    Arbeitet elementweise; alle Argumente dürfen Arrays beliebiger (passender) Form sein.
+    Gibt (neues_x, neues_y, abgeprallt) zurück – dieselbe Rechnung wie Tier._gehe_in_richtung.
+    """
+    nx = x + np.cos(winkel) * schritt
+    ny = y + np.sin(winkel) * schritt
+    rand_x = breite - 1
+    rand_y = hoehe - 1
+
+    abgeprallt = (nx < 0) | (ny < 0) | (nx > rand_x) | (ny > rand_y)
+    nx = np.where(nx < 0, -nx, nx)
+    ny = np.where(ny < 0, -ny, ny)
+    nx = np.where(nx > rand_x, rand_x - (nx - rand_x), nx)
+    ny = np.where(ny > rand_y, rand_y - (ny - rand_y), ny)
+    # Spiegeln an den Rändern, danach wie im Original noch einmal hart begrenzen.
+    return np.clip(nx, 0, rand_x), np.clip(ny, 0, rand_y), abgeprallt
+
+
+def verbrauch(schritt):
+    """Energieverbrauch für eine Bewegung der Länge "schritt" (wie Tier.bewegen)."""
+    return np.maximum(1, (schritt // 2).astype(np.int32))
+
+
+class VektorWelt:
+    """
+    Alternative Welt-Implementierung mit NumPy-Arrays.
+
+    Spalten pro Tier: x, y, energie, schrittweite, sichtweite, pflanzenfresser, art.
+    Pflanzen: boolesches Raster pflanzen[y, x].
+    """
+
+    def __init__(self, breite: int, hoehe: int, samen: int | None = 7):
+        self.breite = breite
+        self.hoehe = hoehe
+        self.rng = np.random.default_rng(samen)
+        self.strom = Zufallsstrom(samen)
+        # rng für den Aufbau, strom für die Ticks (Zufallszahl = Funktion von Tick und Tiernummer).
+        self.pflanzen = np.zeros((hoehe, breite), dtype=bool)
+
+        self.arten: list[Art] = []
+        self._art_nr: dict[type, int] = {}
+        self.namen: list[str] = []
+
+        self.x = np.empty(0, dtype=np.float64)
+        self.y = np.empty(0, dtype=np.float64)
+        self.energie = np.empty(0, dtype=np.int32)
+        self.schrittweite = np.empty(0, dtype=np.float64)
+        self.sichtweite = np.empty(0, dtype=np.float64)
+        self.pflanzenfresser = np.empty(0, dtype=bool)
+        self.art = np.empty(0, dtype=np.int16)
+
+        self.ticks = 0
+
+    @classmethod
+    def aus_welt(cls, welt: Welt, samen: int | None = 7) -> VektorWelt:
+        # Bestehende objektbasierte Welt in die Array-Darstellung übernehmen.
+        vw = cls(welt.breite, welt.hoehe, samen)
+        vw.pflanzen[:] = welt.pflanzen.als_array() != 0
+        for t in welt.tiere:
+            vw.add_tier(t, t.x, t.y)
+            vw.energie[-1] = t.energie
+        return vw
+
+    # -------- Aufbau --------
+
+    def _art_index(self, tier: Tier) -> int:
+        klasse = type(tier)
+        if klasse not in self._art_nr:
+            self._art_nr[klasse] = len(self.arten)
+            self.arten.append(Art(tier))
+        return self._art_nr[klasse]
+
+    def add_pflanzen_random(self, anzahl: int) -> None:
+        self.pflanzen[self.rng.integers(0, self.hoehe, anzahl), self.rng.integers(0, self.breite, anzahl)] = True
+
+    def add_tier(self, tier: Tier, x: float | None = None, y: float | None = None) -> None:
+        # Ein einzelnes Tier übernehmen; Position zufällig, falls nicht angegeben.
+        self.add_tiere(type(tier), 1, namen=[tier.name],
+                       x=None if x is None else [x], y=None if y is None else [y])
+
+    def add_tiere(self, klasse: type[Tier], anzahl: int, *, namen: list[str] | None = None,
+                  x=None, y=None) -> None:
+        # "anzahl" Tiere einer Art auf einmal anhängen (ein Array-Anhängen statt vieler).
+        nr = self._art_index(klasse("vorlage"))
+        art = self.arten[nr]
+        if namen is None:
+            start = len(self.namen)
+            namen = [f"{art.name}{start + i}" for i in range(anzahl)]
+        self.namen.extend(namen)
+
+        if x is None:
+            x = self.rng.uniform(0, self.breite - 1, anzahl)
+        if y is None:
+            y = self.rng.uniform(0, self.hoehe - 1, anzahl)
+
+        self.x = np.concatenate([self.x, np.asarray(x, dtype=np.float64)])
+        self.y = np.concatenate([self.y, np.asarray(y, dtype=np.float64)])
+        self.energie = np.concatenate([self.energie, np.full(anzahl, 100, dtype=np.int32)])
+        self.schrittweite = np.concatenate([self.schrittweite, np.full(anzahl, art.schrittweite)])
+        self.sichtweite = np.concatenate([self.sichtweite, np.full(anzahl, art.sichtweite)])
+        self.pflanzenfresser = np.concatenate(
+            [self.pflanzenfresser, np.full(anzahl, art.nahrung == Nahrung.PFLANZENFRESSER)]
+        )
+        self.art = np.concatenate([self.art, np.full(anzahl, nr, dtype=np.int16)])
+
+    # -------- Simulation --------
+
+    def tick(self, chance_nachwachsen: float = 0.06) -> None:
+        n = len(self.x)
+        aktiv = self.energie > 0
+        # Erschöpfte Tiere handeln nicht (wie Tier.tick).
+
+        # 1) Fressen: Pflanzenfresser auf einer Pflanzen-Zelle.
+        zx = np.rint(self.x).astype(np.intp)
+        zy = np.rint(self.y).astype(np.intp)
+        auf_pflanze = aktiv & self.pflanzenfresser & self.pflanzen[zy, zx]
+        fresser = np.flatnonzero(auf_pflanze)
+        if len(fresser):
+            # Stehen mehrere Tiere auf derselben Zelle, bekommt nur das erste (kleinster Index) die Pflanze.
+            zellen = zy[fresser] * self.breite + zx[fresser]
+            _, erste = np.unique(zellen, return_index=True)
+            fresser = fresser[erste]
+            gewinn = np.array([a.fressgewinn for a in self.arten], dtype=np.int32)[self.art[fresser]]
+            self.energie[fresser] = np.minimum(100, self.energie[fresser] + gewinn)
+            self.pflanzen[zy[fresser], zx[fresser]] = False
+        hat_gefressen = np.zeros(n, dtype=bool)
+        hat_gefressen[fresser] = True
+
+        # 2) Schlafen: unter der Energieschwelle ausruhen statt laufen.
+        schwelle = np.where(self.pflanzenfresser, MUEDE_PFLANZENFRESSER, MUEDE_FLEISCHFRESSER)
+        schlaeft = aktiv & ~hat_gefressen & (self.energie < schwelle)
+        self.energie[schlaeft] = np.minimum(100, self.energie[schlaeft] + ERHOLUNG_PRO_STUNDE)
+
+        # 3) Wandern: alle übrigen aktiven Tiere gehen einen Schritt in eine zufällige Richtung.
+        laeuft = np.flatnonzero(aktiv & ~hat_gefressen & ~schlaeft)
+        winkel = self.strom.winkel_viele(self.ticks, laeuft)
+        schritt = self.schrittweite[laeuft]
+        self.x[laeuft], self.y[laeuft], _ = bewegen(
+            self.x[laeuft], self.y[laeuft], winkel, schritt, self.breite, self.hoehe
+        )
+        self.energie[laeuft] = np.maximum(0, self.energie[laeuft] - verbrauch(schritt))
+
+        # 4) Nachwachsen wie Welt.regrow_pflanzen: mit kleiner Chance eine neue Pflanze.
+        zelle = self.strom.nachwuchs(self.ticks, chance_nachwachsen, self.breite, self.hoehe)
+        if zelle is not None:
+            self.pflanzen[zelle[1], zelle[0]] = True
+
+        self.ticks += 1
+
+    # -------- Auswertung --------
+
+    def zaehlen(self) -> dict[str, int]:
+        # Anzahl Tiere pro Art.
+        anzahl = np.bincount(self.art, minlength=len(self.arten))
+        return {a.name: int(k) for a, k in zip(self.arten, anzahl)}
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Zählerbasierte Zufallszahlen ("counter-based RNG") für die Tiersimulation.
+
+Ein gewöhnlicher Generator (random.Random, np.random.Generator) liefert Zahlen der Reihe nach:
+Welche Zahl ein Tier bekommt, hängt davon ab, wie viele vorher schon gezogen wurden – also von
+der Reihenfolge der Tiere, der Aufteilung in Kacheln, der Anzahl Prozesse. Hier dagegen ist jede
+Zufallszahl eine feste Funktion von (Samen, Tick, Tier-id, Strom):
+
+    Zahl = Philox4x32-10(Zähler = (id & 0xffffffff, id >> 32, tick, strom), Schlüssel = Samen)
+
+Philox (Salmon et al., "Parallel Random Numbers: As Easy as 1, 2, 3", 2011; auch in Random123)
+mischt den Zähler in 10 Runden mit Multiplikationen und dem Schlüssel zu 4 zufälligen 32-Bit-Wörtern.
+Jedes Tier kann seine Zahlen so unabhängig von allen anderen und in beliebiger Reihenfolge
+berechnen – einzeln (reines Python) oder für viele Tiere auf einmal (NumPy), mit bitgleichem Ergebnis.
+
+Ströme trennen die Verwendungszwecke: Der Winkel beim Wandern und das Nachwachsen im selben Tick
+greifen nie auf dieselben Zahlen zu.
+
+Beispiel:
+    strom = Zufallsstrom(7)
+    strom.winkel(tick=3, tier_id=42)                 # eine Zahl (float)
+    strom.winkel_viele(3, np.arange(1000))           # dieselben Zahlen für 1000 Tiere (Array)
+"""
+
+from __future__ import annotations
+
+import math
+import secrets
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+    # Die Einzelberechnung (winkel, nachwuchs) kommt ohne NumPy aus, z. B. für tiersimulationV3.Welt.
+
+STROM_WANDERN = 1
+STROM_NACHWUCHS = 2
+# Nummer des Stroms (4. Zählerwort) pro Verwendungszweck.
+
+_M0, _M1 = 0xD2511F53, 0xCD9E8D57
+# Multiplikatoren der Philox-Runde.
+_W0, _W1 = 0x9E3779B9, 0xBB67AE85
+# Weyl-Konstanten: Um so viel wächst der Rundenschlüssel von Runde zu Runde.
+_RUNDEN = 10
+_MASKE = 0xFFFFFFFF
+
+
+def philox_skalar(zaehler: tuple[int, int, int, int], schluessel: tuple[int, int]) -> tuple[int, int, int, int]:
+    """Philox4x32-10 für einen einzelnen Zähler (reines Python): 4 Wörter zu je 32 Bit."""
+    c0, c1, c2, c3 = (w & _MASKE for w in zaehler)
+    k0, k1 = (w & _MASKE for w in schluessel)
+    for runde in range(_RUNDEN):
+        if runde:
+            k0 = (k0 + _W0) & _MASKE
+            k1 = (k1 + _W1) & _MASKE
+        p0 = _M0 * c0
+        p1 = _M1 * c2
+        c0, c1, c2, c3 = ((p1 >> 32) ^ c1 ^ k0, p1 & _MASKE, (p0 >> 32) ^ c3 ^ k1, p0 & _MASKE)
+    return c0, c1, c2, c3
+
+
+def philox(zaehler: tuple, schluessel: tuple):
+    """
+    Philox4x32-10 elementweise für ganze Arrays (braucht NumPy). Zähler- und Schlüsselwörter
+    dürfen Zahlen oder Arrays sein, die sich gegenseitig "broadcasten" lassen (z. B. Schlüssel
+    pro Welt [K, 1] und Zähler pro Tier [N]). Liefert 4 Arrays (uint64 mit Werten < 2**32).
+    """
+    if np is None:
+        raise RuntimeError("philox für Arrays braucht NumPy.")
+    maske = np.uint64(_MASKE)
+    c0, c1, c2, c3 = (np.asarray(w, dtype=np.uint64) & maske for w in zaehler)
+    k0, k1 = (np.asarray(w, dtype=np.uint64) & maske for w in schluessel)
+    for runde in range(_RUNDEN):
+        if runde:
+            k0 = (k0 + np.uint64(_W0)) & maske
+            k1 = (k1 + np.uint64(_W1)) & maske
+        p0 = np.uint64(_M0) * c0
+        p1 = np.uint64(_M1) * c2
+        # Beide Faktoren < 2**32: das Produkt passt genau in 64 Bit (oberes und unteres Wort).
+        c0, c1, c2, c3 = ((p1 >> np.uint64(32)) ^ c1 ^ k0, p1 & maske,
+                          (p0 >> np.uint64(32)) ^ c3 ^ k1, p0 & maske)
+    return c0, c1, c2, c3
+
+
+def _gleich_skalar(a: int, b: int) -> float:
+    # Zwei 32-Bit-Wörter -> Gleitkommazahl in [0, 1) mit 53 Bit (wie random.random()).
+    return ((a >> 5) * 67108864 + (b >> 6)) * (1.0 / 9007199254740992.0)
+
+
+def _gleich(a, b):
+    # Wie _gleich_skalar, für Arrays (bitgleich).
+    return ((a >> np.uint64(5)) * np.uint64(67108864) + (b >> np.uint64(6))) * (1.0 / 9007199254740992.0)
+
+
+def _bereich_skalar(wort: int, n: int) -> int:
+    # 32-Bit-Wort -> ganze Zahl in 0..n-1 (Multiplizieren und Schieben statt Modulo).
+    return (wort * n) >> 32
+
+
+class Zufallsstrom:
+    """
+    Zufallszahlen als Funktion von (Samen, Tick, id, Strom).
+    "samen" ist eine ganze Zahl (die unteren 64 Bit bilden den Schlüssel), None (zufälliger
+    Schlüssel) oder – nur für die Array-Methoden – ein Array von Samen, z. B. einer pro Welt.
+    """
+
+    def __init__(self, samen=None):
+        if samen is None:
+            samen = secrets.randbits(64)
+        elif np is not None and isinstance(samen, np.integer):
+            samen = int(samen)
+        self.samen = samen
+        if np is not None and not isinstance(samen, int):
+            samen = np.asarray(samen).astype(np.uint64)
+            # Negative Samen werden dabei wie bei den ganzen Zahlen auf 64 Bit umgebrochen.
+            self.schluessel = (samen & np.uint64(_MASKE), samen >> np.uint64(32))
+        else:
+            self.schluessel = (samen & _MASKE, (samen >> 32) & _MASKE)
+
+    # -------- einzeln (reines Python) --------
+
+    def _woerter(self, tick: int, tier_id: int, strom: int) -> tuple[int, int, int, int]:
+        return philox_skalar((tier_id & _MASKE, tier_id >> 32, tick, strom), self.schluessel)
+
+    def winkel(self, tick: int, tier_id: int) -> float:
+        # Richtung (0 .. 2π) für das Wandern von Tier "tier_id" in Tick "tick".
+        a, b, _, _ = self._woerter(tick, tier_id, STROM_WANDERN)
+        return 2 * math.pi * _gleich_skalar(a, b)
+
+    def nachwuchs(self, tick: int, chance: float, breite: int, hoehe: int) -> tuple[int, int] | None:
+        # Wächst in diesem Tick eine Pflanze nach? Dann ihre Zelle (x, y), sonst None.
+        a, b, c, d = self._woerter(tick, 0, STROM_NACHWUCHS)
+        if _gleich_skalar(a, b) >= chance:
+            return None
+        return _bereich_skalar(d, breite), _bereich_skalar(c, hoehe)
+
+    # -------- viele auf einmal (NumPy) --------
+
+    def _woerter_viele(self, tick, ids, strom: int):
+        ids = np.asarray(ids, dtype=np.uint64)
+        return philox((ids & np.uint64(_MASKE), ids >> np.uint64(32), tick, strom), self.schluessel)
+
+    def winkel_viele(self, tick: int, ids):
+        # Wie winkel() für viele Tiere (und ggf. viele Samen) auf einmal.
+        a, b, _, _ = self._woerter_viele(tick, ids, STROM_WANDERN)
+        return (2 * np.pi) * _gleich(a, b)
+
+    def nachwuchs_viele(self, tick: int, chance: float, breite: int, hoehe: int):
+        # Wie nachwuchs() für jeden Samen eines Samen-Arrays: (wächst?, x, y) als Arrays.
+        a, b, c, d = self._woerter_viele(tick, 0, STROM_NACHWUCHS)
+        waechst = _gleich(a, b) < chance
+        x = ((d * np.uint64(breite)) >> np.uint64(32)).astype(np.intp)
+        y = ((c * np.uint64(hoehe)) >> np.uint64(32)).astype(np.intp)
+        return waechst, x, y